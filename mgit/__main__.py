@@ -338,6 +338,12 @@ def main_options(
     """
     Multi-Git CLI Tool - Manage repos across multiple git platforms easily.
     """
+    # Opt-in faster event loop for the asyncio.run() calls made by commands
+    if os.environ.get("MGIT_FAST_EVENT_LOOP"):
+        from mgit.utils.async_executor import install_fast_event_loop
+
+        install_fast_event_loop()
+
     # Handle --help flag or no subcommand (show animated help)
     if help_flag or ctx.invoked_subcommand is None:
         import io
@@ -981,11 +987,13 @@ def diff_command(
         "-r",
         help="Recursively scan directories for repositories.",
     ),
-    concurrency: int = typer.Option(
-        5,
+    concurrency: Optional[int] = typer.Option(
+        None,
         "--concurrency",
+        "--max-concurrent",
         "-c",
-        help="Number of concurrent repository operations.",
+        help="Number of concurrent repository operations "
+        "(default: 2x CPU count, capped at 32).",
         min=1,
         max=50,
     ),
@@ -1042,6 +1050,18 @@ def diff_command(
         "--merge-discovered/--no-merge-discovered",
         help="Merge discovered repositories with local scan results.",
     ),
+    fast_clean: bool = typer.Option(
+        False,
+        "--fast-clean",
+        help="Skip git status for repositories whose HEAD and index are "
+        "unchanged since they were last seen clean (may miss unstaged edits).",
+    ),
+    embedding_cache: bool = typer.Option(
+        False,
+        "--embedding-cache",
+        help="With --embed-content, reuse embedded content of unchanged files "
+        "from ~/.cache/mgit/embeddings.sqlite (delete the file to clear it).",
+    ),
 ) -> None:
     """
     Detect changes in Git repositories and output structured change information.
@@ -1060,6 +1080,8 @@ def diff_command(
       mgit diff . --embed-content --content-strategy=sample
       mgit diff . --embed-content --content-memory-mb=50
       mgit diff . --discover-pattern "myorg/*/*" --merge-discovered
+      mgit diff ~/src --recursive --fast-clean
+      mgit diff ~/src --recursive --embed-content --embedding-cache
     """
     from mgit.commands.diff import execute_diff_command
 
@@ -1078,6 +1100,8 @@ def diff_command(
         discover_pattern,
         discover_provider,
         merge_discovered,
+        fast_clean,
+        embedding_cache,
     )
 
 
@@ -1128,11 +1152,13 @@ def diff_remote_command(
         "--include-remote-only/--local-only",
         help="Include repositories found remotely but not locally cloned.",
     ),
-    concurrency: int = typer.Option(
-        10,
+    concurrency: Optional[int] = typer.Option(
+        None,
         "--concurrency",
+        "--max-concurrent",
         "-c",
-        help="Number of concurrent repository operations.",
+        help="Number of concurrent repository operations "
+        "(default: 2x CPU count, capped at 32).",
         min=1,
         max=50,
     ),
@@ -66,7 +66,7 @@ def execute_diff_command(
     path: Path,
     output: Path | None,
     recursive: bool,
-    concurrency: int,
+    concurrency: int | None,
     verbose: bool,
     save_changeset: bool = False,
     changeset_name: str = "default",
@@ -77,6 +77,8 @@ def execute_diff_command(
     discover_pattern: str | None = None,
     discover_provider: str | None = None,
     merge_discovered: bool = False,
+    fast_clean: bool = False,
+    embedding_cache: bool = False,
 ) -> None:
     """
     Execute diff command with optional repository discovery integration.
@@ -85,7 +87,7 @@ def execute_diff_command(
         path: Path to repository or directory to scan
         output: Optional output file path
         recursive: Whether to scan recursively for repositories
-        concurrency: Number of concurrent operations
+        concurrency: Number of concurrent operations (None for auto)
         verbose: Whether to enable verbose output
         save_changeset: Whether to save changesets to persistent storage
         changeset_name: Name of changeset collection to use
@@ -96,6 +98,10 @@ def execute_diff_command(
         discover_pattern: Optional pattern for discovering additional repositories
         discover_provider: Provider to use for discovery
         merge_discovered: Whether to merge discovered repos with local scan
+        fast_clean: Whether to skip git status for repos unchanged since last
+            seen clean
+        embedding_cache: Whether to reuse embedded content of unchanged files
+            from the on-disk embedding cache
     """
     if verbose:
         logging.getLogger("mgit").setLevel(logging.DEBUG)
@@ -182,6 +188,8 @@ def execute_diff_command(
             embed_content=embed_content,
             content_strategy=content_strategy_enum,
             content_memory_mb=content_memory_mb,
+            fast_clean_check=fast_clean,
+            cache_embeddings=embedding_cache,
         )
 
         with Progress() as progress:
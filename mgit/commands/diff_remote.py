@@ -63,7 +63,7 @@ def execute_remote_diff_command(
     save_changeset: bool,
     changeset_name: str,
     include_remote_only: bool,
-    concurrency: int,
+    concurrency: int | None,
     limit: int | None,
     verbose: bool,
 ) -> None:
@@ -78,7 +78,7 @@ def execute_remote_diff_command(
         save_changeset: Whether to save results to changeset storage
         changeset_name: Name of changeset collection for storage
         include_remote_only: Include repositories found remotely but not locally
-        concurrency: Number of concurrent operations
+        concurrency: Number of concurrent operations (None for auto)
         limit: Maximum repositories to process
         verbose: Enable verbose output
     """
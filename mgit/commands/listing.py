@@ -5,6 +5,7 @@ Provides repository discovery across providers using query patterns.
 
 import asyncio
 import logging
+from dataclasses import replace
 
 from rich.console import Console
 from rich.progress import (
@@ -96,14 +97,16 @@ async def _process_single_provider(
         """Add a repository result if it has not already been discovered."""
         repo_key = (
             repo.clone_url,
-            repo.metadata.get("full_name"),
+            repo.meta.get("full_name"),
             f"{org_name}/{repo.name}",
         )
         if repo_key in seen_repositories:
             return False
 
         seen_repositories.add(repo_key)
-        repo.metadata["provider_config_name"] = provider_name
+        repo = replace(
+            repo, metadata={**repo.meta, "provider_config_name": provider_name}
+        )
         results.append(RepositoryResult(repo, org_name, project_name))
         return True
 
@@ -120,7 +123,7 @@ async def _process_single_provider(
             async for repo in accessible_repo_lister(filters={"visibility": "all"}):
                 org_name = repo.organization
                 if not org_name:
-                    full_name = repo.metadata.get("full_name")
+                    full_name = repo.meta.get("full_name")
                     if isinstance(full_name, str) and "/" in full_name:
                         org_name = full_name.split("/", 1)[0]
 
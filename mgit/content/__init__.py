@@ -15,6 +15,7 @@ from .content_strategies import (
     SummaryContentEmbedder,
 )
 from .embedding import ContentEmbeddingEngine, EmbeddingConfig
+from .embedding_cache import CachedEmbeddingEngine, EmbeddingCache
 from .mime_detector import ContentSafety, MimeDetector, MimeInfo
 
 __all__ = [
@@ -30,4 +31,6 @@ __all__ = [
     "FullContentEmbedder",
     "ContentEmbeddingEngine",
     "EmbeddingConfig",
+    "CachedEmbeddingEngine",
+    "EmbeddingCache",
 ]
@@ -44,6 +44,27 @@ class EmbeddedContent:
     error: str | None = None
     metadata: dict[str, Any] | None = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to a plain dict, equivalent to dataclasses.asdict().
+
+        Fields are copied directly instead of via asdict()'s recursive deep
+        copy; only the metadata dict is copied (shallowly) so callers can't
+        mutate a shared instance through the result.
+        """
+        return {
+            "strategy": self.strategy,
+            "content": self.content,
+            "content_hash": self.content_hash,
+            "size_bytes": self.size_bytes,
+            "mime_type": self.mime_type,
+            "charset": self.charset,
+            "is_truncated": self.is_truncated,
+            "line_count": self.line_count,
+            "error": self.error,
+            "metadata": dict(self.metadata) if self.metadata is not None else None,
+        }
+
 
 class ContentEmbedder(ABC):
     """Abstract base class for content embedding strategies."""
@@ -6,6 +6,7 @@ safety requirements, and resource constraints.
 """
 
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -77,10 +78,14 @@ class ContentEmbeddingEngine:
     safety requirements, and resource constraints.
     """
 
-    def __init__(self, config: EmbeddingConfig | None = None):
+    def __init__(
+        self,
+        config: EmbeddingConfig | None = None,
+        mime_detector: MimeDetector | None = None,
+    ):
         """Initialize content embedding engine."""
         self.config = config or EmbeddingConfig()
-        self.mime_detector = MimeDetector()
+        self.mime_detector = mime_detector or MimeDetector()
 
         # Initialize strategy implementations
         self.embedders: dict[ContentStrategy, ContentEmbedder] = {
@@ -90,8 +95,10 @@ class ContentEmbeddingEngine:
             ContentStrategy.FULL: FullContentEmbedder(),
         }
 
-        # Memory tracking
+        # Memory tracking; the lock makes the budget check and the update
+        # atomic when several threads embed on one engine
         self.current_memory_usage = 0
+        self._memory_lock = threading.Lock()
         self.max_memory_bytes = self.config.max_total_memory_mb * 1024 * 1024
 
         logger.debug(
@@ -123,19 +130,29 @@ class ContentEmbeddingEngine:
                 strategy = self._select_embedding_strategy(file_path, mime_info)
                 logger.debug(f"Selected strategy {strategy} for {file_path}")
 
-            # Check memory budget before embedding
-            if not self._check_memory_budget(mime_info, strategy):
-                logger.debug(
-                    f"Memory budget exceeded, falling back to SUMMARY for {file_path}"
-                )
-                strategy = ContentStrategy.SUMMARY
+            # Check memory budget before embedding, reserving the estimate so
+            # concurrent embeddings can't all pass the same check
+            with self._memory_lock:
+                if not self._check_memory_budget(mime_info, strategy):
+                    logger.debug(
+                        f"Memory budget exceeded, falling back to SUMMARY for {file_path}"
+                    )
+                    strategy = ContentStrategy.SUMMARY
+                reserved = self._estimate_memory_usage(mime_info, strategy)
+                self.current_memory_usage += reserved
 
             # Perform embedding
-            embedder = self.embedders[strategy]
-            result = embedder.embed_content(file_path, mime_info)
+            try:
+                result = self._embed_with_strategy(file_path, mime_info, strategy)
+            except Exception:
+                with self._memory_lock:
+                    self.current_memory_usage -= reserved
+                raise
 
-            # Update memory usage tracking
-            self._update_memory_usage(result)
+            # Replace the reservation with the actual memory usage
+            with self._memory_lock:
+                self.current_memory_usage -= reserved
+                self._update_memory_usage(result)
 
             logger.debug(
                 f"Embedded {file_path} using {strategy} strategy ({result.size_bytes} bytes)"
@@ -154,6 +171,29 @@ class ContentEmbeddingEngine:
                 error=str(e),
             )
 
+    def embed_files_batch(self, file_paths: list[Path]) -> dict[Path, EmbeddedContent]:
+        """
+        Embed content from several files in one pass.
+
+        Unlike embed_multiple_files, the memory budget is not reset, so a
+        batch shares the budget with earlier calls on this engine.
+
+        Args:
+            file_paths: Files to embed
+
+        Returns:
+            Mapping of each file path to its EmbeddedContent
+        """
+        return {
+            file_path: self.embed_file_content(file_path) for file_path in file_paths
+        }
+
+    def _embed_with_strategy(
+        self, file_path: Path, mime_info: MimeInfo, strategy: ContentStrategy
+    ) -> EmbeddedContent:
+        """Run the embedder for an already selected strategy."""
+        return self.embedders[strategy].embed_content(file_path, mime_info)
+
     def embed_multiple_files(
         self, file_paths: list[Path], batch_strategy: ContentStrategy | None = None
     ) -> list[EmbeddedContent]:
@@ -171,7 +211,7 @@ class ContentEmbeddingEngine:
         total_files = len(file_paths)
 
         # Reset memory usage for batch operation
-        self.current_memory_usage = 0
+        self.reset_memory_tracking()
 
         logger.info(f"Embedding content from {total_files} files")
 
@@ -220,7 +260,8 @@ class ContentEmbeddingEngine:
 
     def reset_memory_tracking(self) -> None:
         """Reset memory usage tracking."""
-        self.current_memory_usage = 0
+        with self._memory_lock:
+            self.current_memory_usage = 0
         logger.debug("Memory usage tracking reset")
 
     def _select_embedding_strategy(
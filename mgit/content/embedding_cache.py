@@ -0,0 +1,236 @@
+"""
+Persistent content-hash cache for embedded file content.
+
+Keeps embedding results in a small SQLite database keyed by the SHA-256 of
+the file bytes, so unchanged files are not re-read and re-embedded on every
+scan of the same worktree.
+
+The cache holds embedded file contents, so it is opt-in and capped: once it
+has more than ``max_entries`` entries the oldest ones are pruned. Deleting
+the database file (~/.cache/mgit/embeddings.sqlite by default) clears it.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from mgit.content.content_strategies import ContentStrategy, EmbeddedContent
+from mgit.content.embedding import ContentEmbeddingEngine, EmbeddingConfig
+from mgit.content.mime_detector import MimeDetector, MimeInfo
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever embedder output changes so stale cache entries are ignored
+ENGINE_VERSION = "1"
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "mgit" / "embeddings.sqlite"
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Outside of batches, prune after this many writes rather than on each one
+PRUNE_EVERY_WRITES = 100
+
+
+def compute_file_sha256(file_path: Path) -> str:
+    """Compute the SHA-256 of a file, streaming it in 1MB chunks."""
+    hasher = hashlib.sha256()
+    with file_path.open("rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed store of serialized EmbeddedContent keyed by content hash."""
+
+    def __init__(
+        self, db_path: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path: Location of the SQLite file.
+                     Defaults to ~/.cache/mgit/embeddings.sqlite
+            max_entries: Number of most recently stored entries to keep
+        """
+        self.db_path = db_path or DEFAULT_CACHE_PATH
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._defer_commit = False
+        self._writes_since_prune = 0
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL, "
+                "stored_at REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(embeddings)")
+            }
+            if "stored_at" not in columns:
+                # Databases from before pruning; their entries go first
+                self._conn.execute(
+                    "ALTER TABLE embeddings "
+                    "ADD COLUMN stored_at REAL NOT NULL DEFAULT 0"
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS embeddings_stored_at "
+                "ON embeddings (stored_at)"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            # The cache is an optimization; run uncached rather than fail
+            logger.debug(f"Embedding cache disabled ({self.db_path}): {e}")
+            self._conn = None
+
+    @staticmethod
+    def make_key(file_hash: str, strategy: ContentStrategy, file_name: str) -> str:
+        """
+        Build the cache key for a file.
+
+        The file name is part of the key because summaries include it.
+        """
+        return f"{file_hash}:{strategy.value}:{ENGINE_VERSION}:{file_name}"
+
+    def get(self, key: str) -> EmbeddedContent | None:
+        """Return the cached embedding for key, or None on a miss."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT content FROM embeddings WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            data = json.loads(row[0])
+            data["strategy"] = ContentStrategy(data["strategy"])
+            return EmbeddedContent(**data)
+        except (sqlite3.Error, ValueError, TypeError, KeyError) as e:
+            logger.debug(f"Embedding cache read failed for {key}: {e}")
+            return None
+
+    def put(self, key: str, content: EmbeddedContent) -> None:
+        """Store an embedding under key, replacing any previous entry."""
+        if self._conn is None:
+            return
+        try:
+            data = content.to_dict()
+            data["strategy"] = content.strategy.value
+            payload = json.dumps(data)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO embeddings (key, content, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, payload, time.time()),
+                )
+                self._writes_since_prune += 1
+                if not self._defer_commit:
+                    if self._writes_since_prune >= PRUNE_EVERY_WRITES:
+                        self._prune()
+                    self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.debug(f"Embedding cache write failed for {key}: {e}")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group writes made inside the block into a single commit."""
+        if self._defer_commit:
+            yield
+            return
+
+        self._defer_commit = True
+        try:
+            yield
+        finally:
+            self._defer_commit = False
+            if self._conn is not None:
+                try:
+                    with self._lock:
+                        self._prune()
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Embedding cache commit failed: {e}")
+
+    def _prune(self) -> None:
+        """Drop all but the newest max_entries entries; caller holds the lock."""
+        if not self._writes_since_prune:
+            return
+        self._writes_since_prune = 0
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key NOT IN "
+            "(SELECT key FROM embeddings ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def close(self) -> None:
+        """Prune, commit and close the underlying database connection."""
+        if self._conn is not None:
+            with self._lock:
+                try:
+                    self._prune()
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Embedding cache prune failed: {e}")
+                self._conn.close()
+            self._conn = None
+
+
+class CachedEmbeddingEngine(ContentEmbeddingEngine):
+    """
+    Content embedding engine backed by a persistent content-hash cache.
+
+    Strategy selection and memory budgeting are unchanged; only the embedding
+    step itself is skipped when a file with the same bytes, name and strategy
+    was embedded before.
+    """
+
+    def __init__(
+        self,
+        config: EmbeddingConfig | None = None,
+        cache: EmbeddingCache | None = None,
+        mime_detector: MimeDetector | None = None,
+    ):
+        """Initialize cached embedding engine."""
+        super().__init__(config, mime_detector)
+        self.cache = cache or EmbeddingCache()
+
+    def embed_files_batch(self, file_paths: list[Path]) -> dict[Path, EmbeddedContent]:
+        """Embed several files, committing new cache entries once at the end."""
+        with self.cache.batch():
+            return super().embed_files_batch(file_paths)
+
+    def _embed_with_strategy(
+        self, file_path: Path, mime_info: MimeInfo, strategy: ContentStrategy
+    ) -> EmbeddedContent:
+        """Return a cached embedding when available, embedding on a miss."""
+        try:
+            key = self.cache.make_key(
+                compute_file_sha256(file_path), strategy, file_path.name
+            )
+        except OSError as e:
+            logger.debug(f"Could not hash {file_path} for embedding cache: {e}")
+            return super()._embed_with_strategy(file_path, mime_info, strategy)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"Embedding cache hit for {file_path}")
+            return cached
+
+        result = super()._embed_with_strategy(file_path, mime_info, strategy)
+        if result.error is None:
+            self.cache.put(key, result)
+        return result
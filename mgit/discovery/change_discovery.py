@@ -100,20 +100,23 @@ class ChangeDiscoveryEngine:
     to provide comprehensive view of repository states across multiple providers.
     """
 
-    def __init__(self, local_scan_root: Path | None = None, concurrency: int = 10):
+    def __init__(
+        self, local_scan_root: Path | None = None, concurrency: int | None = None
+    ):
         """
         Initialize change discovery engine.
 
         Args:
             local_scan_root: Root directory to scan for local repository clones
-            concurrency: Number of concurrent operations for change detection
+            concurrency: Number of concurrent operations for change detection;
+                None sizes it from the host CPU count
         """
         self.local_scan_root = local_scan_root
-        self.concurrency = concurrency
         # Use delayed import to avoid circular dependency
         from mgit.processing import DiffProcessor
 
         self.diff_processor = DiffProcessor(concurrency=concurrency)
+        self.concurrency = self.diff_processor.concurrency
 
     async def discover_repository_changes(
         self,
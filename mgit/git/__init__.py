@@ -2,6 +2,7 @@
 
 from mgit.git.manager import GitManager, sanitize_url
 from mgit.git.utils import (
+    NulRecordSplitter,
     build_repo_path,
     classify_dirty_repo,
     embed_pat_in_url,
@@ -16,6 +17,7 @@ from mgit.git.utils import (
 
 __all__ = [
     "GitManager",
+    "NulRecordSplitter",
     "build_repo_path",
     "classify_dirty_repo",
     "embed_pat_in_url",
@@ -0,0 +1,152 @@
+"""
+Persistent fingerprints of repositories last seen clean.
+
+A fingerprint is built from a handful of stat() calls on the repository's
+git metadata, so a repository whose HEAD, index and top-level directory are
+unchanged since it was last reported clean can skip a full ``git status``.
+
+The check is a heuristic: an edit to an already-tracked file that does not
+touch the index or the top-level directory is not visible to it. It is
+therefore opt-in.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FINGERPRINT_PATH = Path.home() / ".cache" / "mgit" / "clean_fingerprints.json"
+
+
+def _resolve_head_sha(git_dir: Path) -> str | None:
+    """Return the commit HEAD points to, reading loose and packed refs."""
+    head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    if not head.startswith("ref: "):
+        return head or None
+
+    ref = head[len("ref: ") :]
+    try:
+        return (git_dir / ref).read_text(encoding="utf-8").strip() or None
+    except FileNotFoundError:
+        pass
+
+    try:
+        packed = (git_dir / "packed-refs").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    for line in packed.splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def repo_fingerprint(repo_path: Path) -> list[Any] | None:
+    """
+    Build the clean-check fingerprint for a repository.
+
+    Args:
+        repo_path: Path to the repository working tree
+
+    Returns:
+        ``[HEAD sha, index mtime_ns, index size, worktree mtime_ns]``, or None
+        if the repository layout isn't supported (e.g. ``.git`` is a file, as
+        in worktrees and submodules) or can't be read
+    """
+    git_dir = repo_path / ".git"
+    try:
+        if not git_dir.is_dir():
+            return None
+        head_sha = _resolve_head_sha(git_dir)
+        if head_sha is None:
+            return None
+        index_stat = (git_dir / "index").stat()
+        worktree_stat = repo_path.stat()
+    except OSError:
+        return None
+    return [
+        head_sha,
+        index_stat.st_mtime_ns,
+        index_stat.st_size,
+        worktree_stat.st_mtime_ns,
+    ]
+
+
+class CleanFingerprintCache:
+    """JSON-backed map of repository path -> last clean fingerprint and data."""
+
+    def __init__(self, cache_path: Path | None = None):
+        """
+        Initialize the cache; the file is read on first use.
+
+        Args:
+            cache_path: Location of the JSON file.
+                        Defaults to ~/.cache/mgit/clean_fingerprints.json
+        """
+        self.cache_path = cache_path or DEFAULT_FINGERPRINT_PATH
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with self.cache_path.open(encoding="utf-8") as f:
+                    data = json.load(f)
+                self._entries = data if isinstance(data, dict) else {}
+            except (OSError, ValueError) as e:
+                if not isinstance(e, FileNotFoundError):
+                    logger.debug(f"Ignoring unreadable {self.cache_path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, repo_path: Path, fingerprint: list[Any]) -> dict[str, Any] | None:
+        """
+        Return the data stored for a repository if its fingerprint matches.
+
+        Args:
+            repo_path: Path to the repository
+            fingerprint: Current fingerprint from repo_fingerprint()
+
+        Returns:
+            The data stored by put(), or None on a miss
+        """
+        with self._lock:
+            entry = self._load().get(str(repo_path))
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        return entry.get("data")
+
+    def put(
+        self, repo_path: Path, fingerprint: list[Any], data: dict[str, Any]
+    ) -> None:
+        """Record a repository as clean at the given fingerprint."""
+        with self._lock:
+            self._load()[str(repo_path)] = {"fingerprint": fingerprint, "data": data}
+            self._dirty = True
+
+    def discard(self, repo_path: Path) -> None:
+        """Forget a repository, e.g. because it is no longer clean."""
+        with self._lock:
+            if self._load().pop(str(repo_path), None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write pending changes to disk atomically; failures are logged only."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            temp_path = self.cache_path.with_suffix(".tmp")
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with temp_path.open("w", encoding="utf-8") as f:
+                    json.dump(self._entries, f)
+                os.replace(temp_path, self.cache_path)
+                self._dirty = False
+            except OSError as e:
+                # The cache is an optimization; never fail a scan over it
+                logger.debug(f"Could not save {self.cache_path}: {e}")
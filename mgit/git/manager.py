@@ -9,8 +9,13 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+from mgit.git.utils import NulRecordSplitter
+
 logger = logging.getLogger(__name__)
 
+# Bytes read from the git status pipe per iteration
+STATUS_READ_CHUNK_SIZE = 64 * 1024
+
 # Pattern to strip credentials from URLs in log messages
 _CRED_URL_RE = re.compile(r"(https?://)([^@]+)@")
 
@@ -31,6 +36,10 @@ def _sanitize_cmd_for_log(cmd: list[str]) -> str:
 class GitManager:
     GIT_EXECUTABLE = "git"
 
+    # Environment for read-only queries: never take optional locks (such as
+    # the index refresh lock) and skip locale handling in git's output
+    READ_ONLY_ENV = {"GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C"}
+
     # Fix type hint for dir_name
     async def git_clone(
         self, repo_url: str, output_dir: Path, dir_name: str | None = None
@@ -139,8 +148,15 @@ class GitManager:
             Current branch name or None if detached HEAD or error
         """
         try:
-            cmd = [self.GIT_EXECUTABLE, "branch", "--show-current"]
-            result = await self._run_subprocess(cmd, cwd=repo_dir, capture_output=True)
+            cmd = [
+                self.GIT_EXECUTABLE,
+                "--no-optional-locks",
+                "branch",
+                "--show-current",
+            ]
+            result = await self._run_subprocess(
+                cmd, cwd=repo_dir, capture_output=True, extra_env=self.READ_ONLY_ENV
+            )
 
             branch_name = result.stdout.strip()
             return branch_name if branch_name else None
@@ -168,9 +184,18 @@ class GitManager:
         try:
             # Use git log with custom format for structured output
             format_str = "--format=%H|%an|%ae|%ai|%s"
-            cmd = [self.GIT_EXECUTABLE, "log", f"-{limit}", format_str, "--no-merges"]
+            cmd = [
+                self.GIT_EXECUTABLE,
+                "--no-optional-locks",
+                "log",
+                f"-{limit}",
+                format_str,
+                "--no-merges",
+            ]
 
-            result = await self._run_subprocess(cmd, cwd=repo_dir, capture_output=True)
+            result = await self._run_subprocess(
+                cmd, cwd=repo_dir, capture_output=True, extra_env=self.READ_ONLY_ENV
+            )
 
             commits = []
             for line in result.stdout.strip().split("\n"):
@@ -196,40 +221,132 @@ class GitManager:
             logger.debug(f"Get recent commits failed in {repo_dir}: {e}")
             return []
 
-    async def diff_files(self, repo_dir: Path) -> dict[str, Any]:
+    async def diff_files(self, repo_dir: Path, timeout: int = 300) -> dict[str, Any]:
         """
         Get diff information for a repository including git status.
 
+        Status output is read from the pipe in STATUS_READ_CHUNK_SIZE chunks
+        and split into records as it arrives, rather than buffering the whole
+        dump and splitting it afterwards.
+
         Args:
             repo_dir: Path to the repository
+            timeout: Command timeout in seconds (default 300)
 
         Returns:
             Dictionary with diff information including:
             - has_changes: bool indicating if there are uncommitted changes
-            - status_output: raw git status --porcelain output
-            - diff_output: raw git diff output (optional)
+            - status_records: NUL-delimited git status --porcelain=v2 records,
+              excluding ``#`` header records
+            - current_branch: branch name from the status header, or None if
+              HEAD is detached
         """
+        # Machine-readable status: NUL-delimited records, no path quoting.
+        # Scans are read-only, so concurrent ones never contend for the index
+        # lock; the untracked cache (enabled for this invocation only, the
+        # repo config is left alone) is used wherever the index already has it.
+        status_cmd = [
+            self.GIT_EXECUTABLE,
+            "--no-optional-locks",
+            "-c",
+            "color.ui=never",
+            "-c",
+            "core.untrackedCache=true",
+            "status",
+            "--porcelain=v2",
+            "-z",
+            "--branch",
+            "--untracked-files=normal",
+        ]
+        status_records: list[str] = []
+        current_branch = None
+        # A rename record is followed by its original path, which may itself
+        # start with "#"; it must not be mistaken for a header
+        expect_orig_path = False
+
+        def consume(records: list[str]) -> None:
+            nonlocal current_branch, expect_orig_path
+            for record in records:
+                if expect_orig_path:
+                    status_records.append(record)
+                    expect_orig_path = False
+                elif record.startswith("# branch.head "):
+                    head = record[len("# branch.head ") :]
+                    current_branch = None if head == "(detached)" else head
+                elif record and not record.startswith("#"):
+                    status_records.append(record)
+                    expect_orig_path = record.startswith("2 ")
+
+        process = await asyncio.create_subprocess_exec(
+            *status_cmd,
+            cwd=repo_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0", **self.READ_ONLY_ENV},
+        )
+        # Drain stderr alongside stdout so a chatty git can't fill the pipe
+        stderr_task = asyncio.create_task(process.stderr.read())
+
+        async def read_status() -> bytes:
+            splitter = NulRecordSplitter()
+            while chunk := await process.stdout.read(STATUS_READ_CHUNK_SIZE):
+                consume(splitter.feed(chunk))
+            consume(splitter.close())
+            stderr = await stderr_task
+            await process.wait()
+            return stderr
+
         try:
-            # Check for uncommitted changes using git status
-            status_cmd = [self.GIT_EXECUTABLE, "status", "--porcelain"]
-            status_result = await self._run_subprocess(
-                status_cmd, cwd=repo_dir, capture_output=True
+            stderr = await asyncio.wait_for(read_status(), timeout)
+        except asyncio.TimeoutError as e:  # noqa: UP041 - not builtin on 3.10
+            logger.debug(f"Git status timed out after {timeout}s in {repo_dir}")
+            raise subprocess.CalledProcessError(
+                124,
+                status_cmd,
+                output="",
+                stderr=f"Command timed out after {timeout}s",
+            ) from e
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stderr_task.cancel()
+
+        if process.returncode != 0:
+            error_text = stderr.decode("utf-8", errors="replace").rstrip()
+            logger.debug(f"Git status failed in {repo_dir}: {error_text}")
+            raise subprocess.CalledProcessError(
+                process.returncode, status_cmd, output="", stderr=error_text
             )
 
-            status_output = status_result.stdout.strip()
-            has_changes = len(status_output) > 0
+        return {
+            "has_changes": bool(status_records),
+            "status_records": status_records,
+            "current_branch": current_branch,
+        }
 
-            return {
-                "has_changes": has_changes,
-                "status_output": status_output,
-            }
+    async def collect_repo_snapshot(
+        self, repo_dir: Path, commit_limit: int = 5
+    ) -> dict[str, Any]:
+        """
+        Collect status, branch and recent commits for a repository at once.
 
-        except subprocess.CalledProcessError as e:
-            logger.debug(f"Git status failed in {repo_dir}: {e}")
-            raise
-        except Exception as e:
-            logger.debug(f"Diff files operation failed in {repo_dir}: {e}")
-            raise
+        The status and log commands run concurrently rather than one after
+        the other, so each repository costs a single round of git startup.
+
+        Args:
+            repo_dir: Path to the repository
+            commit_limit: Maximum number of recent commits to return
+
+        Returns:
+            The diff_files() dictionary plus a ``recent_commits`` list
+        """
+        diff_info, recent_commits = await asyncio.gather(
+            self.diff_files(repo_dir),
+            self.get_recent_commits(repo_dir, commit_limit),
+        )
+        diff_info["recent_commits"] = recent_commits
+        return diff_info
 
     TRANSIENT_PATTERNS = [
         "Connection reset",
@@ -271,6 +388,7 @@ class GitManager:
         max_retries: int = 3,
         initial_delay: float = 2.0,
         backoff: float = 2.0,
+        extra_env: dict[str, str] | None = None,
     ) -> subprocess.CompletedProcess:
         """
         Run a subprocess command with proper error handling.
@@ -288,17 +406,21 @@ class GitManager:
             max_retries: Max retry attempts for transient failures (default 3)
             initial_delay: Initial retry delay in seconds (default 2.0)
             backoff: Backoff multiplier for retry delay (default 2.0)
+            extra_env: Additional environment variables for the command
 
         Returns:
             CompletedProcess result
         """
         safe_cmd = _sanitize_cmd_for_log(cmd)
 
-        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0", **(extra_env or {})}
 
         for attempt in range(max_retries + 1):
             try:
-                result = subprocess.run(
+                # Run in a worker thread so concurrent repositories don't
+                # serialize on the event loop while git is running
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     cmd,
                     cwd=cwd,
                     capture_output=True,
@@ -1,5 +1,6 @@
 """Git utility functions."""
 
+import codecs
 import logging
 import os
 import re
@@ -172,6 +173,30 @@ def parse_porcelain_z(stdout: str) -> set[str]:
     return paths
 
 
+class NulRecordSplitter:
+    """Incrementally split NUL-terminated git output into records.
+
+    Chunks read from a pipe can end mid-record (or mid UTF-8 sequence); the
+    trailing partial record is held back until the next chunk completes it.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._pending = ""
+
+    def feed(self, chunk: bytes) -> list[str]:
+        """Consume a chunk of bytes and return the records it completed."""
+        records = (self._pending + self._decoder.decode(chunk)).split("\0")
+        self._pending = records.pop()
+        return records
+
+    def close(self) -> list[str]:
+        """Flush any buffered data and return the final unterminated record."""
+        tail = self._pending + self._decoder.decode(b"", final=True)
+        self._pending = ""
+        return [tail] if tail else []
+
+
 def classify_dirty_repo(dirty_paths: set[str], collisions: set[str]) -> str:
     """Classify a dirty repo as 'case_collision' or 'dirty'.
 
@@ -6,6 +6,7 @@ and large repository datasets with configurable compression levels.
 """
 
 import gzip
+import hashlib
 import json
 import logging
 import lzma
@@ -37,6 +38,7 @@ class CompressionResult:
     method: CompressionMethod
     compressed_data: bytes
     metadata: dict[str, Any]
+    original_sha256: str | None = None  # SHA-256 of the uncompressed bytes
 
     @property
     def space_saved_percent(self) -> float:
@@ -65,6 +67,9 @@ class DataCompressor:
     GZIP_THRESHOLD = 1024  # 1KB - use gzip for small files
     LZMA_THRESHOLD = 1024 * 100  # 100KB - use lzma for larger files
 
+    # Chunk size used when streaming compressed data through a decompressor
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(
         self,
         default_method: CompressionMethod = CompressionMethod.GZIP,
@@ -107,6 +112,7 @@ class DataCompressor:
             data_bytes = data.encode("utf-8") if isinstance(data, str) else data
 
             original_size = len(data_bytes)
+            original_sha256 = hashlib.sha256(data_bytes).hexdigest()
 
             # Select compression method
             if method is None:
@@ -121,6 +127,7 @@ class DataCompressor:
                     method=CompressionMethod.NONE,
                     compressed_data=data_bytes,
                     metadata={"reason": "data_too_small"},
+                    original_sha256=original_sha256,
                 )
 
             # Perform compression
@@ -151,6 +158,7 @@ class DataCompressor:
                     "quality": self.quality,
                     "original_type": "string" if isinstance(data, str) else "bytes",
                 },
+                original_sha256=original_sha256,
             )
 
             logger.debug(
@@ -209,6 +217,50 @@ class DataCompressor:
             logger.error(f"Decompression failed: {e}")
             raise
 
+    def decompressed_sha256(self, compressed_result: CompressionResult) -> str:
+        """
+        Compute the SHA-256 of the decompressed payload without materializing it.
+
+        Compressed bytes are fed through an incremental decompressor in chunks
+        and each decompressed chunk goes straight into the hasher.
+
+        Args:
+            compressed_result: CompressionResult with compressed data and metadata
+
+        Returns:
+            Hex digest of the decompressed bytes
+        """
+        method = compressed_result.method
+        compressed_data = memoryview(compressed_result.compressed_data)
+        hasher = hashlib.sha256()
+
+        if method == CompressionMethod.NONE:
+            hasher.update(compressed_data)
+            return hasher.hexdigest()
+
+        if method == CompressionMethod.GZIP:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif method == CompressionMethod.LZMA:
+            decompressor = lzma.LZMADecompressor()
+        elif method == CompressionMethod.ZLIB:
+            decompressor = zlib.decompressobj()
+        else:
+            raise ValueError(f"Unsupported decompression method: {method}")
+
+        for offset in range(0, len(compressed_data), self.STREAM_CHUNK_SIZE):
+            chunk = compressed_data[offset : offset + self.STREAM_CHUNK_SIZE]
+            hasher.update(decompressor.decompress(chunk))
+
+        if isinstance(decompressor, lzma.LZMADecompressor):
+            if not decompressor.eof:
+                raise lzma.LZMAError("Compressed data ended before the end-of-stream")
+        else:
+            hasher.update(decompressor.flush())
+            if not decompressor.eof:
+                raise zlib.error("Compressed data ended before the end-of-stream")
+
+        return hasher.hexdigest()
+
     def compress_json_data(
         self, data: dict[Any, Any], method: CompressionMethod | None = None
     ) -> CompressionResult:
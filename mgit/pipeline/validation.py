@@ -7,9 +7,10 @@ and pipeline data with configurable validation levels and recovery options.
 
 import hashlib
 import logging
-from dataclasses import dataclass
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from pathlib import Path
 from typing import Any
 
 from mgit.changesets.models import (
@@ -19,10 +20,13 @@ from mgit.changesets.models import (
     RepositoryChangeset,
 )
 from mgit.content.embedding import EmbeddedContent
-from mgit.pipeline.compression import CompressionResult
+from mgit.pipeline.compression import CompressionResult, DataCompressor
 
 logger = logging.getLogger(__name__)
 
+# Shared compressor for round-trip checks; it holds no per-call state
+_round_trip_compressor = DataCompressor()
+
 
 class ValidationLevel(Enum):
     """Validation thoroughness levels."""
@@ -41,7 +45,13 @@ class ValidationSeverity(Enum):
     CRITICAL = "critical"  # Severe issues that indicate data corruption
 
 
-@dataclass
+# Severities that make a validation result invalid
+_FAILING_SEVERITIES = frozenset({ValidationSeverity.ERROR, ValidationSeverity.CRITICAL})
+# Structural issues that leave nothing meaningful to check file by file
+_STRUCTURAL_STOP_CODES = frozenset({"MISSING_REQUIRED_FIELD"})
+
+
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a validation issue found during data validation."""
 
@@ -53,7 +63,42 @@ class ValidationIssue:
     data_context: dict[str, Any] | None = None
 
 
-@dataclass
+def _collapse_duplicate_issues(
+    issues: list[ValidationIssue],
+) -> list[ValidationIssue]:
+    """
+    Merge issues sharing severity, code, field path and message into one.
+
+    The first occurrence is kept as the representative. When it stands for
+    more than one issue, a new issue is built whose data_context gains a
+    "count" entry and, under "contexts", the data_context of every merged
+    occurrence, so e.g. each offending filename is still reported. Input
+    issues are never modified, since results may share them.
+    """
+    groups: dict[
+        tuple[ValidationSeverity, str, str | None, str], list[ValidationIssue]
+    ] = {}
+    for issue in issues:
+        key = (issue.severity, issue.code, issue.field_path, issue.message)
+        groups.setdefault(key, []).append(issue)
+
+    if len(groups) == len(issues):
+        return issues
+
+    collapsed = []
+    for group in groups.values():
+        first = group[0]
+        if len(group) > 1:
+            data_context = {**(first.data_context or {}), "count": len(group)}
+            contexts = [i.data_context for i in group if i.data_context is not None]
+            if contexts:
+                data_context["contexts"] = contexts
+            first = replace(first, data_context=data_context)
+        collapsed.append(first)
+    return collapsed
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation operation."""
 
@@ -62,28 +107,51 @@ class ValidationResult:
     issues: list[ValidationIssue]
     statistics: dict[str, Any]
 
+    # Severity counts cached against the issues list (held, so its identity
+    # can't be reused) and its length at the time they were computed
+    _counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _counted_list: list[ValidationIssue] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _counted_issues: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def _severity_counts(self) -> dict[str, int]:
+        """
+        Count issues by severity, recounting when the issues list changes.
+
+        Appending issues or assigning a new list is detected; swapping an
+        entry in place is not.
+        """
+        issues = self.issues
+        if issues is not self._counted_list or self._counted_issues != len(issues):
+            counts = {severity.value: 0 for severity in ValidationSeverity}
+            for issue in issues:
+                counts[issue.severity.value] += 1
+            self._counts = counts
+            self._counted_list = issues
+            self._counted_issues = len(issues)
+        return self._counts
+
     @property
     def has_critical_issues(self) -> bool:
         """Check if validation found critical issues."""
-        return any(
-            issue.severity == ValidationSeverity.CRITICAL for issue in self.issues
-        )
+        return self._severity_counts()[ValidationSeverity.CRITICAL.value] > 0
 
     @property
     def has_errors(self) -> bool:
         """Check if validation found errors or critical issues."""
-        return any(
-            issue.severity in {ValidationSeverity.ERROR, ValidationSeverity.CRITICAL}
-            for issue in self.issues
+        counts = self._severity_counts()
+        return (
+            counts[ValidationSeverity.ERROR.value] > 0
+            or counts[ValidationSeverity.CRITICAL.value] > 0
         )
 
     @property
     def issue_counts(self) -> dict[str, int]:
         """Get count of issues by severity."""
-        counts = {severity.value: 0 for severity in ValidationSeverity}
-        for issue in self.issues:
-            counts[issue.severity.value] += 1
-        return counts
+        return dict(self._severity_counts())
 
 
 class ChangesetValidator:
@@ -116,6 +184,20 @@ class ChangesetValidator:
         "worktree_status",
     }
 
+    VALID_GIT_STATUSES = frozenset({"clean", "dirty", "error"})
+
+    VALID_CHANGE_TYPES = frozenset(
+        {
+            "added",
+            "modified",
+            "deleted",
+            "renamed",
+            "copied",
+            "untracked",
+            "unknown",
+        }
+    )
+
     REQUIRED_COMMIT_INFO_FIELDS = {
         "hash",
         "author_name",
@@ -131,12 +213,135 @@ class ChangesetValidator:
             f"Changeset validator initialized with {validation_level.value} level"
         )
 
+        # Per-type checks are built once here so the hot paths only loop
+        self._changeset_checks = self._build_changeset_checks()
+        self._commit_checks = self._build_commit_checks()
+
+    def _build_changeset_checks(
+        self,
+    ) -> tuple[Callable[[RepositoryChangeset], ValidationIssue | None], ...]:
+        """Build the structural checks applied to every changeset."""
+
+        def required(field_name: str):
+            def check(changeset: RepositoryChangeset) -> ValidationIssue | None:
+                if getattr(changeset, field_name) is None:
+                    return ValidationIssue(
+                        severity=ValidationSeverity.ERROR,
+                        code="MISSING_REQUIRED_FIELD",
+                        message=f"Required field missing: {field_name}",
+                        field_path=field_name,
+                        suggested_fix=f"Provide value for {field_name}",
+                    )
+                return None
+
+            return check
+
+        def repository_path(changeset: RepositoryChangeset) -> ValidationIssue | None:
+            if changeset.repository_path:
+                if not os.path.isabs(changeset.repository_path):
+                    return ValidationIssue(
+                        severity=ValidationSeverity.WARNING,
+                        code="RELATIVE_REPOSITORY_PATH",
+                        message="Repository path should be absolute",
+                        field_path="repository_path",
+                        suggested_fix="Convert to absolute path",
+                    )
+            return None
+
+        max_name_length = self.MAX_REPOSITORY_NAME_LENGTH
+
+        def repository_name(changeset: RepositoryChangeset) -> ValidationIssue | None:
+            if changeset.repository_name:
+                if len(changeset.repository_name) > max_name_length:
+                    return ValidationIssue(
+                        severity=ValidationSeverity.ERROR,
+                        code="REPOSITORY_NAME_TOO_LONG",
+                        message=f"Repository name exceeds maximum length ({max_name_length})",
+                        field_path="repository_name",
+                        suggested_fix="Shorten repository name",
+                    )
+            return None
+
+        valid_statuses = self.VALID_GIT_STATUSES
+
+        def git_status(changeset: RepositoryChangeset) -> ValidationIssue | None:
+            if changeset.git_status not in valid_statuses:
+                return ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    code="INVALID_GIT_STATUS",
+                    message=f"Invalid git status: {changeset.git_status}",
+                    field_path="git_status",
+                    suggested_fix=f"Use one of: {', '.join(valid_statuses)}",
+                )
+            return None
+
+        return (
+            *(required(name) for name in self.REQUIRED_CHANGESET_FIELDS),
+            repository_path,
+            repository_name,
+            git_status,
+        )
+
+    def _build_commit_checks(
+        self,
+    ) -> tuple[Callable[[CommitInfo], ValidationIssue | None], ...]:
+        """Build the checks applied to every commit."""
+
+        def required(field_name: str):
+            def check(commit: CommitInfo) -> ValidationIssue | None:
+                if getattr(commit, field_name) is None:
+                    return ValidationIssue(
+                        severity=ValidationSeverity.ERROR,
+                        code="MISSING_COMMIT_FIELD",
+                        message=f"Commit info missing required field: {field_name}",
+                        field_path=f"commit.{field_name}",
+                        suggested_fix=f"Provide value for {field_name}",
+                    )
+                return None
+
+            return check
+
+        def commit_hash(commit: CommitInfo) -> ValidationIssue | None:
+            if commit.hash:
+                if not commit.hash.strip() or len(commit.hash) < 7:
+                    return ValidationIssue(
+                        severity=ValidationSeverity.ERROR,
+                        code="INVALID_COMMIT_HASH",
+                        message=f"Invalid commit hash format: {commit.hash}",
+                        field_path="commit.hash",
+                        suggested_fix="Provide valid Git commit hash (at least 7 characters)",
+                    )
+            return None
+
+        max_message_length = self.MAX_COMMIT_MESSAGE_LENGTH
+
+        def commit_message(commit: CommitInfo) -> ValidationIssue | None:
+            if commit.message:
+                if len(commit.message) > max_message_length:
+                    return ValidationIssue(
+                        severity=ValidationSeverity.WARNING,
+                        code="COMMIT_MESSAGE_TOO_LONG",
+                        message=f"Commit message exceeds reasonable length ({max_message_length})",
+                        field_path="commit.message",
+                    )
+            return None
+
+        return (
+            *(required(name) for name in self.REQUIRED_COMMIT_INFO_FIELDS),
+            commit_hash,
+            commit_message,
+        )
+
     def validate_repository_changeset(
         self, changeset: RepositoryChangeset
     ) -> ValidationResult:
         """
         Validate a single repository changeset.
 
+        Structural checks run first. If a required field is missing, or
+        under BASIC level if there is any error, the file and commit checks
+        are skipped since the changeset is already invalid.
+
         Args:
             changeset: RepositoryChangeset to validate
 
@@ -155,43 +360,56 @@ class ChangesetValidator:
             issues.extend(self._validate_changeset_structure(changeset))
             statistics["validated_fields"] = len(self.REQUIRED_CHANGESET_FIELDS)
 
-            # Validate file changes
-            for file_change in changeset.uncommitted_files:
-                issues.extend(
-                    self._validate_file_change(file_change, changeset.repository_path)
+            # Stop early when the structure alone already fails validation
+            if self.validation_level is ValidationLevel.BASIC:
+                stop = any(issue.severity in _FAILING_SEVERITIES for issue in issues)
+            else:
+                stop = any(issue.code in _STRUCTURAL_STOP_CODES for issue in issues)
+            if stop:
+                return ValidationResult(
+                    is_valid=False,
+                    validation_level=self.validation_level,
+                    issues=issues,
+                    statistics=statistics,
                 )
-                statistics["validated_files"] += 1
 
-            # Validate commit information
-            for commit in changeset.recent_commits:
-                issues.extend(
-                    self._validate_commit_info(commit, changeset.repository_path)
-                )
-                statistics["validated_commits"] += 1
+            # Bind hot lookups to locals for the per-file and per-commit loops
+            issues_extend = issues.extend
+            validate_embedded_content = self._validate_embedded_content
+            validate_commit_info = self._validate_commit_info
+            repo_path = changeset.repository_path
 
-            # Validate embedded content if present
-            if self.validation_level in {
-                ValidationLevel.STANDARD,
-                ValidationLevel.STRICT,
-            }:
-                for file_change in changeset.uncommitted_files:
+            # Validate file changes as one batch
+            files = changeset.uncommitted_files
+            issues_extend(self._validate_file_changes(files, repo_path))
+            statistics["validated_files"] = len(files)
+
+            # Validate embedded content unless the level is BASIC
+            if self.validation_level is not ValidationLevel.BASIC:
+                for file_change in files:
                     if file_change.embedded_content:
-                        issues.extend(
-                            self._validate_embedded_content(
+                        issues_extend(
+                            validate_embedded_content(
                                 file_change.embedded_content, file_change.filename
                             )
                         )
 
+            # Validate commit information
+            for commit in changeset.recent_commits:
+                issues_extend(validate_commit_info(commit, repo_path))
+                statistics["validated_commits"] += 1
+
             # Additional strict validation
             if self.validation_level == ValidationLevel.STRICT:
-                issues.extend(self._validate_changeset_consistency(changeset))
+                issues_extend(self._validate_changeset_consistency(changeset))
+
+            # Collapse repeated issues (e.g. the same missing field on every
+            # file) into one representative carrying a count
+            issues = _collapse_duplicate_issues(issues)
 
             # Determine overall validity
-            is_valid = not any(
-                issue.severity
-                in {ValidationSeverity.ERROR, ValidationSeverity.CRITICAL}
-                for issue in issues
-            )
+            failing = _FAILING_SEVERITIES
+            is_valid = not any(issue.severity in failing for issue in issues)
 
             return ValidationResult(
                 is_valid=is_valid,
@@ -241,10 +459,32 @@ class ChangesetValidator:
             # Validate collection structure
             issues.extend(self._validate_collection_structure(collection))
 
-            # Validate each repository changeset
+            # Validate each repository changeset. Mirrored repositories often
+            # have identical changesets, so results are reused per fingerprint.
+            results_by_fingerprint: dict[tuple, ValidationResult] = {}
+            issues_extend = issues.extend
+            issues_append = issues.append
+            changeset_fingerprint = self._changeset_fingerprint
+            validate_repository_changeset = self.validate_repository_changeset
+            error = ValidationSeverity.ERROR
+
+            # Under STRICT, duplicate repository paths are detected in the
+            # same pass; None disables the check for lower levels.
+            seen_paths: set[str] | None = (
+                set() if self.validation_level == ValidationLevel.STRICT else None
+            )
             for repo_key, changeset in collection.repositories.items():
-                repo_result = self.validate_repository_changeset(changeset)
-                issues.extend(repo_result.issues)
+                fingerprint = changeset_fingerprint(changeset)
+                repo_result = (
+                    results_by_fingerprint.get(fingerprint)
+                    if fingerprint is not None
+                    else None
+                )
+                if repo_result is None:
+                    repo_result = validate_repository_changeset(changeset)
+                    if fingerprint is not None:
+                        results_by_fingerprint[fingerprint] = repo_result
+                issues_extend(repo_result.issues)
 
                 # Aggregate statistics
                 statistics["validated_repositories"] += 1
@@ -258,9 +498,9 @@ class ChangesetValidator:
                 # Validate repository key consistency
                 expected_key = changeset.repository_key
                 if repo_key != expected_key:
-                    issues.append(
+                    issues_append(
                         ValidationIssue(
-                            severity=ValidationSeverity.ERROR,
+                            severity=error,
                             code="REPOSITORY_KEY_MISMATCH",
                             message=f"Repository key mismatch: expected {expected_key}, got {repo_key}",
                             field_path=f"repositories.{repo_key}",
@@ -268,14 +508,24 @@ class ChangesetValidator:
                         )
                     )
 
-            # Collection-wide consistency checks
-            if self.validation_level == ValidationLevel.STRICT:
-                issues.extend(self._validate_collection_consistency(collection))
+                # Collection-wide consistency: report the first duplicate path
+                if seen_paths is not None:
+                    repo_path = changeset.repository_path
+                    if repo_path in seen_paths:
+                        issues_append(
+                            ValidationIssue(
+                                severity=error,
+                                code="DUPLICATE_REPOSITORY_PATHS",
+                                message="Collection contains duplicate repository paths",
+                                suggested_fix="Remove duplicate entries",
+                            )
+                        )
+                        seen_paths = None
+                    else:
+                        seen_paths.add(repo_path)
 
             is_valid = not any(
-                issue.severity
-                in {ValidationSeverity.ERROR, ValidationSeverity.CRITICAL}
-                for issue in issues
+                issue.severity in _FAILING_SEVERITIES for issue in issues
             )
 
             return ValidationResult(
@@ -361,18 +611,32 @@ class ChangesetValidator:
                     )
                 )
 
-            # If expected data provided, validate round-trip integrity
+            # If expected data provided, validate round-trip integrity by
+            # comparing digests instead of full decompressed buffers
             if expected_data and self.validation_level in {
                 ValidationLevel.STANDARD,
                 ValidationLevel.STRICT,
             }:
                 try:
-                    from mgit.pipeline.compression import DataCompressor
-
-                    compressor = DataCompressor()
-                    decompressed = compressor.decompress_data(compression_result)
+                    expected_bytes = (
+                        expected_data.encode("utf-8")
+                        if isinstance(expected_data, str)
+                        else expected_data
+                    )
+                    expected_digest = hashlib.sha256(expected_bytes).hexdigest()
+
+                    recorded_digest = compression_result.original_sha256
+                    if recorded_digest and recorded_digest != expected_digest:
+                        data_matches = False
+                    else:
+                        data_matches = (
+                            _round_trip_compressor.decompressed_sha256(
+                                compression_result
+                            )
+                            == expected_digest
+                        )
 
-                    if decompressed != expected_data:
+                    if not data_matches:
                         issues.append(
                             ValidationIssue(
                                 severity=ValidationSeverity.CRITICAL,
@@ -395,9 +659,7 @@ class ChangesetValidator:
                     )
 
             is_valid = not any(
-                issue.severity
-                in {ValidationSeverity.ERROR, ValidationSeverity.CRITICAL}
-                for issue in issues
+                issue.severity in _FAILING_SEVERITIES for issue in issues
             )
 
             return ValidationResult(
@@ -422,120 +684,118 @@ class ChangesetValidator:
                 statistics=statistics,
             )
 
+    def _changeset_fingerprint(self, changeset: RepositoryChangeset) -> tuple | None:
+        """
+        Build a key capturing every input that affects changeset validation.
+
+        Two changesets with the same fingerprint produce the same issues, so
+        the result of one can be reused for the other. Returns None when the
+        changeset carries embedded content that would need validating, since
+        content is too costly to fingerprint.
+        """
+        files = changeset.uncommitted_files
+        if self.validation_level != ValidationLevel.BASIC and any(
+            fc.embedded_content for fc in files
+        ):
+            return None
+
+        repo_path = changeset.repository_path
+        repo_name = changeset.repository_name
+        return (
+            repo_path is None,
+            bool(repo_path) and not os.path.isabs(repo_path),
+            repo_name is None,
+            bool(repo_name) and len(repo_name) > self.MAX_REPOSITORY_NAME_LENGTH,
+            changeset.timestamp is None,
+            changeset.has_uncommitted_changes,
+            changeset.git_status,
+            tuple(
+                (fc.filename, fc.change_type, fc.index_status, fc.worktree_status)
+                for fc in files
+            ),
+            tuple(
+                (
+                    commit.hash,
+                    commit.author_name is None,
+                    commit.author_email is None,
+                    commit.date is None,
+                    commit.message is None,
+                    bool(commit.message)
+                    and len(commit.message) > self.MAX_COMMIT_MESSAGE_LENGTH,
+                )
+                for commit in changeset.recent_commits
+            ),
+        )
+
     def _validate_changeset_structure(
         self, changeset: RepositoryChangeset
     ) -> list[ValidationIssue]:
         """Validate basic changeset structure and required fields."""
         issues = []
-
-        # Check required fields
-        for field in self.REQUIRED_CHANGESET_FIELDS:
-            if not hasattr(changeset, field) or getattr(changeset, field) is None:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="MISSING_REQUIRED_FIELD",
-                        message=f"Required field missing: {field}",
-                        field_path=field,
-                        suggested_fix=f"Provide value for {field}",
-                    )
-                )
-
-        # Validate repository path
-        if hasattr(changeset, "repository_path") and changeset.repository_path:
-            if not Path(changeset.repository_path).is_absolute():
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        code="RELATIVE_REPOSITORY_PATH",
-                        message="Repository path should be absolute",
-                        field_path="repository_path",
-                        suggested_fix="Convert to absolute path",
-                    )
-                )
-
-        # Validate repository name length
-        if hasattr(changeset, "repository_name") and changeset.repository_name:
-            if len(changeset.repository_name) > self.MAX_REPOSITORY_NAME_LENGTH:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="REPOSITORY_NAME_TOO_LONG",
-                        message=f"Repository name exceeds maximum length ({self.MAX_REPOSITORY_NAME_LENGTH})",
-                        field_path="repository_name",
-                        suggested_fix="Shorten repository name",
-                    )
-                )
-
-        # Validate git status values
-        if hasattr(changeset, "git_status"):
-            valid_statuses = {"clean", "dirty", "error"}
-            if changeset.git_status not in valid_statuses:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="INVALID_GIT_STATUS",
-                        message=f"Invalid git status: {changeset.git_status}",
-                        field_path="git_status",
-                        suggested_fix=f"Use one of: {', '.join(valid_statuses)}",
-                    )
-                )
-
+        for check in self._changeset_checks:
+            issue = check(changeset)
+            if issue:
+                issues.append(issue)
         return issues
 
-    def _validate_file_change(
-        self, file_change: FileChange, repo_path: str
+    def _validate_file_changes(
+        self, file_changes: list[FileChange], repo_path: str
     ) -> list[ValidationIssue]:
-        """Validate individual file change data."""
+        """
+        Validate a batch of file changes.
+
+        Each check runs as one comprehension over the whole batch and issues
+        are only built for the (usually few) offending entries.
+        """
         issues = []
 
         # Check required fields
-        for field in self.REQUIRED_FILE_CHANGE_FIELDS:
-            if not hasattr(file_change, field) or getattr(file_change, field) is None:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="MISSING_FILE_CHANGE_FIELD",
-                        message=f"File change missing required field: {field}",
-                        field_path=f"file_change.{field}",
-                        suggested_fix=f"Provide value for {field}",
-                    )
+        for field_name in self.REQUIRED_FILE_CHANGE_FIELDS:
+            missing = sum(1 for fc in file_changes if getattr(fc, field_name) is None)
+            issues.extend(
+                ValidationIssue(
+                    severity=ValidationSeverity.ERROR,
+                    code="MISSING_FILE_CHANGE_FIELD",
+                    message=f"File change missing required field: {field_name}",
+                    field_path=f"file_change.{field_name}",
+                    suggested_fix=f"Provide value for {field_name}",
                 )
+                for _ in range(missing)
+            )
 
-        # Validate filename
-        if hasattr(file_change, "filename") and file_change.filename:
-            if len(file_change.filename) > self.MAX_FILENAME_LENGTH:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="FILENAME_TOO_LONG",
-                        message=f"Filename exceeds maximum length ({self.MAX_FILENAME_LENGTH})",
-                        field_path="file_change.filename",
-                        data_context={"filename": file_change.filename},
-                    )
-                )
+        # Validate filenames
+        max_length = self.MAX_FILENAME_LENGTH
+        long_filenames = [
+            fc.filename
+            for fc in file_changes
+            if fc.filename and len(fc.filename) > max_length
+        ]
+        issues.extend(
+            ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="FILENAME_TOO_LONG",
+                message=f"Filename exceeds maximum length ({max_length})",
+                field_path="file_change.filename",
+                data_context={"filename": filename},
+            )
+            for filename in long_filenames
+        )
 
-        # Validate change type
-        if hasattr(file_change, "change_type"):
-            valid_types = {
-                "added",
-                "modified",
-                "deleted",
-                "renamed",
-                "copied",
-                "untracked",
-                "unknown",
-            }
-            if file_change.change_type not in valid_types:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="INVALID_CHANGE_TYPE",
-                        message=f"Invalid change type: {file_change.change_type}",
-                        field_path="file_change.change_type",
-                        suggested_fix=f"Use one of: {', '.join(valid_types)}",
-                    )
-                )
+        # Validate change types
+        valid_types = self.VALID_CHANGE_TYPES
+        invalid_types = [
+            fc.change_type for fc in file_changes if fc.change_type not in valid_types
+        ]
+        issues.extend(
+            ValidationIssue(
+                severity=ValidationSeverity.ERROR,
+                code="INVALID_CHANGE_TYPE",
+                message=f"Invalid change type: {change_type}",
+                field_path="file_change.change_type",
+                suggested_fix=f"Use one of: {', '.join(valid_types)}",
+            )
+            for change_type in invalid_types
+        )
 
         return issues
 
@@ -544,45 +804,10 @@ class ChangesetValidator:
     ) -> list[ValidationIssue]:
         """Validate commit information."""
         issues = []
-
-        # Check required fields
-        for field in self.REQUIRED_COMMIT_INFO_FIELDS:
-            if not hasattr(commit, field) or getattr(commit, field) is None:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="MISSING_COMMIT_FIELD",
-                        message=f"Commit info missing required field: {field}",
-                        field_path=f"commit.{field}",
-                        suggested_fix=f"Provide value for {field}",
-                    )
-                )
-
-        # Validate commit hash format
-        if hasattr(commit, "hash") and commit.hash:
-            if not commit.hash.strip() or len(commit.hash) < 7:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.ERROR,
-                        code="INVALID_COMMIT_HASH",
-                        message=f"Invalid commit hash format: {commit.hash}",
-                        field_path="commit.hash",
-                        suggested_fix="Provide valid Git commit hash (at least 7 characters)",
-                    )
-                )
-
-        # Validate commit message length
-        if hasattr(commit, "message") and commit.message:
-            if len(commit.message) > self.MAX_COMMIT_MESSAGE_LENGTH:
-                issues.append(
-                    ValidationIssue(
-                        severity=ValidationSeverity.WARNING,
-                        code="COMMIT_MESSAGE_TOO_LONG",
-                        message=f"Commit message exceeds reasonable length ({self.MAX_COMMIT_MESSAGE_LENGTH})",
-                        field_path="commit.message",
-                    )
-                )
-
+        for check in self._commit_checks:
+            issue = check(commit)
+            if issue:
+                issues.append(issue)
         return issues
 
     def _validate_embedded_content(
@@ -684,26 +909,6 @@ class ChangesetValidator:
 
         return issues
 
-    def _validate_collection_consistency(
-        self, collection: ChangesetCollection
-    ) -> list[ValidationIssue]:
-        """Perform strict collection consistency validation."""
-        issues = []
-
-        # Check for duplicate repository paths
-        repo_paths = [cs.repository_path for cs in collection.repositories.values()]
-        if len(repo_paths) != len(set(repo_paths)):
-            issues.append(
-                ValidationIssue(
-                    severity=ValidationSeverity.ERROR,
-                    code="DUPLICATE_REPOSITORY_PATHS",
-                    message="Collection contains duplicate repository paths",
-                    suggested_fix="Remove duplicate entries",
-                )
-            )
-
-        return issues
-
 
 # Convenience validation functions
 def validate_changeset(
@@ -1,8 +1,11 @@
 """Core processing classes for mgit operations."""
 
 import asyncio
+import functools
 import logging
-from dataclasses import asdict, dataclass
+import os
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -12,12 +15,132 @@ from mgit.content.embedding import (
     ContentStrategy,
     EmbeddingConfig,
 )
+from mgit.content.embedding_cache import CachedEmbeddingEngine, EmbeddingCache
+from mgit.content.mime_detector import MimeDetector
+from mgit.git.clean_cache import CleanFingerprintCache, repo_fingerprint
 from mgit.git.manager import GitManager
 
 logger = logging.getLogger(__name__)
 
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
 
-@dataclass
+# Upper bound for the auto-sized worker count; git status is I/O-bound
+MAX_AUTO_CONCURRENCY = 32
+# File descriptors held per in-flight repository (git subprocess pipes plus
+# files opened while embedding content)
+FDS_PER_REPOSITORY = 6
+# Fraction of the soft RLIMIT_NOFILE limit repository workers may consume
+FD_LIMIT_BUDGET = 0.75
+
+
+def default_concurrency() -> int:
+    """Return a worker count sized to the host: two per CPU, capped."""
+    return max(1, min(MAX_AUTO_CONCURRENCY, (os.cpu_count() or 1) * 2))
+
+
+def _clamp_to_fd_limit(concurrency: int) -> int:
+    """
+    Limit concurrency so open file descriptors stay within the soft limit.
+
+    Args:
+        concurrency: Requested number of concurrent repository operations
+
+    Returns:
+        The requested concurrency, or a lower value if it would exceed
+        FD_LIMIT_BUDGET of the process RLIMIT_NOFILE soft limit
+    """
+    if resource is None:
+        return concurrency
+    try:
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (OSError, ValueError):
+        return concurrency
+    if soft_limit == resource.RLIM_INFINITY:
+        return concurrency
+
+    fd_budget = int(soft_limit * FD_LIMIT_BUDGET)
+    if concurrency * FDS_PER_REPOSITORY <= fd_budget:
+        return concurrency
+
+    clamped = max(1, fd_budget // FDS_PER_REPOSITORY)
+    logger.warning(
+        f"Concurrency {concurrency} needs ~{concurrency * FDS_PER_REPOSITORY} "
+        f"file descriptors but the open file limit is {soft_limit}; "
+        f"reducing to {clamped}"
+    )
+    return clamped
+
+
+@functools.cache
+def _shared_mime_detector() -> MimeDetector:
+    """Return the process-wide MIME detector; it holds only configuration."""
+    return MimeDetector()
+
+
+@functools.cache
+def _shared_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide embedding cache and its open connection."""
+    return EmbeddingCache()
+
+
+def _get_content_engine(
+    strategy: ContentStrategy, memory_mb: int, cache_embeddings: bool = False
+) -> ContentEmbeddingEngine:
+    """
+    Build an embedding engine with its own memory budget.
+
+    The MIME detector and embedding cache connection are stateless for the
+    engine's purposes and are shared across DiffProcessor instances in the
+    same process; the memory budget is not, so one processor's scans never
+    use up or reset another's.
+    """
+    config = EmbeddingConfig(default_strategy=strategy, max_total_memory_mb=memory_mb)
+    if not cache_embeddings:
+        return ContentEmbeddingEngine(config, mime_detector=_shared_mime_detector())
+    return CachedEmbeddingEngine(
+        config, cache=_shared_embedding_cache(), mime_detector=_shared_mime_detector()
+    )
+
+
+# Index status takes precedence over worktree status when classifying a file
+_INDEX_CHANGE_TYPES = {
+    "A": "added",
+    "M": "modified",
+    "D": "deleted",
+    "R": "renamed",
+    "C": "copied",
+}
+_WORKTREE_CHANGE_TYPES = {"M": "modified", "D": "deleted"}
+_STATUS_CODES = " .MTADRCU?!"
+
+# (index, worktree) status pair -> change type, built once at import
+_CHANGE_TYPES: dict[tuple[str, str], str] = {
+    (index, worktree): _INDEX_CHANGE_TYPES.get(index)
+    or _WORKTREE_CHANGE_TYPES.get(worktree)
+    or ("untracked" if index == worktree == "?" else "unknown")
+    for index in _STATUS_CODES
+    for worktree in _STATUS_CODES
+}
+
+# Porcelain v2 marks an unchanged side with "."; it is reported as the v1 space
+_V1_STATUS = {code: " " if code == "." else code for code in _STATUS_CODES}
+
+# Raw porcelain v2 XY field -> (index status, worktree status, change type)
+_XY_FIELDS: dict[str, tuple[str, str, str]] = {
+    index + worktree: (
+        _V1_STATUS[index],
+        _V1_STATUS[worktree],
+        _CHANGE_TYPES[(_V1_STATUS[index], _V1_STATUS[worktree])],
+    )
+    for index in _STATUS_CODES
+    for worktree in _STATUS_CODES
+}
+
+
+@dataclass(slots=True)
 class RepositoryChange:
     """Represents change information for a single repository."""
 
@@ -37,13 +160,16 @@ class DiffProcessor:
 
     def __init__(
         self,
-        concurrency: int = 5,
+        concurrency: int | None = None,
         embed_content: bool = False,
         content_strategy: ContentStrategy = ContentStrategy.SAMPLE,
         content_memory_mb: int = 100,
+        fast_clean_check: bool = False,
+        cache_embeddings: bool = False,
     ):
         self.git_manager = GitManager()
-        self.concurrency = concurrency
+        # None (or 0) sizes the worker pool from the host CPU count
+        self.concurrency = _clamp_to_fd_limit(concurrency or default_concurrency())
         self.embed_content = embed_content
         self.content_strategy = content_strategy
         self.content_memory_mb = content_memory_mb
@@ -51,10 +177,13 @@ class DiffProcessor:
         # Initialize content embedding engine if needed
         self.content_engine = None
         if embed_content:
-            config = EmbeddingConfig(
-                default_strategy=content_strategy, max_total_memory_mb=content_memory_mb
+            # Opt-in: reuse embeddings of unchanged files from the on-disk cache
+            self.content_engine = _get_content_engine(
+                content_strategy, content_memory_mb, cache_embeddings
             )
-            self.content_engine = ContentEmbeddingEngine(config)
+
+        # Opt-in: skip git status for repos unchanged since last seen clean
+        self.clean_cache = CleanFingerprintCache() if fast_clean_check else None
 
     async def process_repositories(
         self,
@@ -64,24 +193,66 @@ class DiffProcessor:
     ) -> list[RepositoryChange]:
         """
         Process multiple repositories concurrently to detect changes.
+
+        Results are returned in the same order as ``repositories``.
+        """
+        results: list[Any] = [None] * len(repositories)
+        async for index, change in self._process_repositories_indexed(
+            repositories, progress, task_id
+        ):
+            results[index] = change
+        return results
+
+    async def process_repositories_stream(
+        self,
+        repositories: list[Path],
+        progress: Any | None = None,
+        task_id: Any | None = None,
+    ) -> AsyncIterator[RepositoryChange]:
+        """
+        Process repositories concurrently, yielding each result as it completes.
+
+        Results arrive in completion order, so consumers can start writing
+        output before the slowest repository finishes.
         """
+        async for _, change in self._process_repositories_indexed(
+            repositories, progress, task_id
+        ):
+            yield change
+
+    async def _process_repositories_indexed(
+        self,
+        repositories: list[Path],
+        progress: Any | None,
+        task_id: Any | None,
+    ) -> AsyncIterator[tuple[int, RepositoryChange]]:
+        """Yield (input index, change) pairs in completion order."""
         semaphore = asyncio.Semaphore(self.concurrency)
+        # Each scan gets the full memory budget for its embedded content
+        if self.content_engine is not None:
+            self.content_engine.reset_memory_tracking()
+        # One scan, one timestamp: shared by every repository in the batch
+        batch_timestamp = datetime.now().isoformat()
 
-        async def process_single_repo(repo_path: Path) -> RepositoryChange:
+        async def process_single_repo(
+            index: int, repo_path: Path
+        ) -> tuple[int, RepositoryChange]:
             async with semaphore:
                 try:
-                    change_data = await self._detect_repository_changes(repo_path)
+                    change_data = await self._detect_repository_changes(
+                        repo_path, batch_timestamp
+                    )
                     if progress and task_id:
                         progress.advance(task_id)
-                    return change_data
+                    return index, change_data
                 except Exception as e:
                     logger.error(f"Error processing repository {repo_path}: {e}")
                     if progress and task_id:
                         progress.advance(task_id)
-                    return RepositoryChange(
-                        repository_path=str(repo_path),
+                    return index, RepositoryChange(
+                        repository_path=os.fspath(repo_path),
                         repository_name=repo_path.name,
-                        timestamp=datetime.now().isoformat(),
+                        timestamp=batch_timestamp,
                         has_uncommitted_changes=False,
                         uncommitted_files=[],
                         recent_commits=[],
@@ -90,30 +261,67 @@ class DiffProcessor:
                         error=str(e),
                     )
 
-        tasks = [process_single_repo(repo) for repo in repositories]
-        return await asyncio.gather(*tasks)
+        tasks = [
+            asyncio.ensure_future(process_single_repo(index, repo))
+            for index, repo in enumerate(repositories)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave repositories being processed
+            for task in tasks:
+                task.cancel()
+            if self.clean_cache:
+                self.clean_cache.save()
 
-    async def _detect_repository_changes(self, repo_path: Path) -> RepositoryChange:
+    async def _detect_repository_changes(
+        self, repo_path: Path, timestamp: str | None = None
+    ) -> RepositoryChange:
         """
         Detect changes in a single repository.
+
+        Args:
+            repo_path: Path to the repository
+            timestamp: Scan timestamp to record; batch callers pass one shared
+                value instead of formatting the current time per repository
         """
-        timestamp = datetime.now().isoformat()
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
+        # Shared by the success and error results below
+        repo_str = os.fspath(repo_path)
+        repo_name = repo_path.name
+
+        if self.clean_cache:
+            cached_change = self._fast_clean_check(repo_path, timestamp)
+            if cached_change is not None:
+                return cached_change
 
         try:
-            current_branch = await self.git_manager.get_current_branch(repo_path)
-            diff_info = await self.git_manager.diff_files(repo_path)
+            diff_info = await self.git_manager.collect_repo_snapshot(
+                repo_path, commit_limit=5
+            )
+            current_branch = diff_info.get("current_branch")
             has_changes = diff_info.get("has_changes", False)
 
             uncommitted_files = []
             if has_changes:
-                status_output = diff_info.get("status_output", "")
-                uncommitted_files = self._parse_git_status(status_output, repo_path)
+                uncommitted_files = self._parse_git_status(
+                    diff_info["status_records"], repo_path
+                )
+                if self.embed_content and self.content_engine:
+                    await self._embed_file_contents(uncommitted_files, repo_path)
+
+            recent_commits = diff_info["recent_commits"]
 
-            recent_commits = await self._get_recent_commits(repo_path, limit=5)
+            if self.clean_cache:
+                self._record_clean_state(
+                    repo_path, has_changes, current_branch, recent_commits
+                )
 
             return RepositoryChange(
-                repository_path=str(repo_path),
-                repository_name=repo_path.name,
+                repository_path=repo_str,
+                repository_name=repo_name,
                 timestamp=timestamp,
                 has_uncommitted_changes=has_changes,
                 uncommitted_files=uncommitted_files,
@@ -126,8 +334,8 @@ class DiffProcessor:
         except Exception as e:
             logger.debug(f"Repository {repo_path} change detection failed: {e}")
             return RepositoryChange(
-                repository_path=str(repo_path),
-                repository_name=repo_path.name,
+                repository_path=repo_str,
+                repository_name=repo_name,
                 timestamp=timestamp,
                 has_uncommitted_changes=False,
                 uncommitted_files=[],
@@ -137,75 +345,158 @@ class DiffProcessor:
                 error=str(e),
             )
 
+    def _fast_clean_check(
+        self, repo_path: Path, timestamp: str
+    ) -> RepositoryChange | None:
+        """
+        Return a clean result without running git if the repo is unchanged.
+
+        Returns:
+            A clean RepositoryChange built from the cached branch and commits
+            when the repository's fingerprint matches the one recorded the
+            last time it was clean, otherwise None
+        """
+        fingerprint = repo_fingerprint(repo_path)
+        if fingerprint is None:
+            return None
+        cached = self.clean_cache.get(repo_path, fingerprint)
+        if cached is None:
+            return None
+        return RepositoryChange(
+            repository_path=os.fspath(repo_path),
+            repository_name=repo_path.name,
+            timestamp=timestamp,
+            has_uncommitted_changes=False,
+            uncommitted_files=[],
+            recent_commits=cached["recent_commits"],
+            current_branch=cached["current_branch"],
+            git_status="clean",
+            error=None,
+        )
+
+    def _record_clean_state(
+        self,
+        repo_path: Path,
+        has_changes: bool,
+        current_branch: str | None,
+        recent_commits: list[dict[str, Any]],
+    ) -> None:
+        """Remember a clean repository's fingerprint; forget dirty ones."""
+        # Fingerprint after the scan: git status may itself rewrite the index
+        fingerprint = None if has_changes else repo_fingerprint(repo_path)
+        if fingerprint is None:
+            self.clean_cache.discard(repo_path)
+            return
+        self.clean_cache.put(
+            repo_path,
+            fingerprint,
+            {"current_branch": current_branch, "recent_commits": recent_commits},
+        )
+
     def _parse_git_status(
-        self, status_output: str, repo_path: Path
+        self, status_records: Iterable[str], repo_path: Path
     ) -> list[dict[str, Any]]:
         """
-        Parse git status output into structured file change information.
+        Parse git status --porcelain=v2 records into file changes.
+
+        Record types are dispatched on their first character: ``1`` ordinary
+        changes, ``2`` renames/copies (followed by an extra original-path
+        record), ``u`` unmerged entries and ``?`` untracked files. Header
+        (``#``) and ignored (``!``) records are skipped.
         """
         files = []
-        for line in status_output.strip().split("\n"):
-            if not line:
+        append = files.append
+        xy_fields = _XY_FIELDS
+        records = iter(status_records)
+        for record in records:
+            kind = record[:1]
+            original_filename = None
+
+            if kind == "1":
+                # 1 XY sub mH mI mW hH hI path
+                fields = record.split(" ", 8)
+                xy, filename = fields[1], fields[8]
+            elif kind == "2":
+                # 2 XY sub mH mI mW hH hI Xscore path, then orig path record
+                fields = record.split(" ", 9)
+                xy, filename = fields[1], fields[9]
+                original_filename = next(records, None)
+            elif kind == "u":
+                # u XY sub m1 m2 m3 mW h1 h2 h3 path
+                fields = record.split(" ", 10)
+                xy, filename = fields[1], fields[10]
+            elif kind == "?":
+                xy, filename = "??", record[2:]
+            else:
                 continue
 
-            if len(line) >= 3:
-                index_status = line[0]
-                worktree_status = line[1]
-                filename = line[2:].lstrip()
+            fields_for_xy = xy_fields.get(xy)
+            if fields_for_xy is None:
+                # Unexpected status letter: fall back to the generic rules
+                index_status = " " if xy[0] == "." else xy[0]
+                worktree_status = " " if xy[1] == "." else xy[1]
+                change_type = self._interpret_git_status_codes(
+                    index_status, worktree_status
+                )
+            else:
+                index_status, worktree_status, change_type = fields_for_xy
 
-                file_info = {
-                    "filename": filename,
-                    "index_status": index_status,
-                    "worktree_status": worktree_status,
-                    "change_type": self._interpret_git_status_codes(
-                        index_status, worktree_status
-                    ),
-                }
+            file_info = {
+                "filename": filename,
+                "index_status": index_status,
+                "worktree_status": worktree_status,
+                "change_type": change_type,
+            }
+            if original_filename is not None:
+                file_info["original_filename"] = original_filename
 
-                if self.embed_content and self.content_engine:
-                    try:
-                        file_path = repo_path / filename
-                        if file_path.exists():
-                            embedded_content = self.content_engine.embed_file_content(
-                                file_path
-                            )
-                            file_info["embedded_content"] = asdict(embedded_content)
-                    except Exception as e:
-                        logger.debug(f"Failed to embed content for {filename}: {e}")
-                        file_info["embedded_content"] = {"error": str(e)}
-
-                files.append(file_info)
+            append(file_info)
 
         return files
 
-    def _interpret_git_status_codes(self, index: str, worktree: str) -> str:
-        """Interpret git status codes into human-readable change types."""
-        if index == "A":
-            return "added"
-        if index == "M":
-            return "modified"
-        if index == "D":
-            return "deleted"
-        if index == "R":
-            return "renamed"
-        if index == "C":
-            return "copied"
-        if worktree == "M":
-            return "modified"
-        if worktree == "D":
-            return "deleted"
-        if index == "?" and worktree == "?":
-            return "untracked"
-        return "unknown"
-
-    async def _get_recent_commits(
-        self, repo_path: Path, limit: int = 5
-    ) -> list[dict[str, Any]]:
+    async def _embed_file_contents(
+        self, files: list[dict[str, Any]], repo_path: Path
+    ) -> None:
         """
-        Get recent commit information from the repository.
+        Embed content for all existing changed files in a single batch.
+
+        File stats and reads are blocking, so the whole batch runs in one
+        worker thread to keep the event loop free for other repositories.
         """
+        await asyncio.to_thread(self._embed_file_contents_blocking, files, repo_path)
+
+    def _embed_file_contents_blocking(
+        self, files: list[dict[str, Any]], repo_path: Path
+    ) -> None:
+        """Stat and embed changed files; runs off the event loop."""
+        pending = []
+        for file_info in files:
+            file_path = repo_path / file_info["filename"]
+            try:
+                if file_path.exists():
+                    pending.append((file_info, file_path))
+            except OSError as e:
+                logger.debug(
+                    f"Failed to embed content for {file_info['filename']}: {e}"
+                )
+                file_info["embedded_content"] = {"error": str(e)}
+
+        if not pending:
+            return
+
         try:
-            return await self.git_manager.get_recent_commits(repo_path, limit)
+            embedded = self.content_engine.embed_files_batch(
+                [file_path for _, file_path in pending]
+            )
         except Exception as e:
-            logger.debug(f"Could not get recent commits for {repo_path}: {e}")
-            return []
+            logger.debug(f"Failed to embed content in {repo_path}: {e}")
+            for file_info, _ in pending:
+                file_info["embedded_content"] = {"error": str(e)}
+            return
+
+        for file_info, file_path in pending:
+            file_info["embedded_content"] = embedded[file_path].to_dict()
+
+    def _interpret_git_status_codes(self, index: str, worktree: str) -> str:
+        """Interpret git status codes into human-readable change types."""
+        return _CHANGE_TYPES.get((index, worktree), "unknown")
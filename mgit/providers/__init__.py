@@ -4,17 +4,18 @@ This package provides the abstract base class and supporting infrastructure
 for implementing multi-provider support in mgit.
 """
 
+from typing import TYPE_CHECKING
+
 # Base classes and data structures
-# Import and register providers
-from .azdevops import AzureDevOpsProvider
 from .base import (
     AuthMethod,
     GitProvider,
     Organization,
     Project,
     Repository,
+    compile_repo_filter,
+    dump_repositories,
 )
-from .bitbucket import BitBucketProvider
 
 # Exceptions
 from .exceptions import (
@@ -28,12 +29,12 @@ from .exceptions import (
     ProviderError,
     ProviderNotFoundError,
     RateLimitError,
+    RateLimitExceededError,
     RepositoryNotFoundError,
 )
 
 # Factory pattern
 from .factory import ProviderFactory
-from .github import GitHubProvider
 
 # Registry pattern
 from .registry import (
@@ -46,22 +47,41 @@ from .registry import (
     get_provider_info,
     is_registered,
     list_providers,
+    load_provider_class,
     register_provider,
     unregister_provider,
 )
 
-# Register available providers (Factory pattern)
-ProviderFactory.register_provider("azuredevops", AzureDevOpsProvider)
-ProviderFactory.register_provider("azdevops", AzureDevOpsProvider)  # Alias
-ProviderFactory.register_provider("azure", AzureDevOpsProvider)  # Alias
-ProviderFactory.register_provider("github", GitHubProvider)
-ProviderFactory.register_provider("bitbucket", BitBucketProvider)
+if TYPE_CHECKING:
+    from .azdevops import AzureDevOpsProvider
+    from .bitbucket import BitBucketProvider
+    from .github import GitHubProvider
+
+# Provider implementations pull in their HTTP/SDK dependencies, so they are
+# registered by "module:Class" spec and only imported when first used
+_LAZY_PROVIDERS = {
+    "AzureDevOpsProvider": "mgit.providers.azdevops:AzureDevOpsProvider",
+    "GitHubProvider": "mgit.providers.github:GitHubProvider",
+    "BitBucketProvider": "mgit.providers.bitbucket:BitBucketProvider",
+}
+
+# Register canonical names once; aliases such as "azure" are resolved by the
+# registry. The guard keeps re-imports (e.g. importlib.reload) idempotent.
+if not is_registered("github"):
+    register_provider("azuredevops", _LAZY_PROVIDERS["AzureDevOpsProvider"])
+    register_provider("github", _LAZY_PROVIDERS["GitHubProvider"])
+    register_provider("bitbucket", _LAZY_PROVIDERS["BitBucketProvider"])
+
+
+def __getattr__(name: str):
+    """Import provider classes on first attribute access (PEP 562)."""
+    spec = _LAZY_PROVIDERS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class = load_provider_class(spec)
+    globals()[name] = provider_class
+    return provider_class
 
-# Register with registry (new pattern)
-register_provider("azuredevops", AzureDevOpsProvider)  # Primary name
-register_provider("azure", AzureDevOpsProvider)  # Alias
-register_provider("github", GitHubProvider)
-register_provider("bitbucket", BitBucketProvider)
 
 __all__ = [
     # Base classes
@@ -70,6 +90,8 @@ __all__ = [
     "Organization",
     "Project",
     "AuthMethod",
+    "compile_repo_filter",
+    "dump_repositories",
     # Factory
     "ProviderFactory",
     # Registry
@@ -90,6 +112,7 @@ __all__ = [
     "ConfigurationError",
     "ConnectionError",
     "RateLimitError",
+    "RateLimitExceededError",
     "ProviderNotFoundError",
     "RepositoryNotFoundError",
     "OrganizationNotFoundError",
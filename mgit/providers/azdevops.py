@@ -4,6 +4,7 @@ This module implements the Azure DevOps provider that extends the abstract
 GitProvider base class to support Azure DevOps repositories.
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncIterator
 from typing import Any
@@ -33,6 +34,7 @@ class AzureDevOpsProvider(GitProvider):
     PROVIDER_NAME = "azuredevops"
     SUPPORTED_AUTH_METHODS = [AuthMethod.PAT]
     DEFAULT_API_VERSION = "7.1"
+    LISTS_REPOSITORIES_PER_PROJECT = True
 
     def __init__(self, config: dict[str, Any]):
         """Initialize Azure DevOps provider.
@@ -250,13 +252,15 @@ class AzureDevOpsProvider(GitProvider):
                 return
 
             # List repositories in the project
-            repos: list[GitRepository] = self.git_client.get_repositories(
-                project=project_details.id
+            # The SDK blocks; run it off the event loop so projects can be
+            # listed concurrently
+            repos: list[GitRepository] = await asyncio.to_thread(
+                self.git_client.get_repositories, project=project_details.id
             )
 
             for repo in repos:
                 # Convert SDK GitRepository to our Repository model
-                repository = Repository(
+                repository = Repository._from_api(
                     name=repo.name,
                     clone_url=repo.remote_url,
                     organization=organization,
@@ -372,7 +376,9 @@ class AzureDevOpsProvider(GitProvider):
             return None
 
         try:
-            return self.core_client.get_project(project_name_or_id)
+            return await asyncio.to_thread(
+                self.core_client.get_project, project_name_or_id
+            )
         except Exception as e:
             logger.error("Failed to get project '%s': %s", project_name_or_id, e)
             return None
@@ -16,18 +16,163 @@ Usage:
 """
 
 import asyncio
+import functools
+import json
+import logging
+import random
+import re
+import sys
 import time
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from dataclasses import dataclass, field
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar
 
-from mgit.providers.exceptions import RepositoryNotFoundError
+from mgit.providers.exceptions import RateLimitExceededError, RepositoryNotFoundError
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is used without it
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Jitter source for rate limit backoff, created once rather than per wait
+_RNG = random.Random()
+
+# Common rate limit headers across providers: info key -> header spellings
+_RATE_LIMIT_HEADERS = (
+    ("limit", ("X-RateLimit-Limit", "X-Rate-Limit-Limit")),
+    ("remaining", ("X-RateLimit-Remaining", "X-Rate-Limit-Remaining")),
+    ("reset", ("X-RateLimit-Reset", "X-Rate-Limit-Reset")),
+)
+
+# Shared read-only stand-in for records without provider-specific metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_rate_limiter_config() -> dict[str, Any]:
+    """Read the rate_limiter global settings, filling in defaults."""
+    # Import here to avoid circular imports
+    from ..config.yaml_manager import get_global_config
+
+    rate_limiter_config = get_global_config().get("rate_limiter", {})
+    return {
+        "max_wait_seconds": rate_limiter_config.get("max_wait_seconds", 300),
+        "exponential_rate": rate_limiter_config.get("exponential_rate", 2.0),
+        "backoff_max_seconds": rate_limiter_config.get("backoff_max_seconds", 60.0),
+    }
+
+
+class RateLimitInfo(NamedTuple):
+    """Rate limit state parsed from a provider's response headers."""
+
+    limit: int = 0
+    remaining: int = 0
+    reset: int = 0  # Epoch seconds
+    used: int = 0
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _with_serializers(cls):
+    """
+    Attach generated ``to_dict()``/``to_json_bytes()`` methods to a dataclass.
+
+    ``dataclasses.asdict()`` walks every value recursively and deep-copies it;
+    records here only hold scalars plus the metadata dict, so a flat dict
+    literal emitted once per class does the same job far more cheaply. Fields
+    whose default is None are omitted while unset, and metadata is copied
+    shallowly so callers can't mutate the record through the result.
+
+    Args:
+        cls: Dataclass to extend
+
+    Returns:
+        The same class
+    """
+
+    def emit(name: str) -> str:
+        return f"dict(self.{name})" if name == "metadata" else f"self.{name}"
+
+    required = [f for f in fields(cls) if f.default is not None]
+    optional = [f for f in fields(cls) if f.default is None]
+    items = ", ".join(f"{f.name!r}: {emit(f.name)}" for f in required)
+    lines = ["def to_dict(self):", f"    d = {{{items}}}"]
+    for f in optional:
+        lines.append(f"    if self.{f.name} is not None:")
+        lines.append(f"        d[{f.name!r}] = {emit(f.name)}")
+    lines.append("    return d")
+
+    namespace: dict[str, Any] = {}
+    exec("\n".join(lines), {}, namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = "Convert to a plain dict, omitting unset optional fields."
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON."""
+        return _dumps_json(self.to_dict())
+
+    to_json_bytes.__qualname__ = f"{cls.__qualname__}.to_json_bytes"
+    cls.to_dict = to_dict
+    cls.to_json_bytes = to_json_bytes
+    return cls
+
+
+def _with_fast_constructor(cls):
+    """
+    Attach a generated ``_from_api()`` constructor to a slotted dataclass.
+
+    The generated function takes the same parameters as ``__init__`` but
+    writes each slot through its descriptor, skipping the frozen-dataclass
+    ``object.__setattr__`` dispatch. Providers use it when converting large
+    API listings. No validation or ``__post_init__`` is run.
+
+    Args:
+        cls: Slotted dataclass whose fields all have plain (non-factory) defaults
+
+    Returns:
+        The same class
+    """
+    params = []
+    namespace: dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    body = ["    self = _new(_cls)"]
+    for f in fields(cls):
+        if f.default is MISSING:
+            params.append(f.name)
+        else:
+            namespace[f"_default_{f.name}"] = f.default
+            params.append(f"{f.name}=_default_{f.name}")
+        namespace[f"_set_{f.name}"] = getattr(cls, f.name).__set__
+        body.append(f"    _set_{f.name}(self, {f.name})")
+    body.append("    return self")
+
+    exec(f"def _from_api({', '.join(params)}):\n" + "\n".join(body), namespace)
+    from_api = namespace["_from_api"]
+    from_api.__qualname__ = f"{cls.__qualname__}._from_api"
+    cls._from_api = staticmethod(from_api)
+    return cls
 
 
 # Common data structures
-@dataclass
+#
+# Records are immutable and hashable (metadata is excluded from the hash);
+# use dataclasses.replace() to derive a modified copy.
+@_with_fast_constructor
+@_with_serializers
+@dataclass(slots=True, frozen=True)
 class Repository:
     """Provider-agnostic repository representation."""
 
@@ -44,27 +189,130 @@ class Repository:
     created_at: str | None = None
     updated_at: str | None = None
     provider: str = ""
-    metadata: dict[str, Any] = field(default_factory=dict)  # Provider-specific data
+    # Provider-specific data; None when there is none
+    metadata: dict[str, Any] | None = field(default=None, hash=False)
 
+    @property
+    def meta(self) -> Mapping[str, Any]:
+        """Provider-specific data, or an empty mapping when there is none."""
+        return self.metadata or _EMPTY_METADATA
 
-@dataclass
+
+@_with_serializers
+@dataclass(slots=True, frozen=True)
 class Organization:
     """Provider-agnostic organization/workspace representation."""
 
     name: str
     url: str
     provider: str
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] | None = field(default=None, hash=False)
+
+    @property
+    def meta(self) -> Mapping[str, Any]:
+        """Provider-specific data, or an empty mapping when there is none."""
+        return self.metadata or _EMPTY_METADATA
 
 
-@dataclass
+@_with_serializers
+@dataclass(slots=True, frozen=True)
 class Project:
     """Project/grouping representation (may be None for GitHub)."""
 
     name: str
     organization: str
     description: str | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] | None = field(default=None, hash=False)
+
+    @property
+    def meta(self) -> Mapping[str, Any]:
+        """Provider-specific data, or an empty mapping when there is none."""
+        return self.metadata or _EMPTY_METADATA
+
+
+def _accept_all(repo: Repository) -> bool:
+    return True
+
+
+def compile_repo_filter(
+    filters: dict[str, Any] | None,
+) -> Callable[[Repository], bool]:
+    """
+    Build a predicate for the common list_repositories() filters.
+
+    Everything that can be prepared up front (the name regex, the
+    updated_after timestamp) is prepared once here, so providers can call
+    the predicate for every repository they fetch.
+
+    Supported keys:
+        - archived: bool, matched against metadata["archived"]
+        - language: str, matched against metadata["language"]
+        - visibility: 'public', 'private' or 'all'
+        - name_pattern: regex searched in the repository name
+        - updated_after: datetime; repositories without updated_at are excluded
+        - size_max_kb: int; repositories without a size are kept
+
+    Args:
+        filters: Filters as passed to list_repositories(), or None
+
+    Returns:
+        A callable returning True for repositories that match every filter
+    """
+    if not filters:
+        return _accept_all
+
+    archived = filters.get("archived")
+    language = filters.get("language")
+    visibility = filters.get("visibility")
+    want_private = {"public": False, "private": True}.get(visibility)
+    name_search = (
+        re.compile(filters["name_pattern"]).search
+        if filters.get("name_pattern")
+        else None
+    )
+    updated_after = filters.get("updated_after")
+    updated_after_ts = updated_after.timestamp() if updated_after else None
+    size_max_kb = filters.get("size_max_kb")
+
+    def predicate(repo: Repository) -> bool:
+        meta = repo.meta
+        if archived is not None and bool(meta.get("archived", False)) != archived:
+            return False
+        if language is not None and meta.get("language") != language:
+            return False
+        if want_private is not None and repo.is_private != want_private:
+            return False
+        if name_search is not None and name_search(repo.name) is None:
+            return False
+        if updated_after_ts is not None:
+            if not repo.updated_at:
+                return False
+            updated = datetime.fromisoformat(repo.updated_at.replace("Z", "+00:00"))
+            if updated.timestamp() <= updated_after_ts:
+                return False
+        if size_max_kb is not None and repo.size is not None:
+            if repo.size > size_max_kb:
+                return False
+        return True
+
+    return predicate
+
+
+def dump_repositories(repos: Iterable[Repository]) -> bytes:
+    """
+    Serialize repository records to a compact JSON array.
+
+    Each record is emitted as its to_dict() form, so the output matches
+    Repository.to_json_bytes() element by element. orjson is used when it is
+    installed, otherwise the stdlib json module.
+
+    Args:
+        repos: Repositories (or other provider records) to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return _dumps_json([repo.to_dict() for repo in repos])
 
 
 class AuthMethod(Enum):
@@ -87,15 +335,47 @@ class GitProvider(ABC):
         PROVIDER_NAME: Unique identifier for the provider (e.g., 'github', 'gitlab')
         SUPPORTED_AUTH_METHODS: List of authentication methods this provider supports
         DEFAULT_API_VERSION: Default API version to use for this provider
+        CAPABILITIES: Features reported by get_provider_info()
+        LIMITATIONS: Known limitations reported by get_provider_info()
+        LISTS_REPOSITORIES_PER_PROJECT: Whether listing requires a project
+        METADATA_CACHE_TTL: Seconds cached repository/organization lookups stay fresh
         config: Provider-specific configuration dictionary
         _client: Internal client instance for API communication
         _authenticated: Boolean flag indicating authentication status
     """
 
+    # Slots for the state every provider carries; subclasses that don't
+    # declare __slots__ keep a __dict__ for their own attributes
+    __slots__ = (
+        "config",
+        "_client",
+        "_authenticated",
+        "_rate_limiter_config",
+        "_rate_limit_info",
+        "_retry_count_attr",
+        "_metadata_cache",
+        "_etag_store",
+    )
+
     # Class attributes to be overridden by subclasses
     PROVIDER_NAME: str = ""
     SUPPORTED_AUTH_METHODS: list[AuthMethod] = []
     DEFAULT_API_VERSION: str = ""
+    # Static parts of get_provider_info(); immutable so they can be shared
+    CAPABILITIES: tuple[str, ...] = ("repositories", "organizations", "authentication")
+    LIMITATIONS: tuple[str, ...] = ()
+    # True if list_repositories() needs a project, so organization-wide
+    # counts have to be summed per project
+    LISTS_REPOSITORIES_PER_PROJECT: bool = False
+    # Seconds a cached get_repository/list_organizations result stays fresh
+    METADATA_CACHE_TTL: float = 60.0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Repository.provider is set from PROVIDER_NAME for every record, so
+        # they all share this one string; interning it lets names parsed from
+        # config or URLs compare against it by identity
+        cls.PROVIDER_NAME = sys.intern(cls.PROVIDER_NAME)
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize provider with configuration.
@@ -119,7 +399,15 @@ class GitProvider(ABC):
 
         # Rate limiter configuration
         self._rate_limiter_config = self._get_rate_limiter_config()
-        self._rate_limit_info: dict[str, Any] | None = None
+        self._rate_limit_info: RateLimitInfo | None = None
+        self._retry_count_attr = 0
+
+        # Conditional request cache: key -> (ETag, parsed JSON body)
+        self._etag_store: dict[str, tuple[str, Any]] = {}
+
+        # Recent get_repository/list_organizations results:
+        # key -> (monotonic time fetched, shared request)
+        self._metadata_cache: dict[tuple[Any, ...], tuple[float, asyncio.Future]] = {}
 
     @abstractmethod
     def _validate_config(self) -> None:
@@ -247,6 +535,7 @@ class GitProvider(ABC):
                 - name_pattern: str - Regex pattern for repository names
                 - updated_after: datetime - Only repos updated after this date
                 - size_max_kb: int - Maximum repository size in KB
+                compile_repo_filter() builds a predicate for these keys.
 
         Yields:
             Repository: Repository objects matching the criteria
@@ -315,9 +604,10 @@ class GitProvider(ABC):
     ) -> int:
         """Count total repositories matching criteria.
 
-        This is a utility method that counts repositories by iterating through
-        list_repositories. Providers may override this with more efficient
-        implementations if their API supports direct counting.
+        Uses _count_repositories_fast() when the provider can answer with a
+        single API call, otherwise counts iter_repository_names. Without a
+        project, providers that list repositories per project
+        (LISTS_REPOSITORIES_PER_PROJECT) count each project concurrently.
 
         Args:
             organization: Organization/workspace name
@@ -330,10 +620,142 @@ class GitProvider(ABC):
         Raises:
             Same exceptions as list_repositories
         """
-        count = 0
-        async for _ in self.list_repositories(organization, project, filters):
-            count += 1
-        return count
+        count = await self._count_repositories_fast(organization, project, filters)
+        if count is not None:
+            return count
+
+        if project is None and self.LISTS_REPOSITORIES_PER_PROJECT:
+            # Count every project concurrently rather than one after another
+            projects = await self.list_projects(organization)
+            counts = await self._gather_pages(
+                functools.partial(
+                    self.count_repositories, organization, p.name, filters
+                )
+                for p in projects
+            )
+            return sum(counts)
+
+        names = self.iter_repository_names(organization, project, filters)
+        return sum([1 async for _ in names])
+
+    async def iter_repository_names(
+        self,
+        organization: str,
+        project: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the names of repositories matching criteria.
+
+        The default takes names from list_repositories. Providers can
+        override this to stream names straight from API rows without
+        building Repository objects.
+
+        Args:
+            organization: Organization/workspace name
+            project: Optional project name
+            filters: Optional filters to apply
+
+        Yields:
+            str: Repository names
+
+        Raises:
+            Same exceptions as list_repositories
+        """
+        async for repository in self.list_repositories(organization, project, filters):
+            yield repository.name
+
+    async def _count_repositories_fast(
+        self,
+        organization: str,
+        project: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> int | None:
+        """Count repositories with a single API call, if the provider can.
+
+        Providers whose API exposes a total (a count field, a total header,
+        etc.) override this. Returning None makes count_repositories fall
+        back to paginating through list_repositories.
+
+        Args:
+            organization: Organization/workspace name
+            project: Optional project name
+            filters: Optional filters to apply
+
+        Returns:
+            Optional[int]: Repository count, or None if not cheaply available
+        """
+        return None
+
+    async def get_repository_cached(
+        self,
+        organization: str,
+        repository: str,
+        project: str | None = None,
+        ttl: float | None = None,
+    ) -> Repository | None:
+        """Get a repository, reusing a recent result for the same key.
+
+        Concurrent calls for the same repository share one request. Failed
+        lookups are not cached.
+
+        Args:
+            organization: Organization/workspace name
+            repository: Repository name (without organization prefix)
+            project: Optional project name
+            ttl: Seconds a result stays fresh (default: METADATA_CACHE_TTL)
+
+        Returns:
+            Optional[Repository]: Same as get_repository
+
+        Raises:
+            Same exceptions as get_repository
+        """
+        return await self._cached_call(
+            ("repository", organization, project, repository),
+            ttl,
+            lambda: self.get_repository(organization, repository, project),
+        )
+
+    async def list_organizations_cached(
+        self, ttl: float | None = None
+    ) -> list[Organization]:
+        """List organizations, reusing a recent result.
+
+        Args:
+            ttl: Seconds a result stays fresh (default: METADATA_CACHE_TTL)
+
+        Returns:
+            List[Organization]: Same as list_organizations
+
+        Raises:
+            Same exceptions as list_organizations
+        """
+        return await self._cached_call(("organizations",), ttl, self.list_organizations)
+
+    async def _cached_call(
+        self,
+        key: tuple[Any, ...],
+        ttl: float | None,
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Return a fresh cached result for key, or fetch and cache it."""
+        ttl = self.METADATA_CACHE_TTL if ttl is None else ttl
+        now = time.monotonic()
+        entry = self._metadata_cache.get(key)
+        if entry is None or now - entry[0] >= ttl:
+            task = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda done: self._forget_failed_call(key, done))
+            entry = (now, task)
+            self._metadata_cache[key] = entry
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(entry[1])
+
+    def _forget_failed_call(self, key: tuple[Any, ...], task: asyncio.Future) -> None:
+        """Drop a cache entry whose request failed or was cancelled."""
+        if task.cancelled() or task.exception() is not None:
+            entry = self._metadata_cache.get(key)
+            if entry is not None and entry[1] is task:
+                del self._metadata_cache[key]
 
     def supports_projects(self) -> bool:
         """Check if provider supports project hierarchy.
@@ -391,20 +813,16 @@ class GitProvider(ABC):
             Dict[str, Any]: Provider information including:
                 - name: Provider name
                 - version: API version being used
-                - capabilities: List of supported features
-                - limitations: Known limitations or restrictions
+                - capabilities: Tuple of supported features (CAPABILITIES)
+                - limitations: Tuple of known limitations (LIMITATIONS)
                 - authenticated: Current authentication status
                 - base_url: API base URL (if applicable)
         """
         return {
             "name": self.PROVIDER_NAME,
             "version": self.DEFAULT_API_VERSION,
-            "capabilities": [
-                "repositories",
-                "organizations",
-                "authentication",
-            ],
-            "limitations": [],
+            "capabilities": self.CAPABILITIES,
+            "limitations": self.LIMITATIONS,
             "authenticated": self._authenticated,
             "base_url": self.config.get("base_url", "N/A"),
             "supports_projects": self.supports_projects(),
@@ -438,7 +856,7 @@ class GitProvider(ABC):
             APIError: If the API request fails
         """
         try:
-            repo = await self.get_repository(organization, repository, project)
+            repo = await self.get_repository_cached(organization, repository, project)
             return repo is not None
         except (PermissionError, RepositoryNotFoundError):
             return False
@@ -450,18 +868,11 @@ class GitProvider(ABC):
         - max_wait_seconds: Maximum time to wait for rate limit reset (default: 300)
         - exponential_rate: Base multiplier for exponential backoff (default: 2.0)
         - backoff_max_seconds: Maximum backoff delay (default: 60.0)
-        """
-        # Import here to avoid circular imports
-        from ..config.yaml_manager import get_global_config
 
-        global_config = get_global_config()
-        rate_limiter_config = global_config.get("rate_limiter", {})
-
-        return {
-            "max_wait_seconds": rate_limiter_config.get("max_wait_seconds", 300),
-            "exponential_rate": rate_limiter_config.get("exponential_rate", 2.0),
-            "backoff_max_seconds": rate_limiter_config.get("backoff_max_seconds", 60.0),
-        }
+        The global config is read once per process; each provider gets its
+        own copy of the result.
+        """
+        return dict(_cached_rate_limiter_config())
 
     async def _wait_for_rate_limit(self) -> None:
         """Wait if we're close to rate limit or if rate limited.
@@ -475,38 +886,35 @@ class GitProvider(ABC):
         if not self._rate_limit_info:
             return
 
-        remaining = self._rate_limit_info.get("remaining", 0)
-        reset_time = self._rate_limit_info.get("reset", 0)
+        remaining = self._rate_limit_info.remaining
+        reset_time = self._rate_limit_info.reset
 
         # Check if we need to wait (when 1 or fewer requests remaining)
         if remaining <= 1:
-            now = int(time.time())
-            if reset_time > now:
-                wait_seconds = reset_time - now + 1  # Add 1 second buffer
-
+            # reset is an epoch timestamp, so compare against wall-clock time
+            until_reset = reset_time - time.time() + 1  # Add 1 second buffer
+            if until_reset > 1:
                 # Respect max wait time
                 max_wait = self._rate_limiter_config["max_wait_seconds"]
-                if wait_seconds > max_wait:
-                    raise Exception(
-                        f"Rate limit wait time ({wait_seconds}s) exceeds maximum ({max_wait}s)"
+                if until_reset > max_wait:
+                    raise RateLimitExceededError(
+                        until_reset,
+                        max_wait,
+                        self.PROVIDER_NAME,
+                        datetime.fromtimestamp(reset_time),
                     )
 
-                # Use exponential backoff with configurable multiplier
+                # Exponential backoff (1s, multiplied by the rate each retry),
+                # never waiting past the reset or the configured maximum
                 multiplier = self._rate_limiter_config["exponential_rate"]
                 max_backoff = self._rate_limiter_config["backoff_max_seconds"]
-                retry_count = self._retry_count()
-                exponential_wait = 1.0 * (
-                    multiplier**retry_count
-                )  # Start at 1s, multiply by rate each retry
-                wait_seconds = min(exponential_wait, max_backoff)
+                exponential_wait = float(multiplier ** self._retry_count())
+                wait_seconds = min(until_reset, exponential_wait, max_backoff)
 
                 # Add jitter to prevent thundering herd (0.1-1.0 seconds)
-                import random
+                wait_seconds += _RNG.uniform(0.1, 1.0)
 
-                jitter = random.uniform(0.1, 1.0)
-                wait_seconds += jitter
-
-                print(f"Rate limit: waiting {wait_seconds:.1f}s until reset")
+                logger.warning("Rate limit: waiting %.1fs until reset", wait_seconds)
                 await asyncio.sleep(wait_seconds)
 
                 # Reset rate limit info after waiting
@@ -514,12 +922,10 @@ class GitProvider(ABC):
 
     def _retry_count(self) -> int:
         """Get current retry count for exponential backoff."""
-        return getattr(self, "_retry_count_attr", 0)
+        return self._retry_count_attr
 
     def _increment_retry_count(self) -> None:
         """Increment retry count for exponential backoff."""
-        if not hasattr(self, "_retry_count_attr"):
-            self._retry_count_attr = 0
         self._retry_count_attr += 1
 
     def _reset_retry_count(self) -> None:
@@ -538,23 +944,17 @@ class GitProvider(ABC):
         # Default implementation - providers can override for their specific headers
         headers = getattr(response, "headers", {})
 
-        # Common rate limit headers across providers
-        rate_limit_headers = {
-            "limit": headers.get("X-RateLimit-Limit")
-            or headers.get("X-Rate-Limit-Limit"),
-            "remaining": headers.get("X-RateLimit-Remaining")
-            or headers.get("X-Rate-Limit-Remaining"),
-            "reset": headers.get("X-RateLimit-Reset")
-            or headers.get("X-Rate-Limit-Reset"),
-        }
+        info = {}
+        for key, candidates in _RATE_LIMIT_HEADERS:
+            for header in candidates:
+                value = headers.get(header)
+                if value:
+                    info[key] = int(value)
+                    break
 
         # Only update if we have at least one header
-        if any(rate_limit_headers.values()):
-            self._rate_limit_info = {
-                "limit": int(rate_limit_headers["limit"] or 0),
-                "remaining": int(rate_limit_headers["remaining"] or 0),
-                "reset": int(rate_limit_headers["reset"] or 0),
-            }
+        if info:
+            self._rate_limit_info = RateLimitInfo(**info)
 
     async def _make_rate_limited_request(self, request_func, *args, **kwargs):
         """Make a request with automatic rate limit handling.
@@ -575,10 +975,107 @@ class GitProvider(ABC):
         # Check and update rate limit info
         await self._check_rate_limit(response)
 
-        # Reset retry count on successful response
-        if hasattr(response, "status") and 200 <= response.status < 300:
+        # Reset retry count on successful (or not-modified) response
+        status = getattr(response, "status", None)
+        if status is not None and (200 <= status < 300 or status == 304):
             self._reset_retry_count()
         else:
             self._increment_retry_count()
 
         return response
+
+    async def _make_conditional_request(
+        self, request_func, *args, cache_key: str, **kwargs
+    ) -> tuple[int, Any]:
+        """Make a rate limited GET that revalidates a cached JSON body by ETag.
+
+        The ETag stored for cache_key is sent as If-None-Match; a 304 reply
+        (which providers such as GitHub don't count against the rate limit)
+        returns the stored body without transferring it again.
+
+        Args:
+            request_func: Function that makes the HTTP request (e.g. session.get)
+            *args, **kwargs: Arguments to pass to request_func
+            cache_key: Identifies the resource in the ETag store,
+                       e.g. f"org:{organization}"
+
+        Returns:
+            Tuple of (status, parsed JSON body). A 304 is reported as 200 with
+            the stored body; other non-200 statuses return a None body.
+        """
+        cached = self._etag_store.get(cache_key)
+        if cached is not None:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "If-None-Match": cached[0],
+            }
+
+        response = await self._make_rate_limited_request(request_func, *args, **kwargs)
+        async with response:
+            if response.status == 304 and cached is not None:
+                return 200, cached[1]
+            if response.status != 200:
+                return response.status, None
+            body = await response.json()
+            etag = response.headers.get("ETag")
+
+        if etag:
+            self._etag_store[cache_key] = (etag, body)
+        return 200, body
+
+    async def _iter_page_windows(
+        self,
+        fetchers: Iterable[Callable[[], Awaitable[T]]],
+        window: int = 5,
+    ) -> AsyncIterator[T]:
+        """Yield page fetch results in order, fetching `window` pages at a time.
+
+        A window is only fetched once the consumer has taken every result of
+        the previous one, so a caller that stops early (e.g. ``--limit``)
+        doesn't pay for, or spend rate limit on, pages it never reads.
+
+        Args:
+            fetchers: Zero-argument async callables, one per page
+            window: Number of pages fetched concurrently per window
+
+        Yields:
+            Results of the fetchers, in the order they were given
+        """
+        batch: list[Callable[[], Awaitable[T]]] = []
+        for fetcher in fetchers:
+            batch.append(fetcher)
+            if len(batch) >= window:
+                for result in await self._gather_pages(batch, concurrency=window):
+                    yield result
+                batch = []
+        if batch:
+            for result in await self._gather_pages(batch, concurrency=window):
+                yield result
+
+    async def _gather_pages(
+        self,
+        fetchers: Iterable[Callable[[], Awaitable[T]]],
+        concurrency: int = 5,
+    ) -> list[T]:
+        """Run independent page fetches concurrently with bounded parallelism.
+
+        Providers use this to fetch pages 2..N of a listing once the first
+        page has revealed how many pages there are. Each fetch waits for the
+        shared rate limit budget before it starts; fetchers are expected to
+        update it from their responses via _check_rate_limit().
+
+        Args:
+            fetchers: Zero-argument async callables, one per page
+            concurrency: Maximum number of fetches in flight at once
+
+        Returns:
+            Results of the fetchers, in the order they were given
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(fetcher: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                await self._wait_for_rate_limit()
+                return await fetcher()
+
+        return list(await asyncio.gather(*(run(fetcher) for fetcher in fetchers)))
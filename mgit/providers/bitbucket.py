@@ -18,7 +18,14 @@ from ..security.credentials import mask_sensitive_data
 from ..security.logging import SecurityLogger
 from ..security.monitor import get_security_monitor
 from ..security.validation import SecurityValidator
-from .base import AuthMethod, GitProvider, Organization, Project, Repository
+from .base import (
+    AuthMethod,
+    GitProvider,
+    Organization,
+    Project,
+    RateLimitInfo,
+    Repository,
+)
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -84,7 +91,7 @@ class BitBucketProvider(GitProvider):
         self.auth_method = "token"
         self._session: aiohttp.ClientSession | None = None
         self.logger = SecurityLogger(__name__)
-        self._rate_limit_info: dict[str, Any] | None = None
+        self._rate_limit_info: RateLimitInfo | None = None
 
         super().__init__(config)
 
@@ -395,20 +402,7 @@ class BitBucketProvider(GitProvider):
                 yield  # Make this an async generator (but unreachable)
 
         url = f"{self.url}/repositories/{workspace_to_use}"
-
-        # Add query parameters for filters
-        params = {}
-        if filters:
-            if "language" in filters:
-                params["q"] = f'language="{filters["language"]}"'
-            if "is_private" in filters:
-                private_filter = (
-                    "is_private=true" if filters["is_private"] else "is_private=false"
-                )
-                if "q" in params:
-                    params["q"] += f" AND {private_filter}"
-                else:
-                    params["q"] = private_filter
+        params = self._repository_query_params(filters)
 
         try:
             # Handle pagination
@@ -437,6 +431,62 @@ class BitBucketProvider(GitProvider):
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Network error while listing repositories: {e}")
 
+    @staticmethod
+    def _repository_query_params(filters: dict[str, Any] | None) -> dict[str, str]:
+        """Build the BBQL query parameters for repository list filters."""
+        params = {}
+        if filters:
+            if "language" in filters:
+                params["q"] = f'language="{filters["language"]}"'
+            if "is_private" in filters:
+                private_filter = (
+                    "is_private=true" if filters["is_private"] else "is_private=false"
+                )
+                if "q" in params:
+                    params["q"] += f" AND {private_filter}"
+                else:
+                    params["q"] = private_filter
+        return params
+
+    async def _count_repositories_fast(
+        self,
+        organization: str,
+        project: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> int | None:
+        """Count workspace repositories from the paginated response's size.
+
+        Requests only the ``size`` field, so one small response replaces
+        walking every page of repositories.
+        """
+        if organization not in ("*", self.workspace):
+            # Mirrors list_repositories, which yields nothing in this case
+            return 0
+        if not await self.authenticate():
+            return None
+
+        await self._ensure_session()
+        params = self._repository_query_params(filters)
+        params["fields"] = "size"
+
+        try:
+            response = await self._make_rate_limited_request(
+                self._session.get,
+                f"{self.url}/repositories/{self.workspace}",
+                headers=self._get_auth_headers(),
+                params=params,
+            )
+            async with response:
+                if response.status != 200:
+                    return None
+                data = await response.json()
+        except aiohttp.ClientError as e:
+            self.logger.debug(f"Fast repository count failed for {organization}: {e}")
+            return None
+
+        size = data.get("size")
+        return size if isinstance(size, int) else None
+
     async def get_repository(
         self, organization: str, repository: str, project: str | None = None
     ) -> Repository | None:
@@ -529,9 +579,9 @@ class BitBucketProvider(GitProvider):
         """
         if self._rate_limit_info:
             return {
-                "limit": self._rate_limit_info.get("limit", 0),
-                "remaining": self._rate_limit_info.get("remaining", 0),
-                "reset": self._rate_limit_info.get("reset", 0),
+                "limit": self._rate_limit_info.limit,
+                "remaining": self._rate_limit_info.remaining,
+                "reset": self._rate_limit_info.reset,
             }
         return None
 
@@ -543,11 +593,11 @@ class BitBucketProvider(GitProvider):
         """
         # Update rate limit info from headers
         if "X-RateLimit-Limit" in response.headers:
-            self._rate_limit_info = {
-                "limit": int(response.headers.get("X-RateLimit-Limit", 0)),
-                "remaining": int(response.headers.get("X-RateLimit-Remaining", 0)),
-                "reset": int(response.headers.get("X-RateLimit-Reset", 0)),
-            }
+            self._rate_limit_info = RateLimitInfo(
+                limit=int(response.headers.get("X-RateLimit-Limit", 0)),
+                remaining=int(response.headers.get("X-RateLimit-Remaining", 0)),
+                reset=int(response.headers.get("X-RateLimit-Reset", 0)),
+            )
 
     @classmethod
     def match_url(cls, url: str) -> bool:
@@ -610,7 +660,7 @@ class BitBucketProvider(GitProvider):
                 "key"
             )
 
-        return Repository(
+        return Repository._from_api(
             name=repo_data["name"],
             clone_url=clone_url,
             organization=workspace,
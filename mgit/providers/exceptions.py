@@ -46,6 +46,32 @@ class RateLimitError(BaseProviderError):
             self.details = f"{self.details}, Reset time: {reset_time.isoformat()}"
 
 
+class RateLimitExceededError(RateLimitError):
+    """Rate limit reset is further away than the configured maximum wait."""
+
+    def __init__(
+        self,
+        wait_seconds: float,
+        max_wait: float,
+        provider: str,
+        reset_time: datetime | None = None,
+    ):
+        """Initialize rate limit exceeded error.
+
+        Args:
+            wait_seconds: Seconds until the rate limit resets
+            max_wait: Maximum wait allowed by the rate_limiter configuration
+            provider: The provider that hit the rate limit
+            reset_time: When the rate limit will reset
+        """
+        message = (
+            f"Rate limit wait time ({wait_seconds:.0f}s) exceeds maximum ({max_wait}s)"
+        )
+        super().__init__(message, provider, reset_time)
+        self.wait_seconds = wait_seconds
+        self.max_wait = max_wait
+
+
 class ProviderNotFoundError(BaseProviderError):
     """Provider type not found."""
 
@@ -126,6 +152,7 @@ __all__ = [
     "ProjectNotFoundError",
     # Provider-specific exceptions
     "RateLimitError",
+    "RateLimitExceededError",
     "ProviderNotFoundError",
     "RepositoryNotFoundError",
     "PermissionError",
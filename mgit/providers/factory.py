@@ -1,28 +1,31 @@
 """Provider factory for creating git provider instances.
 
 This module implements the factory pattern for creating provider instances
-based on provider type and configuration.
+based on provider type and configuration. Registrations are stored in the
+shared ProviderRegistry, so both entry points see the same providers.
 """
 
 from typing import Any
 
 from .base import GitProvider
+from .registry import ProviderRegistry
 
 
 class ProviderFactory:
     """Factory for creating provider instances."""
 
-    _providers: dict[str, type[GitProvider]] = {}
-
     @classmethod
-    def register_provider(cls, name: str, provider_class: type[GitProvider]) -> None:
+    def register_provider(
+        cls, name: str, provider_class: type[GitProvider] | str
+    ) -> None:
         """Register a new provider type.
 
         Args:
             name: Provider name (e.g., 'azuredevops', 'github', 'bitbucket')
-            provider_class: Provider class that inherits from GitProvider
+            provider_class: Provider class that inherits from GitProvider, or a
+                "module:Class" spec to import lazily on first use
         """
-        cls._providers[name.lower()] = provider_class
+        ProviderRegistry().register_provider(name, provider_class, validate=False)
 
     @classmethod
     def create_provider(cls, provider_type: str, config: dict[str, Any]) -> GitProvider:
@@ -38,14 +41,14 @@ class ProviderFactory:
         Raises:
             ValueError: If provider type is unknown
         """
-        provider_class = cls._providers.get(provider_type.lower())
-        if not provider_class:
+        registry = ProviderRegistry()
+        if not registry.is_registered(provider_type):
             raise ValueError(
                 f"Unknown provider type: {provider_type}. "
-                f"Available: {', '.join(cls._providers.keys())}"
+                f"Available: {', '.join(registry.list_providers())}"
             )
 
-        return provider_class(config)
+        return registry.get_provider(provider_type, config)
 
     @classmethod
     def list_providers(cls) -> list[str]:
@@ -54,7 +57,7 @@ class ProviderFactory:
         Returns:
             List of registered provider names
         """
-        return list(cls._providers.keys())
+        return ProviderRegistry().list_providers()
 
     @classmethod
     def is_registered(cls, provider_type: str) -> bool:
@@ -66,7 +69,7 @@ class ProviderFactory:
         Returns:
             bool: True if provider is registered
         """
-        return provider_type.lower() in cls._providers
+        return ProviderRegistry().is_registered(provider_type)
 
     @classmethod
     def unregister_provider(cls, name: str) -> None:
@@ -75,4 +78,4 @@ class ProviderFactory:
         Args:
             name: Provider name to unregister
         """
-        cls._providers.pop(name.lower(), None)
+        ProviderRegistry().unregister_provider(name)
@@ -5,6 +5,7 @@ operations through the GitHub API.
 """
 
 import asyncio
+import functools
 import re
 from collections.abc import AsyncIterator
 from datetime import datetime
@@ -18,7 +19,15 @@ from ..security.credentials import mask_sensitive_data
 from ..security.logging import SecurityLogger
 from ..security.monitor import get_security_monitor
 from ..security.validation import SecurityValidator
-from .base import AuthMethod, GitProvider, Organization, Project, Repository
+from .base import (
+    AuthMethod,
+    GitProvider,
+    Organization,
+    Project,
+    RateLimitInfo,
+    Repository,
+    compile_repo_filter,
+)
 from .exceptions import (
     APIError,
     AuthenticationError,
@@ -31,6 +40,12 @@ from .exceptions import (
 
 logger = SecurityLogger(__name__)
 
+# Page number of the rel="last" entry in a pagination Link header
+_LAST_PAGE_PATTERN = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Fine-grained personal access tokens; classic tokens use ghp_ and friends
+_FINE_GRAINED_TOKEN_PREFIX = "github_pat_"
+
 
 class GitHubProvider(GitProvider):
     """GitHub provider implementation.
@@ -90,7 +105,7 @@ class GitHubProvider(GitProvider):
         # HTTP session for API calls
         self._session: aiohttp.ClientSession | None = None
         self._headers: dict[str, str] = {}
-        self._rate_limit_info: dict[str, Any] | None = None
+        self._rate_limit_info: RateLimitInfo | None = None
 
         super().__init__(config)
 
@@ -282,7 +297,13 @@ class GitHubProvider(GitProvider):
             async with self._session.get(url, headers=self._headers) as response:
                 if response.status == 200:
                     rate_limit_data = await response.json()
-                    self._rate_limit_info = rate_limit_data.get("rate", {})
+                    rate = rate_limit_data.get("rate", {})
+                    self._rate_limit_info = RateLimitInfo(
+                        limit=rate.get("limit", 0),
+                        remaining=rate.get("remaining", 0),
+                        reset=rate.get("reset", 0),
+                        used=rate.get("used", 0),
+                    )
                     logger.debug("GitHub connection test successful")
                     return True
                 else:
@@ -416,6 +437,45 @@ class GitHubProvider(GitProvider):
         Yields:
             Repository objects
 
+        Raises:
+            APIError: If API call fails
+            RateLimitError: If rate limit exceeded
+        """
+        matches = compile_repo_filter(filters)
+        async for repo in self._iter_repo_data(organization, filters):
+            repository = self._convert_repo_data(repo)
+            if matches(repository):
+                yield repository
+
+    async def iter_repository_names(
+        self,
+        organization: str,
+        project: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield repository names straight from the API rows.
+
+        Filtered listings need full Repository objects for the filter
+        predicate, so those go through list_repositories instead.
+        """
+        if filters:
+            async for name in super().iter_repository_names(
+                organization, project, filters
+            ):
+                yield name
+            return
+
+        async for repo in self._iter_repo_data(organization, filters):
+            yield repo["name"]
+
+    async def _iter_repo_data(
+        self, organization: str, filters: dict[str, Any] | None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield raw repository rows for an organization or user, in page order.
+
+        Only the filters GitHub applies server-side (type, visibility) are
+        used here.
+
         Raises:
             APIError: If API call fails
             RateLimitError: If rate limit exceeded
@@ -437,6 +497,7 @@ class GitHubProvider(GitProvider):
                     params["visibility"] = filters["visibility"]
 
             # Paginate through all repositories
+            remaining_pages: range | None = None
             while True:
                 async with self._session.get(
                     url, headers=self._headers, params=params
@@ -450,24 +511,7 @@ class GitHubProvider(GitProvider):
                             break
 
                         for repo in repos_data:
-                            # Apply additional filters
-                            if filters:
-                                if (
-                                    "language" in filters
-                                    and repo.get("language") != filters["language"]
-                                ):
-                                    continue
-                                if "archived" in filters:
-                                    if (
-                                        filters["archived"] is False
-                                        and repo.get("archived", False)
-                                        or filters["archived"] is True
-                                        and not repo.get("archived", False)
-                                    ):
-                                        continue
-
-                            repository = self._convert_repo_data(repo)
-                            yield repository
+                            yield repo
 
                         # Prepare for next page
                         params["page"] += 1
@@ -477,6 +521,13 @@ class GitHubProvider(GitProvider):
                         if 'rel="next"' not in link_header:
                             break
 
+                        # The first page tells us how many there are; fetch
+                        # the rest a few at a time instead of one by one
+                        last_page = self._last_page_number(link_header)
+                        if last_page is not None:
+                            remaining_pages = range(params["page"], last_page + 1)
+                            break
+
                     elif response.status == 404:
                         # Try user repos endpoint instead
                         if "/orgs/" in url:
@@ -511,12 +562,106 @@ class GitHubProvider(GitProvider):
                             response.status,
                         )
 
+            if remaining_pages:
+                pages = self._iter_page_windows(
+                    functools.partial(
+                        self._fetch_repo_page, url, {**params, "page": page}
+                    )
+                    for page in remaining_pages
+                )
+                async for repos_data in pages:
+                    for repo in repos_data:
+                        yield repo
+
         except RateLimitError:
             raise
         except Exception as e:
             logger.error("Error listing GitHub repositories: %s", e)
             raise APIError(f"Failed to list repositories: {e}", self.PROVIDER_NAME)
 
+    @staticmethod
+    def _last_page_number(link_header: str) -> int | None:
+        """Return the page number of the Link header's rel="last" URL."""
+        match = _LAST_PAGE_PATTERN.search(link_header)
+        return int(match.group(1)) if match else None
+
+    async def _fetch_repo_page(
+        self, url: str, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Fetch one page of a repository listing.
+
+        Args:
+            url: Repository list endpoint
+            params: Query parameters, including the page number
+
+        Returns:
+            Raw repository data for the page
+
+        Raises:
+            RateLimitError: If rate limit exceeded
+            APIError: If the request fails
+        """
+        async with self._session.get(
+            url, headers=self._headers, params=params
+        ) as response:
+            await self._check_rate_limit(response)
+            if response.status == 200:
+                return await response.json()
+            if response.status == 403:
+                error_data = await response.json()
+                if "rate limit" in error_data.get("message", "").lower():
+                    raise RateLimitError(
+                        "GitHub API rate limit exceeded", self.PROVIDER_NAME
+                    )
+            raise APIError(
+                f"Failed to list repositories: status {response.status}",
+                self.PROVIDER_NAME,
+                response.status,
+            )
+
+    async def _count_repositories_fast(
+        self,
+        organization: str,
+        project: str | None = None,
+        filters: dict[str, Any] | None = None,
+    ) -> int | None:
+        """Count an organization's repositories from its profile.
+
+        Uses the public/private repository totals on GET /orgs/{org}, sent
+        with If-None-Match so an unchanged organization costs a 304 (which
+        GitHub does not charge against the rate limit). Filtered counts and
+        user accounts fall back to listing, as do totals that wouldn't match
+        it: a non-owner's (GitHub omits the private total) and a fine-grained
+        token's when the organization has private repositories.
+        """
+        if filters or not await self.authenticate():
+            return None
+
+        await self._ensure_session()
+        try:
+            status, org_data = await self._make_conditional_request(
+                self._session.get,
+                f"{self.url}/orgs/{organization}",
+                headers=self._headers,
+                cache_key=f"org:{organization}",
+            )
+        except aiohttp.ClientError as e:
+            logger.debug("Fast repository count failed for %s: %s", organization, e)
+            return None
+        if status != 200:
+            return None
+
+        # GitHub returns total_private_repos only to org owners. Anyone else
+        # may still list the private repos they can see, which public_repos
+        # doesn't include, so only an owner's totals can match the listing.
+        private_repos = org_data.get("total_private_repos")
+        if private_repos is None:
+            return None
+        # A fine-grained token lists only the private repos it was granted
+        if private_repos and self.token.startswith(_FINE_GRAINED_TOKEN_PREFIX):
+            return None
+        return org_data.get("public_repos", 0) + private_repos
+
     async def list_accessible_repositories(
         self,
         filters: dict[str, Any] | None = None,
@@ -566,6 +711,8 @@ class GitHubProvider(GitProvider):
                 if "direction" in filters:
                     params["direction"] = filters["direction"]
 
+            matches = compile_repo_filter(filters)
+
             while True:
                 async with self._session.get(
                     url, headers=self._headers, params=params
@@ -579,22 +726,9 @@ class GitHubProvider(GitProvider):
                             break
 
                         for repo in repos_data:
-                            if filters:
-                                if (
-                                    "language" in filters
-                                    and repo.get("language") != filters["language"]
-                                ):
-                                    continue
-                                if "archived" in filters:
-                                    if (
-                                        filters["archived"] is False
-                                        and repo.get("archived", False)
-                                        or filters["archived"] is True
-                                        and not repo.get("archived", False)
-                                    ):
-                                        continue
-
-                            yield self._convert_repo_data(repo)
+                            repository = self._convert_repo_data(repo)
+                            if matches(repository):
+                                yield repository
 
                         params["page"] += 1
 
@@ -743,12 +877,7 @@ class GitHubProvider(GitProvider):
                 - used: Calls used
         """
         if self._rate_limit_info:
-            return {
-                "limit": self._rate_limit_info.get("limit", 0),
-                "remaining": self._rate_limit_info.get("remaining", 0),
-                "reset": self._rate_limit_info.get("reset", 0),
-                "used": self._rate_limit_info.get("used", 0),
-            }
+            return self._rate_limit_info._asdict()
         return None
 
     @classmethod
@@ -777,20 +906,20 @@ class GitHubProvider(GitProvider):
         """
         # Update rate limit info from headers
         if "X-RateLimit-Limit" in response.headers:
-            self._rate_limit_info = {
-                "limit": int(response.headers.get("X-RateLimit-Limit", 0)),
-                "remaining": int(response.headers.get("X-RateLimit-Remaining", 0)),
-                "reset": int(response.headers.get("X-RateLimit-Reset", 0)),
-                "used": int(response.headers.get("X-RateLimit-Used", 0)),
-            }
+            self._rate_limit_info = RateLimitInfo(
+                limit=int(response.headers.get("X-RateLimit-Limit", 0)),
+                remaining=int(response.headers.get("X-RateLimit-Remaining", 0)),
+                reset=int(response.headers.get("X-RateLimit-Reset", 0)),
+                used=int(response.headers.get("X-RateLimit-Used", 0)),
+            )
 
         # Check if rate limit exceeded
         if response.status == 403:
             error_data = await response.json()
             if "rate limit" in error_data.get("message", "").lower():
                 reset_time = None
-                if self._rate_limit_info and self._rate_limit_info.get("reset"):
-                    reset_time = datetime.fromtimestamp(self._rate_limit_info["reset"])
+                if self._rate_limit_info and self._rate_limit_info.reset:
+                    reset_time = datetime.fromtimestamp(self._rate_limit_info.reset)
                 raise RateLimitError(
                     "GitHub API rate limit exceeded", self.PROVIDER_NAME, reset_time
                 )
@@ -804,7 +933,7 @@ class GitHubProvider(GitProvider):
         Returns:
             Repository object
         """
-        return Repository(
+        return Repository._from_api(
             name=repo_data["name"],
             clone_url=repo_data["clone_url"],
             organization=repo_data.get("owner", {}).get("login"),
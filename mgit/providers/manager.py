@@ -386,11 +386,13 @@ class ProviderManager:
                 is_disabled = repository.get("is_disabled", False)
 
             # Use the exact provider config that discovered this repo (if stamped)
-            config_name = getattr(repository, "metadata", {}).get(
+            config_name = (getattr(repository, "metadata", None) or {}).get(
                 "provider_config_name"
             )
             if not config_name and isinstance(repository, dict):
-                config_name = repository.get("metadata", {}).get("provider_config_name")
+                config_name = (repository.get("metadata") or {}).get(
+                    "provider_config_name"
+                )
 
             if config_name:
                 try:
@@ -19,6 +19,19 @@ from .exceptions import ConfigurationError, ProviderNotFoundError
 logger = logging.getLogger(__name__)
 
 
+def load_provider_class(spec: str) -> type[GitProvider]:
+    """Import a provider class from a ``"package.module:ClassName"`` spec.
+
+    Args:
+        spec: Dotted module path and class name separated by a colon
+
+    Returns:
+        The provider class
+    """
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 class ProviderRegistry:
     """Singleton registry for managing git provider implementations.
 
@@ -33,6 +46,12 @@ class ProviderRegistry:
     _instance: Optional["ProviderRegistry"] = None
     _initialized: bool = False
 
+    # Alternative names accepted wherever a provider type is looked up
+    ALIASES: dict[str, str] = {
+        "azdevops": "azuredevops",
+        "azure": "azuredevops",
+    }
+
     # URL patterns for each provider type
     # Order matters - more specific patterns should come first
     URL_PATTERNS: list[tuple[re.Pattern, str]] = [
@@ -74,44 +93,76 @@ class ProviderRegistry:
     def __init__(self):
         """Initialize the registry (only once due to singleton)."""
         if not self._initialized:
-            self._providers: dict[str, type[GitProvider]] = {}
+            # Lazily registered providers hold a "module:Class" spec until
+            # first use
+            self._providers: dict[str, type[GitProvider] | str] = {}
             self._provider_instances: dict[str, GitProvider] = {}
             self._auto_discovered = False
             ProviderRegistry._initialized = True
             logger.debug("ProviderRegistry initialized")
 
     def register_provider(
-        self, name: str, provider_class: type[GitProvider], validate: bool = True
+        self,
+        name: str,
+        provider_class: type[GitProvider] | str,
+        validate: bool = True,
     ) -> None:
         """Register a provider class.
 
         Args:
             name: Provider name (e.g., 'azuredevops', 'github', 'bitbucket')
-            provider_class: Provider class that inherits from GitProvider
+            provider_class: Provider class that inherits from GitProvider, or a
+                "module:Class" spec to import (and validate) on first use
             validate: Whether to validate the provider implementation
 
         Raises:
             ConfigurationError: If provider doesn't properly implement GitProvider
         """
         name = name.lower()
+        is_lazy = isinstance(provider_class, str)
+        display_name = provider_class if is_lazy else provider_class.__name__
 
-        if validate:
+        if validate and not is_lazy:
             self._validate_provider_class(name, provider_class)
 
         if name in self._providers:
             logger.warning(
                 "Overwriting existing provider '%s' with %s",
                 name,
-                provider_class.__name__,
+                display_name,
             )
 
         self._providers[name] = provider_class
-        logger.info("Registered provider '%s' -> %s", name, provider_class.__name__)
+        logger.info("Registered provider '%s' -> %s", name, display_name)
 
         # Clear any cached instance of this provider
         if name in self._provider_instances:
             del self._provider_instances[name]
 
+    def _canonical_name(self, provider_type: str) -> str:
+        """Lowercase a provider type and map aliases to the registered name."""
+        name = provider_type.lower()
+        return self.ALIASES.get(name, name)
+
+    def _resolve_provider_class(self, name: str) -> type[GitProvider]:
+        """Return the class registered under *name*, importing it if lazy.
+
+        Args:
+            name: Registered (lowercase) provider name
+
+        Returns:
+            The provider class
+
+        Raises:
+            ConfigurationError: If a lazily imported class fails validation
+        """
+        provider_class = self._providers[name]
+        if isinstance(provider_class, str):
+            provider_class = load_provider_class(provider_class)
+            self._validate_provider_class(name, provider_class)
+            self._providers[name] = provider_class
+        return provider_class
+
     def _validate_provider_class(
         self, name: str, provider_class: type[GitProvider]
     ) -> None:
@@ -199,18 +250,18 @@ class ProviderRegistry:
         Raises:
             ProviderNotFoundError: If provider type is unknown
         """
-        # Ensure auto-discovery has run
-        if not self._auto_discovered:
-            self.auto_discover()
+        provider_type = self._canonical_name(provider_type)
 
-        provider_type = provider_type.lower()
+        # Only scan the package when the provider isn't registered up front
+        if provider_type not in self._providers and not self._auto_discovered:
+            self.auto_discover()
 
         if provider_type not in self._providers:
             raise ProviderNotFoundError(provider_type)
 
         # For now, always create a new instance
         # In the future, we might want to cache based on config hash
-        provider_class = self._providers[provider_type]
+        provider_class = self._resolve_provider_class(provider_type)
         return provider_class(config)
 
     def get_provider_by_url(
@@ -303,7 +354,7 @@ class ProviderRegistry:
         Returns:
             bool: True if provider is registered
         """
-        return provider_type.lower() in self._providers
+        return self._canonical_name(provider_type) in self._providers
 
     def unregister_provider(self, name: str) -> None:
         """Unregister a provider type.
@@ -311,7 +362,7 @@ class ProviderRegistry:
         Args:
             name: Provider name to unregister
         """
-        name = name.lower()
+        name = self._canonical_name(name)
 
         if name in self._providers:
             del self._providers[name]
@@ -404,12 +455,12 @@ class ProviderRegistry:
         Raises:
             ProviderNotFoundError: If provider not found
         """
-        provider_type = provider_type.lower()
+        provider_type = self._canonical_name(provider_type)
 
         if provider_type not in self._providers:
             raise ProviderNotFoundError(provider_type)
 
-        provider_class = self._providers[provider_type]
+        provider_class = self._resolve_provider_class(provider_type)
 
         return {
             "name": provider_type,
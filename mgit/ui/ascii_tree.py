@@ -9,16 +9,26 @@ Renders a conifer tree (cone foliage + cylinder trunk) with:
 - ANSI color support (green foliage, brown trunk)
 """
 
+import functools
+import itertools
 import math
+import threading
+from array import array
+from collections.abc import Callable
 
 # Character luminance gradient (dark to bright)
 LUMINANCE_CHARS = " .,-~:;=!*#$@"
+_LUMINANCE_BYTES = LUMINANCE_CHARS.encode("ascii")
 
 # ANSI color codes
 COLOR_GREEN = "\033[92m"  # Bright green for foliage
 COLOR_BROWN = "\033[38;5;130m"  # Brown for trunk
 COLOR_RESET = "\033[0m"
 
+# Per-cell color codes stored in the color buffer, indexing _COLOR_CODES
+_NO_COLOR, _GREEN, _BROWN = 0, 1, 2
+_COLOR_CODES = ("", COLOR_GREEN, COLOR_BROWN)
+
 # Tree dimensions (in world units, centered at y=0)
 FOLIAGE_HEIGHT = 2.5  # Cone height
 FOLIAGE_RADIUS = 1.5  # Base radius of cone
@@ -31,6 +41,47 @@ SCREEN_WIDTH = 60
 SCREEN_HEIGHT = 24
 K1 = 30  # Projection scaling factor
 K2 = 6  # Distance from viewer to center
+_SCREEN_CELLS = SCREEN_WIDTH * SCREEN_HEIGHT
+
+# Cleared contents of the screen, z- and color buffers
+_BLANK_OUTPUT = b" " * _SCREEN_CELLS
+_BLANK_ZBUFFER = bytes(8 * _SCREEN_CELLS)  # array("d") of zeros
+_BLANK_COLORS = bytes(_SCREEN_CELLS)
+
+# Per-thread frame buffers, reused across frames
+_frame_state = threading.local()
+
+# Surface sampling steps (theta in radians, h as a fraction of the height)
+THETA_STEP = 0.03
+H_STEP = 0.012
+# Vertical sampling density to aim for, in samples per screen row spanned
+SAMPLES_PER_ROW = 5
+
+
+def _accumulate(step: float, stop: float) -> list[float]:
+    """Return 0, step, 2*step, ... below stop, summed the way the grid walks."""
+    values = []
+    value = 0.0
+    while value < stop:
+        values.append(value)
+        value += step
+    return values
+
+
+# Sampling grid and its trig tables, built once per process
+_THETAS = _accumulate(THETA_STEP, 2 * math.pi)
+_THETA_COS = [math.cos(theta) for theta in _THETAS]
+_THETA_SIN = [math.sin(theta) for theta in _THETAS]
+_HS = _accumulate(H_STEP, 1.0)
+
+# Back-face culling applies to the trunk only: the cone is open at the base,
+# so its inner surface shows below the foliage. The trunk's open bottom is
+# only seen into when tilted up beyond this (radians).
+TRUNK_CULL_MAX_TILT = 0.5
+
+# Cone normal: (cos(theta), slope, sin(theta)) normalized
+_CONE_SLOPE = FOLIAGE_RADIUS / FOLIAGE_HEIGHT
+_CONE_NORMAL_LEN = math.sqrt(1 + _CONE_SLOPE * _CONE_SLOPE)
 
 # Light direction (from upper-right, normalized)
 _light_len = math.sqrt(0.4**2 + 0.8**2 + 0.4**2)
@@ -39,6 +90,11 @@ LIGHT_Y = 0.8 / _light_len
 LIGHT_Z = -0.4 / _light_len
 
 
+# A surface sample: (x, y, z, nx, ny, nz) - position and surface normal
+Sample = tuple[float, float, float, float, float, float]
+SampleFn = Callable[[float, float, float], Sample]
+
+
 def _rotate_point(
     x: float, y: float, z: float, sin_a: float, cos_a: float, sin_b: float, cos_b: float
 ) -> tuple[float, float, float]:
@@ -54,13 +110,11 @@ def _rotate_point(
     return x1, y1, z2
 
 
-def _sample_cone_surface(
-    theta: float, h: float
-) -> tuple[float, float, float, float, float, float]:
+def _sample_cone_surface(cos_t: float, sin_t: float, h: float) -> Sample:
     """
     Sample a point on the cone surface (foliage).
 
-    theta: angle around the cone (0 to 2*pi)
+    cos_t, sin_t: cosine and sine of the angle around the cone
     h: height along the cone (0 at base, 1 at tip)
 
     Returns: (x, y, z, nx, ny, nz) - position and surface normal
@@ -69,44 +123,184 @@ def _sample_cone_surface(
     radius = FOLIAGE_RADIUS * (1 - h)
 
     # Position on cone surface (centered at origin)
-    x = radius * math.cos(theta)
-    z = radius * math.sin(theta)
+    x = radius * cos_t
+    z = radius * sin_t
     y = h * FOLIAGE_HEIGHT + TRUNK_HEIGHT - TREE_CENTER_Y  # Center vertically
 
     # Surface normal for cone: points outward and upward
-    # Normal direction: (cos(theta), slope, sin(theta)) normalized
-    slope = FOLIAGE_RADIUS / FOLIAGE_HEIGHT
-    normal_len = math.sqrt(1 + slope * slope)
-    nx = math.cos(theta) / normal_len
-    ny = slope / normal_len
-    nz = math.sin(theta) / normal_len
+    nx = cos_t / _CONE_NORMAL_LEN
+    ny = _CONE_SLOPE / _CONE_NORMAL_LEN
+    nz = sin_t / _CONE_NORMAL_LEN
 
     return x, y, z, nx, ny, nz
 
 
-def _sample_trunk_surface(
-    theta: float, h: float
-) -> tuple[float, float, float, float, float, float]:
+def _sample_trunk_surface(cos_t: float, sin_t: float, h: float) -> Sample:
     """
     Sample a point on the trunk cylinder.
 
-    theta: angle around the cylinder (0 to 2*pi)
+    cos_t, sin_t: cosine and sine of the angle around the cylinder
     h: height along trunk (0 to 1)
 
     Returns: (x, y, z, nx, ny, nz) - position and surface normal
     """
-    x = TRUNK_RADIUS * math.cos(theta)
-    z = TRUNK_RADIUS * math.sin(theta)
+    x = TRUNK_RADIUS * cos_t
+    z = TRUNK_RADIUS * sin_t
     y = h * TRUNK_HEIGHT - TREE_CENTER_Y  # Center vertically
 
     # Normal for cylinder: points straight outward horizontally
-    nx = math.cos(theta)
+    nx = cos_t
     ny = 0.0
-    nz = math.sin(theta)
+    nz = sin_t
 
     return x, y, z, nx, ny, nz
 
 
+def _h_stride(height: float, radius: float) -> int:
+    """
+    Return how many h grid steps to advance per sample for a surface.
+
+    H_STEP is sized for the foliage; a smaller surface spans fewer screen
+    rows, so sampling it as finely only maps many samples onto each cell.
+
+    height: world-space height of the surface
+    radius: its largest radius (its nearest approach to the viewer)
+
+    Returns: stride giving about SAMPLES_PER_ROW samples per row spanned
+    """
+    rows = height * K1 / (K2 - radius)  # Projected height at its closest
+    return max(1, int(len(_HS) / (rows * SAMPLES_PER_ROW)))
+
+
+def _sample_surface(sample_fn: SampleFn, h_stride: int = 1) -> list[Sample]:
+    """Sample a surface over the theta/h grid, in render order."""
+    hs = _HS[::h_stride]
+    return [
+        sample_fn(cos_t, sin_t, h)
+        for cos_t, sin_t in zip(_THETA_COS, _THETA_SIN, strict=True)
+        for h in hs
+    ]
+
+
+@functools.cache
+def _surface_samples() -> tuple[list[Sample], list[Sample]]:
+    """
+    Return the (cone, trunk) surface samples.
+
+    Positions and normals don't depend on the rotation, so they are computed
+    once per process; each frame only rotates, projects and shades them.
+    """
+    return (
+        _sample_surface(
+            _sample_cone_surface, _h_stride(FOLIAGE_HEIGHT, FOLIAGE_RADIUS)
+        ),
+        _sample_surface(_sample_trunk_surface, _h_stride(TRUNK_HEIGHT, TRUNK_RADIUS)),
+    )
+
+
+def _rasterize_surface(
+    samples: list[Sample],
+    color: int,
+    rotation: tuple[float, float, float, float],
+    light: tuple[float, float, float],
+    output: bytearray,
+    zbuffer: array,
+    colors: bytearray,
+    back_face_offset: float | None = None,
+) -> None:
+    """
+    Rotate, project and shade surface samples into the frame buffers.
+
+    This is the per-sample hot loop, so module constants are bound to
+    locals once per call and the _rotate_point() transform is inlined.
+
+    samples: surface samples from _surface_samples()
+    color: color code for this surface (an index into _COLOR_CODES)
+    rotation: (sin_a, cos_a, sin_b, cos_b) for tilt and spin
+    light: rotated light direction for this frame
+    output, zbuffer, colors: flat row-major screen buffers, updated in place
+    back_face_offset: if given, cull samples facing away from the viewer;
+        this is normal . position, which must be constant over the surface
+        (the radius, for a cylinder about the Y axis)
+    """
+    sin_a, cos_a, sin_b, cos_b = rotation
+    light_x, light_y, light_z = light
+    width = SCREEN_WIDTH
+    height = SCREEN_HEIGHT
+    half_width = SCREEN_WIDTH / 2
+    half_height = SCREEN_HEIGHT / 2
+    chars = _LUMINANCE_BYTES
+    max_idx = len(_LUMINANCE_BYTES) - 1
+
+    cull = back_face_offset is not None
+
+    for x, y, z, nx, ny, nz in samples:
+        nz1 = -nx * sin_b + nz * cos_b
+        rnz = ny * sin_a + nz1 * cos_a
+
+        # The viewer sits at z = -K2, so a sample faces away when its normal
+        # points along the view ray: n . p + K2 * rnz >= 0 (dot products are
+        # unchanged by the rotation)
+        if cull and back_face_offset + K2 * rnz >= 0:
+            continue
+
+        # Apply rotation (same operation order as _rotate_point)
+        rx = x * cos_b + z * sin_b
+        z1 = -x * sin_b + z * cos_b
+        ry = y * cos_a - z1 * sin_a
+        rz = y * sin_a + z1 * cos_a
+
+        # Perspective projection
+        ooz = 1 / (rz + K2)
+        xp = int(half_width + K1 * ooz * rx)
+        yp = int(half_height - K1 * ooz * ry)  # Invert Y for screen coords
+
+        # Occlusion test first; hidden samples skip the normal and shading
+        if not (0 <= xp < width and 0 <= yp < height):
+            continue
+        idx = yp * width + xp
+        if ooz <= zbuffer[idx]:
+            continue
+        zbuffer[idx] = ooz
+
+        rnx = nx * cos_b + nz * sin_b
+        rny = ny * cos_a - nz1 * sin_a
+
+        # Calculate luminance (dot product with rotating light direction)
+        luminance = rnx * light_x + rny * light_y + rnz * light_z
+
+        # Map luminance (-1 to 1) to a character byte. Normals and the light
+        # are unit vectors, so rounding can't push the index out of range
+        # (int() truncates a hair below 0 to 0), and no clamp is needed.
+        lum_idx = int((luminance + 1) * 0.5 * max_idx)
+        output[idx] = chars[lum_idx]
+        # Blank (darkest) cells are emitted uncolored
+        colors[idx] = color if lum_idx else _NO_COLOR
+
+
+def _frame_buffers() -> tuple[bytearray, array, bytearray]:
+    """
+    Return this thread's (output, zbuffer, colors) buffers, cleared.
+
+    The buffers are allocated on a thread's first frame and reset in place
+    with slice assignment afterwards.
+    """
+    buffers = getattr(_frame_state, "buffers", None)
+    if buffers is None:
+        buffers = (
+            bytearray(_BLANK_OUTPUT),
+            array("d", _BLANK_ZBUFFER),
+            bytearray(_BLANK_COLORS),
+        )
+        _frame_state.buffers = buffers
+    else:
+        output, zbuffer, colors = buffers
+        output[:] = _BLANK_OUTPUT
+        memoryview(zbuffer).cast("B")[:] = _BLANK_ZBUFFER
+        colors[:] = _BLANK_COLORS
+    return buffers
+
+
 def render_tree_frame(angle: float, tilt: float = 0.2, use_color: bool = True) -> str:
     """
     Render a single frame of the spinning tree.
@@ -117,16 +311,8 @@ def render_tree_frame(angle: float, tilt: float = 0.2, use_color: bool = True) -
 
     Returns: Multi-line string of ASCII art
     """
-    # Initialize screen buffer, z-buffer, and color buffer
-    output: list[list[str]] = [
-        [" " for _ in range(SCREEN_WIDTH)] for _ in range(SCREEN_HEIGHT)
-    ]
-    zbuffer: list[list[float]] = [
-        [0.0 for _ in range(SCREEN_WIDTH)] for _ in range(SCREEN_HEIGHT)
-    ]
-    colors: list[list[str]] = [
-        ["" for _ in range(SCREEN_WIDTH)] for _ in range(SCREEN_HEIGHT)
-    ]
+    # Flat, row-major screen buffer, z-buffer, and color buffer
+    output, zbuffer, colors = _frame_buffers()
 
     # Precompute trig values - tilt around X, spin around Y
     sin_a, cos_a = math.sin(tilt), math.cos(tilt)
@@ -137,102 +323,52 @@ def render_tree_frame(angle: float, tilt: float = 0.2, use_color: bool = True) -
     light_y = LIGHT_Y
     light_z = LIGHT_X * sin_b + LIGHT_Z * cos_b
 
-    # Sample the cone (foliage) - finer steps for denser coverage
-    theta_step = 0.03
-    h_step = 0.012
-
-    theta = 0.0
-    while theta < 2 * math.pi:
-        h = 0.0
-        while h < 1.0:
-            x, y, z, nx, ny, nz = _sample_cone_surface(theta, h)
-
-            # Apply rotation
-            rx, ry, rz = _rotate_point(x, y, z, sin_a, cos_a, sin_b, cos_b)
-            rnx, rny, rnz = _rotate_point(nx, ny, nz, sin_a, cos_a, sin_b, cos_b)
-
-            # Perspective projection
-            ooz = 1 / (rz + K2)
-            xp = int(SCREEN_WIDTH / 2 + K1 * ooz * rx)
-            yp = int(SCREEN_HEIGHT / 2 - K1 * ooz * ry)  # Invert Y for screen coords
-
-            # Calculate luminance (dot product with rotating light direction)
-            luminance = rnx * light_x + rny * light_y + rnz * light_z
-
-            if (
-                0 <= xp < SCREEN_WIDTH
-                and 0 <= yp < SCREEN_HEIGHT
-                and ooz > zbuffer[yp][xp]
-            ):
-                zbuffer[yp][xp] = ooz
-                # Map luminance (-1 to 1) to character index
-                lum_idx = int((luminance + 1) * 0.5 * (len(LUMINANCE_CHARS) - 1))
-                lum_idx = max(0, min(len(LUMINANCE_CHARS) - 1, lum_idx))
-                output[yp][xp] = LUMINANCE_CHARS[lum_idx]
-                colors[yp][xp] = COLOR_GREEN  # Foliage is green
-
-            h += h_step
-        theta += theta_step
-
-    # Sample the trunk (cylinder)
-    theta = 0.0
-    while theta < 2 * math.pi:
-        h = 0.0
-        while h < 1.0:
-            x, y, z, nx, ny, nz = _sample_trunk_surface(theta, h)
-
-            # Apply rotation
-            rx, ry, rz = _rotate_point(x, y, z, sin_a, cos_a, sin_b, cos_b)
-            rnx, rny, rnz = _rotate_point(nx, ny, nz, sin_a, cos_a, sin_b, cos_b)
-
-            # Perspective projection
-            ooz = 1 / (rz + K2)
-            xp = int(SCREEN_WIDTH / 2 + K1 * ooz * rx)
-            yp = int(SCREEN_HEIGHT / 2 - K1 * ooz * ry)
-
-            # Calculate luminance
-            luminance = rnx * light_x + rny * light_y + rnz * light_z
-
-            if (
-                0 <= xp < SCREEN_WIDTH
-                and 0 <= yp < SCREEN_HEIGHT
-                and ooz > zbuffer[yp][xp]
-            ):
-                zbuffer[yp][xp] = ooz
-                lum_idx = int((luminance + 1) * 0.5 * (len(LUMINANCE_CHARS) - 1))
-                lum_idx = max(0, min(len(LUMINANCE_CHARS) - 1, lum_idx))
-                output[yp][xp] = LUMINANCE_CHARS[lum_idx]
-                colors[yp][xp] = COLOR_BROWN  # Trunk is brown
-
-            h += h_step
-        theta += theta_step
+    cone_samples, trunk_samples = _surface_samples()
+    rotation = (sin_a, cos_a, sin_b, cos_b)
+    light = (light_x, light_y, light_z)
+    trunk_cull = TRUNK_RADIUS if tilt <= TRUNK_CULL_MAX_TILT else None
+
+    # One kernel pass per surface: cone (foliage) first, then the trunk,
+    # sharing the buffers
+    for samples, color, back_face_offset in (
+        (cone_samples, _GREEN, None),
+        (trunk_samples, _BROWN, trunk_cull),
+    ):
+        _rasterize_surface(
+            samples, color, rotation, light, output, zbuffer, colors, back_face_offset
+        )
 
     # Convert buffer to string with optional colors
+    text = output.decode("ascii")
+    width = SCREEN_WIDTH
     if use_color:
         lines = []
-        for y in range(SCREEN_HEIGHT):
+        for start in range(0, _SCREEN_CELLS, width):
+            # Emit one escape per run of same-colored cells, not per cell
             line_parts = []
-            current_color = ""
-            for x in range(SCREEN_WIDTH):
-                char = output[y][x]
-                color = colors[y][x]
-                if char != " " and color and color != current_color:
-                    line_parts.append(color)
-                    current_color = color
-                elif char == " " and current_color:
+            current_color = _NO_COLOR
+            pos = start
+            for color, run in itertools.groupby(colors[start : start + width]):
+                end = pos + len(list(run))
+                if color:
+                    line_parts.append(_COLOR_CODES[color])
+                elif current_color:
                     line_parts.append(COLOR_RESET)
-                    current_color = ""
-                line_parts.append(char)
+                line_parts.append(text[pos:end])
+                current_color = color
+                pos = end
             if current_color:
                 line_parts.append(COLOR_RESET)
             lines.append("".join(line_parts))
         return "\n".join(lines)
     else:
-        return "\n".join("".join(row) for row in output)
+        return "\n".join(
+            text[start : start + width] for start in range(0, _SCREEN_CELLS, width)
+        )
 
 
-def get_static_tree(use_color: bool = True) -> str:
-    """Return a static ASCII art tree for non-animated contexts."""
+def _build_static_tree(use_color: bool) -> str:
+    """Build the static ASCII art tree, with or without ANSI colors."""
     if use_color:
         g = COLOR_GREEN  # Green for foliage
         b = COLOR_BROWN  # Brown for trunk
@@ -284,6 +420,16 @@ def get_static_tree(use_color: bool = True) -> str:
 """
 
 
+# The static tree never changes, so both variants are built once at import
+_STATIC_TREE_COLOR = _build_static_tree(use_color=True)
+_STATIC_TREE_PLAIN = _build_static_tree(use_color=False)
+
+
+def get_static_tree(use_color: bool = True) -> str:
+    """Return a static ASCII art tree for non-animated contexts."""
+    return _STATIC_TREE_COLOR if use_color else _STATIC_TREE_PLAIN
+
+
 def get_tree_height() -> int:
     """Return the height in lines of the rendered tree frame."""
     return SCREEN_HEIGHT
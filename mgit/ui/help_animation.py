@@ -1,6 +1,9 @@
 """Help animation orchestration for mgit CLI."""
 
 import contextlib
+import functools
+import math
+import os
 import platform
 import signal
 import sys
@@ -46,6 +49,8 @@ from mgit.ui.terminal import (  # noqa: E402
 ANIMATION_DURATION = 7.0  # seconds
 ANIMATION_FPS = 12  # frames per second
 ROTATION_SPEED = 0.15  # radians per frame
+# The spin is periodic, so one turn's worth of frames covers any duration
+FRAMES_PER_TURN = round(2 * math.pi / ROTATION_SPEED)
 
 
 class AnimationInterrupted(Exception):
@@ -76,14 +81,25 @@ def _restore_signal_handler(previous: SignalHandler) -> None:
             signal.signal(signal.SIGINT, previous)
 
 
-def _check_for_keypress() -> bool:
-    """Check if any key has been pressed (non-blocking). Returns True if key pressed."""
+def _check_for_keypress(stdin_is_raw: bool = False) -> bool:
+    """
+    Check if any key has been pressed (non-blocking). Returns True if key pressed.
+
+    stdin_is_raw: stdin was set up by _set_raw_mode(), so a read returns at once
+    """
     if _IS_WINDOWS:
         # Windows: use msvcrt for keyboard detection
         if msvcrt and msvcrt.kbhit():
             msvcrt.getch()  # Consume the character
             return True
         return False
+    elif stdin_is_raw:
+        # Unix in cbreak mode with VMIN=0/VTIME=0: a single read returns
+        # immediately, empty when no key is waiting
+        try:
+            return bool(os.read(sys.stdin.fileno(), 1))
+        except OSError:
+            return False
     else:
         # Unix: use select on stdin
         try:
@@ -107,6 +123,11 @@ def _set_raw_mode() -> Any:
                 fd = sys.stdin.fileno()
                 old_settings = termios.tcgetattr(fd)
                 tty.setcbreak(fd)  # Use cbreak instead of raw - allows Ctrl+C
+                # Make reads return immediately, even with no input waiting
+                attrs = termios.tcgetattr(fd)
+                attrs[6][termios.VMIN] = 0
+                attrs[6][termios.VTIME] = 0
+                termios.tcsetattr(fd, termios.TCSANOW, attrs)
                 return old_settings
         except Exception:
             pass
@@ -127,6 +148,33 @@ def _restore_terminal(old_settings: Any) -> None:
             pass
 
 
+@functools.cache
+def _spin_frame(step: int) -> str:
+    """
+    Return the rendered frame for a step of the spin cycle.
+
+    Frames depend only on the step, so each is rendered once per process
+    and replayed on every later turn (and every later animation).
+    """
+    return render_tree_frame(step * ROTATION_SPEED)
+
+
+def _frame_update(previous: list[str] | None, lines: list[str]) -> str:
+    """
+    Return the output that turns the previous frame into this one.
+
+    Written from the top of the frame: unchanged lines are stepped over with
+    a bare newline instead of being redrawn. With no previous frame, the
+    whole frame is drawn.
+    """
+    if previous is None:
+        return "\n".join(lines) + "\n"
+    return "".join(
+        "\n" if line == old else line + "\n"
+        for old, line in zip(previous, lines, strict=True)
+    )
+
+
 def run_tree_animation(
     duration: float = ANIMATION_DURATION, fps: float = ANIMATION_FPS
 ) -> None:
@@ -135,62 +183,59 @@ def run_tree_animation(
 
     Displays an animated ASCII tree that rotates for the specified duration,
     then clears the animation area before returning. Press any key to skip.
+
+    Frames are scheduled against the wall clock: when rendering or output
+    falls behind, the frames whose time has already passed are skipped, so
+    the animation never runs longer than duration.
     """
     frame_time = 1.0 / fps
-    angle = 0.0  # Rotation around vertical axis
 
     tree_height = get_tree_height()
     start_time = time.monotonic()
-    first_frame = True
+    previous_lines: list[str] | None = None  # Last frame drawn
 
     previous_handler = _setup_signal_handler()
     old_terminal_settings = _set_raw_mode()  # Enable keypress detection
 
     try:
-        hide_cursor()
-
-        while time.monotonic() - start_time < duration:
-            frame_start = time.monotonic()
+        hide_cursor(flush=False)
 
+        while (elapsed := time.monotonic() - start_time) < duration:
             # Check for keypress to skip animation
-            if _check_for_keypress():
+            if _check_for_keypress(stdin_is_raw=old_terminal_settings is not None):
                 break
 
-            # Render frame with current rotation angle
-            frame = render_tree_frame(angle)
+            # Render (or replay) the frame due now, skipping any we're late for
+            frame_index = int(elapsed / frame_time)
+            lines = _spin_frame(frame_index % FRAMES_PER_TURN).split("\n")
 
             # Move cursor back to start for overwrite (except first frame)
-            if not first_frame:
-                move_to_start_of_frame(tree_height)
-            first_frame = False
+            if previous_lines is not None:
+                move_to_start_of_frame(tree_height, flush=False)
 
-            # Output frame
-            sys.stdout.write(frame)
-            sys.stdout.write("\n")
+            # Output only the lines that changed; the cursor moves above go
+            # out in the same flush
+            sys.stdout.write(_frame_update(previous_lines, lines))
             sys.stdout.flush()
+            previous_lines = lines
 
-            # Advance rotation
-            angle += ROTATION_SPEED
-
-            # Maintain frame rate
-            elapsed = time.monotonic() - frame_start
-            sleep_time = frame_time - elapsed
+            # Maintain frame rate: wait for the next frame's slot
+            next_frame_at = start_time + (frame_index + 1) * frame_time
+            sleep_time = next_frame_at - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
 
         # Clear animation area after completion
-        move_to_start_of_frame(tree_height)
-        for _ in range(tree_height):
-            sys.stdout.write(" " * 65 + "\n")
-        move_to_start_of_frame(tree_height)
+        move_to_start_of_frame(tree_height, flush=False)
+        sys.stdout.write((" " * 65 + "\n") * tree_height)
+        move_to_start_of_frame(tree_height, flush=False)
         sys.stdout.flush()
 
     except AnimationInterrupted:
         # Clean exit on Ctrl+C - clear animation and re-raise as KeyboardInterrupt
-        move_to_start_of_frame(tree_height)
-        for _ in range(tree_height):
-            sys.stdout.write(" " * 65 + "\n")
-        move_to_start_of_frame(tree_height)
+        move_to_start_of_frame(tree_height, flush=False)
+        sys.stdout.write((" " * 65 + "\n") * tree_height)
+        move_to_start_of_frame(tree_height, flush=False)
         sys.stdout.flush()
         show_cursor()
         _restore_terminal(old_terminal_settings)
@@ -1,5 +1,6 @@
 """Terminal capability detection for animation support."""
 
+import functools
 import os
 import platform
 import sys
@@ -17,6 +18,7 @@ class TerminalCaps(Enum):
     ANSI = auto()  # Full ANSI support with cursor control
 
 
+@functools.lru_cache(maxsize=1)
 def get_terminal_capabilities() -> TerminalCaps:
     """
     Detect terminal capabilities for animation support.
@@ -25,6 +27,10 @@ def get_terminal_capabilities() -> TerminalCaps:
     - TTY detection (is stdout a terminal?)
     - TERM environment variable
     - CI/non-interactive environment detection
+
+    The result is cached for the life of the process; call
+    get_terminal_capabilities.cache_clear() after changing stdout or the
+    environment.
     """
     # Not a TTY = piped output, no animation
     if not sys.stdout.isatty():
@@ -64,39 +70,50 @@ def get_terminal_size() -> tuple[int, int]:
         return 80, 24  # Sensible defaults
 
 
-def hide_cursor() -> None:
-    """Hide the terminal cursor."""
+def hide_cursor(flush: bool = True) -> None:
+    """
+    Hide the terminal cursor.
+
+    Like the other cursor helpers, pass flush=False to batch the escape with
+    later output (e.g. a whole animation frame) into a single terminal write.
+    """
     sys.stdout.write("\033[?25l")
-    sys.stdout.flush()
+    if flush:
+        sys.stdout.flush()
 
 
-def show_cursor() -> None:
+def show_cursor(flush: bool = True) -> None:
     """Show the terminal cursor."""
     sys.stdout.write("\033[?25h")
-    sys.stdout.flush()
+    if flush:
+        sys.stdout.flush()
 
 
-def move_cursor_up(lines: int) -> None:
+def move_cursor_up(lines: int, flush: bool = True) -> None:
     """Move cursor up by specified number of lines."""
     if lines > 0:
         sys.stdout.write(f"\033[{lines}A")
-        sys.stdout.flush()
+        if flush:
+            sys.stdout.flush()
 
 
-def move_cursor_to_column(col: int) -> None:
+def move_cursor_to_column(col: int, flush: bool = True) -> None:
     """Move cursor to specified column."""
     sys.stdout.write(f"\033[{col}G")
-    sys.stdout.flush()
+    if flush:
+        sys.stdout.flush()
 
 
-def clear_line() -> None:
+def clear_line(flush: bool = True) -> None:
     """Clear the current line."""
     sys.stdout.write("\033[2K")
-    sys.stdout.flush()
+    if flush:
+        sys.stdout.flush()
 
 
-def move_to_start_of_frame(height: int) -> None:
+def move_to_start_of_frame(height: int, flush: bool = True) -> None:
     """Move cursor to start position for next frame overwrite."""
     # Move to beginning of line and up by frame height
     sys.stdout.write(f"\r\033[{height}A")
-    sys.stdout.flush()
+    if flush:
+        sys.stdout.flush()
@@ -1,5 +1,5 @@
 """Utility functions for mgit."""
 
-from .async_executor import AsyncExecutor
+from .async_executor import AsyncExecutor, install_fast_event_loop
 
-__all__ = ["AsyncExecutor"]
+__all__ = ["AsyncExecutor", "install_fast_event_loop"]
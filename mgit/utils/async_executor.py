@@ -6,42 +6,127 @@ progress tracking, and error collection for batch operations.
 """
 
 import asyncio
+import contextlib
+import functools
 import logging
 import subprocess
-from collections.abc import Callable, Coroutine
+import time
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+)
 from enum import Enum
 from pathlib import Path
 from typing import Any, TypeVar
 
-from rich.console import Console
+from rich.console import Console, ConsoleDimensions
 from rich.progress import (
     BarColumn,
     Progress,
+    ProgressColumn,
     SpinnerColumn,
+    Task,
     TaskID,
     TextColumn,
     TimeElapsedColumn,
 )
 from rich.table import Column
+from rich.text import Text
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Read size used when streaming subprocess output (see run_commands)
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class ExecutionMode(str, Enum):
     """Execution modes for async operations."""
 
-    CONCURRENT = "concurrent"  # Run all tasks concurrently (with semaphore limit)
+    CONCURRENT = "concurrent"  # Run tasks on a bounded pool of workers
     SEQUENTIAL = "sequential"  # Run tasks one by one
 
 
+class _BatchedProgress:
+    """
+    Coalesce Rich progress updates and apply them in periodic batches.
+
+    Workers update a task several times per item; between flushes only the
+    latest fields (and the summed advance) per task are kept, so Rich sees
+    at most one update per task per flush.
+    """
+
+    __slots__ = ("_progress", "_pending")
+
+    def __init__(self, progress: Progress):
+        self._progress = progress
+        self._pending: dict[TaskID, dict[str, Any]] = {}
+
+    def add_task(self, description: str, **kwargs: Any) -> TaskID:
+        return self._progress.add_task(description, **kwargs)
+
+    def update(self, task_id: TaskID, **fields: Any) -> None:
+        pending = self._pending.setdefault(task_id, {})
+        advance = fields.pop("advance", None)
+        if "completed" in fields:
+            # An absolute count supersedes earlier advances
+            pending.pop("advance", None)
+        pending.update(fields)
+        if advance:
+            pending["advance"] = pending.get("advance", 0) + advance
+
+    def advance(self, task_id: TaskID, advance: float = 1) -> None:
+        self.update(task_id, advance=advance)
+
+    def flush(self) -> None:
+        """Apply all pending updates to the underlying Progress."""
+        pending, self._pending = self._pending, {}
+        for task_id, fields in pending.items():
+            self._progress.update(task_id, **fields)
+
+    async def flush_every(self, interval: float) -> None:
+        """Flush pending updates every `interval` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            self.flush()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_description(markup: str) -> Text:
+    return Text.from_markup(markup, style="progress.description", justify="left")
+
+
+class _DescriptionColumn(ProgressColumn):
+    """
+    Task description column that parses each distinct markup string once.
+
+    Rich's TextColumn re-parses a task's markup on every refresh, although a
+    row's description only changes when its item changes state.
+    """
+
+    def render(self, task: Task) -> Text:
+        # Rendering may trim the Text to fit, so hand out a copy
+        return _parse_description(task.description).copy()
+
+
+class _DiscardedResults(list):
+    """Results list for batches run with keep_results=False; stores nothing."""
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        pass
+
+
 class AsyncExecutor:
     """
     A generalized async executor for running batch operations with progress tracking.
 
     Features:
-    - Configurable concurrency limits using semaphores
+    - Configurable concurrency limits using a fixed pool of workers
     - Progress tracking with Rich Progress bars
     - Error collection without stopping batch operations
     - Support for both concurrent and sequential execution modes
@@ -79,12 +164,65 @@ class AsyncExecutor:
         """
         self.concurrency = concurrency
         self.mode = mode
-        self.semaphore = (
-            asyncio.Semaphore(concurrency) if mode == ExecutionMode.CONCURRENT else None
-        )
+        # Workers hold a slot per item; the condition lets the limit change
+        # while a batch runs (see set_concurrency)
+        self._active = 0
+        self._slot_waiters = 0
+        self._slots_changed = asyncio.Condition()
         self.console = rich_console or Console(stderr=True)
+        self._progress_refresh_hz = 10
         self._bar_width = 28
         self._min_desc_width = 24
+        # Console size and description width for the batch being shown
+        # (None outside one)
+        self._term_size: ConsoleDimensions | None = None
+        self._desc_width: int | None = None
+        # Item errors are logged at most once per type per interval within a
+        # batch, so a mass failure doesn't flood (and stall on) the handlers
+        self._error_log_interval = 1.0
+        self._error_logged_at: dict[str, float] = {}
+        self._errors_suppressed: dict[str, int] = {}
+
+    async def set_concurrency(self, concurrency: int) -> None:
+        """
+        Change the concurrency limit, including for a batch that is running.
+
+        Lowering the limit takes effect as in-flight items finish. A running
+        batch can't grow past the worker pool it started with, so raising
+        the limit beyond that applies from the next batch.
+
+        Args:
+            concurrency: New maximum number of concurrent operations
+        """
+        async with self._slots_changed:
+            self.concurrency = concurrency
+            self._slots_changed.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def _concurrency_slot(self) -> AsyncIterator[None]:
+        """Hold one of the `concurrency` slots for the duration of the block."""
+        # Nothing else runs between the check and the increment, so a free
+        # slot can be taken without the condition's lock; it is only needed
+        # to wait for a slot (e.g. after set_concurrency lowered the limit)
+        if self._active < max(self.concurrency, 1):
+            self._active += 1
+        else:
+            self._slot_waiters += 1
+            try:
+                async with self._slots_changed:
+                    await self._slots_changed.wait_for(
+                        lambda: self._active < max(self.concurrency, 1)
+                    )
+                    self._active += 1
+            finally:
+                self._slot_waiters -= 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            if self._slot_waiters:
+                async with self._slots_changed:
+                    self._slots_changed.notify()
 
     async def run_batch(
         self,
@@ -96,6 +234,7 @@ class AsyncExecutor:
         collect_errors: bool = True,
         on_error: Callable[[T, Exception], None] | None = None,
         on_success: Callable[[T, Any], None] | None = None,
+        keep_results: bool = True,
     ) -> tuple[list[Any], list[tuple[T, Exception]]]:
         """
         Run a batch of async operations with progress tracking.
@@ -109,51 +248,44 @@ class AsyncExecutor:
             collect_errors: Whether to collect errors (if False, first error will raise)
             on_error: Optional callback for error handling
             on_success: Optional callback for successful processing
+            keep_results: Whether to collect results; callers that only act
+                          through on_success can pass False to avoid holding
+                          every result until the batch ends
 
         Returns:
             Tuple of (results, errors) where:
-            - results: List of successful results (None for failed items)
-            - errors: List of (item, exception) tuples for failed items
+            - results: List of successful results (None for failed items),
+              or an empty list if keep_results is False
+            - errors: List of (item, exception) tuples for failed items,
+              in item order
         """
-        results = [None] * len(items)
-        errors: list[tuple[T, Exception]] = []
+        self._error_logged_at.clear()
+        self._errors_suppressed.clear()
+        results: list[Any] = (
+            [None] * len(items) if keep_results else _DiscardedResults()
+        )
+        # Each worker stores into its item's slot; errors are paired with
+        # their items once the batch is done
+        errors: list[Exception | None] = [None] * len(items)
 
         if not show_progress:
-            # Run without progress bars
-            if self.mode == ExecutionMode.CONCURRENT:
-                tasks = [
-                    self._process_item_with_semaphore(
-                        idx,
-                        item,
-                        process_func,
-                        results,
-                        errors,
-                        collect_errors,
-                        on_error,
-                        on_success,
-                    )
-                    for idx, item in enumerate(items)
-                ]
-                await asyncio.gather(*tasks)
-            else:
-                # Sequential execution
-                for idx, item in enumerate(items):
-                    await self._process_item(
-                        idx,
-                        item,
-                        process_func,
-                        results,
-                        errors,
-                        collect_errors,
-                        on_error,
-                        on_success,
-                    )
+            process_one = self._build_item_processor(
+                process_func, results, errors, collect_errors, on_error, on_success
+            )
+            await self._run_items(items, process_one)
         else:
             # Run with progress tracking
-            with self._create_progress() as progress:
+            async with self._batched_progress() as progress:
                 overall_task = progress.add_task(task_description, total=len(items))
 
                 if self.mode == ExecutionMode.CONCURRENT:
+                    # One row per worker would overflow a short terminal
+                    rows = max(self.concurrency, 1)
+                else:
+                    rows = len(items)
+                compact_progress = self._should_use_compact_progress(rows)
+
+                if self.mode == ExecutionMode.CONCURRENT and not compact_progress:
                     await self._run_concurrent_with_worker_progress(
                         items,
                         process_func,
@@ -167,25 +299,10 @@ class AsyncExecutor:
                         on_success,
                     )
                 else:
-                    compact_progress = self._should_use_compact_progress(len(items))
-                    if compact_progress:
-                        for idx, item in enumerate(items):
-                            await self._process_item_with_compact_progress(
-                                idx,
-                                item,
-                                process_func,
-                                results,
-                                errors,
-                                progress,
-                                overall_task,
-                                item_description,
-                                collect_errors,
-                                on_error,
-                                on_success,
-                            )
-                    else:
+                    item_tasks: dict[int, TaskID] | None = None
+                    if not compact_progress:
                         # Create individual task tracking
-                        item_tasks: dict[int, TaskID] = {}
+                        item_tasks = {}
                         for idx, item in enumerate(items):
                             raw_desc = (
                                 item_description(item)
@@ -193,53 +310,180 @@ class AsyncExecutor:
                                 else f"Item {idx + 1}"
                             )
                             desc = self._format_description(raw_desc)
-                            task_id = progress.add_task(
+                            item_tasks[idx] = progress.add_task(
                                 f"[grey50]Pending: {desc}[/grey50]", total=1
                             )
-                            item_tasks[idx] = task_id
 
-                        # Sequential execution with progress
-                        for idx, item in enumerate(items):
-                            await self._process_item_with_progress(
-                                idx,
-                                item,
-                                process_func,
-                                results,
-                                errors,
-                                progress,
-                                overall_task,
-                                item_tasks[idx],
-                                item_description,
-                                collect_errors,
-                                on_error,
-                                on_success,
-                            )
+                    process_one = self._build_item_processor(
+                        process_func,
+                        results,
+                        errors,
+                        collect_errors,
+                        on_error,
+                        on_success,
+                        progress=progress,
+                        overall_task=overall_task,
+                        item_description=item_description,
+                        item_tasks=item_tasks,
+                    )
+                    await self._run_items(items, process_one)
 
-        return results, errors
+        self._log_suppressed_errors()
+        return results, [
+            (items[idx], e) for idx, e in enumerate(errors) if e is not None
+        ]
 
-    async def _process_item_with_semaphore(
+    def _log_item_error(self, desc: str, error: Exception) -> None:
+        """Log a failed item unless its error type was logged very recently."""
+        kind = type(error).__name__
+        now = time.monotonic()
+        last = self._error_logged_at.get(kind)
+        if last is not None and now - last < self._error_log_interval:
+            self._errors_suppressed[kind] = self._errors_suppressed.get(kind, 0) + 1
+            return
+        self._error_logged_at[kind] = now
+        logger.warning(f"Error processing {desc}: {error}")
+
+    def _log_suppressed_errors(self) -> None:
+        """Summarize the item errors _log_item_error held back in this batch."""
+        for kind, count in self._errors_suppressed.items():
+            logger.warning(f"{count} more {kind} error(s) in this batch not logged")
+        self._errors_suppressed.clear()
+
+    @staticmethod
+    def _work_source(items: list[T]) -> Iterator[tuple[int, T]]:
+        """
+        Hand out (index, item) pairs to workers sharing one iterator.
+
+        Workers only claim items between awaits, so a plain iterator is as
+        safe as a queue here while allocating nothing per item up front; a
+        worker that finds it exhausted is done.
+        """
+        return enumerate(items)
+
+    @staticmethod
+    async def _run_workers(workers: Iterable[Coroutine[Any, Any, None]]) -> None:
+        """
+        Run worker coroutines to completion, stopping them all on a failure.
+
+        When one worker raises (e.g. with collect_errors=False), its siblings
+        are cancelled rather than left draining the batch, and the original
+        exception propagates once they have stopped.
+        """
+        tasks = [asyncio.ensure_future(worker) for worker in workers]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _build_item_processor(
         self,
-        idx: int,
-        item: T,
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
+        errors: list[Exception | None],
         collect_errors: bool,
         on_error: Callable[[T, Exception], None] | None,
         on_success: Callable[[T, Any], None] | None,
-    ):
-        """Process item with semaphore for concurrency control."""
-        async with self.semaphore:
-            await self._process_item(
-                idx,
-                item,
-                process_func,
-                results,
-                errors,
-                collect_errors,
-                on_error,
-                on_success,
-            )
+        progress: _BatchedProgress | None = None,
+        overall_task: TaskID | None = None,
+        item_description: Callable[[T], str] | None = None,
+        item_tasks: dict[int, TaskID] | None = None,
+    ) -> Callable[[int, T], Coroutine[Any, Any, None]]:
+        """
+        Choose how each item of a batch is processed and reported, once.
+
+        Args:
+            progress: Progress display for the batch, or None to run silently
+            overall_task: The batch's overall progress row
+            item_description: Function to generate description for each item
+            item_tasks: Per-item progress rows; without them, items report
+                        on the overall row only
+
+        Returns:
+            An async `process_one(idx, item)` with the batch's settings bound
+        """
+        if progress is None:
+
+            async def process_one(idx: int, item: T) -> None:
+                await self._process_item(
+                    idx,
+                    item,
+                    process_func,
+                    results,
+                    errors,
+                    collect_errors,
+                    on_error,
+                    on_success,
+                )
+
+        elif item_tasks is None:
+            assert overall_task is not None
+
+            async def process_one(idx: int, item: T) -> None:
+                await self._process_item_with_compact_progress(
+                    idx,
+                    item,
+                    process_func,
+                    results,
+                    errors,
+                    progress,
+                    overall_task,
+                    item_description,
+                    collect_errors,
+                    on_error,
+                    on_success,
+                )
+
+        else:
+            assert overall_task is not None
+
+            async def process_one(idx: int, item: T) -> None:
+                await self._process_item_with_progress(
+                    idx,
+                    item,
+                    process_func,
+                    results,
+                    errors,
+                    progress,
+                    overall_task,
+                    item_tasks[idx],
+                    item_description,
+                    collect_errors,
+                    on_error,
+                    on_success,
+                )
+
+        return process_one
+
+    async def _run_items(
+        self,
+        items: list[T],
+        process_one: Callable[[int, T], Coroutine[Any, Any, None]],
+    ) -> None:
+        """
+        Feed every item to `process_one`, one by one or on a worker pool.
+
+        Concurrent batches use only `concurrency` tasks however many items
+        there are, so large batches don't allocate a task per item.
+        """
+        if self.mode != ExecutionMode.CONCURRENT:
+            for idx, item in enumerate(items):
+                await process_one(idx, item)
+            return
+
+        work = self._work_source(items)
+
+        async def worker() -> None:
+            while True:
+                async with self._concurrency_slot():
+                    claimed = next(work, None)
+                    if claimed is None:
+                        break
+                    await process_one(*claimed)
+
+        await self._run_workers(worker() for _ in range(max(self.concurrency, 1)))
 
     async def _process_item(
         self,
@@ -247,7 +491,7 @@ class AsyncExecutor:
         item: T,
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
+        errors: list[Exception | None],
         collect_errors: bool,
         on_error: Callable[[T, Exception], None] | None,
         on_success: Callable[[T, Any], None] | None,
@@ -259,8 +503,8 @@ class AsyncExecutor:
             if on_success:
                 on_success(item, result)
         except Exception as e:
-            logger.warning(f"Error processing item {item}: {e}")
-            errors.append((item, e))
+            self._log_item_error(f"item {item}", e)
+            errors[idx] = e
             if on_error:
                 on_error(item, e)
             if not collect_errors:
@@ -272,8 +516,8 @@ class AsyncExecutor:
         item: T,
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
-        progress: Progress,
+        errors: list[Exception | None],
+        progress: _BatchedProgress,
         overall_task: TaskID,
         item_task: TaskID,
         item_description: Callable[[T], str] | None,
@@ -281,41 +525,24 @@ class AsyncExecutor:
         on_error: Callable[[T, Exception], None] | None,
         on_success: Callable[[T, Any], None] | None,
     ):
-        """Process item with progress tracking."""
+        """Process item with progress tracking (sequential mode)."""
         raw_desc = item_description(item) if item_description else f"Item {idx + 1}"
         desc = self._format_description(raw_desc)
 
-        if self.mode == ExecutionMode.CONCURRENT and self.semaphore:
-            async with self.semaphore:
-                await self._process_with_progress_update(
-                    idx,
-                    item,
-                    process_func,
-                    results,
-                    errors,
-                    progress,
-                    overall_task,
-                    item_task,
-                    desc,
-                    collect_errors,
-                    on_error,
-                    on_success,
-                )
-        else:
-            await self._process_with_progress_update(
-                idx,
-                item,
-                process_func,
-                results,
-                errors,
-                progress,
-                overall_task,
-                item_task,
-                desc,
-                collect_errors,
-                on_error,
-                on_success,
-            )
+        await self._process_with_progress_update(
+            idx,
+            item,
+            process_func,
+            results,
+            errors,
+            progress,
+            overall_task,
+            item_task,
+            desc,
+            collect_errors,
+            on_error,
+            on_success,
+        )
 
     async def _process_with_progress_update(
         self,
@@ -323,8 +550,8 @@ class AsyncExecutor:
         item: T,
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
-        progress: Progress,
+        errors: list[Exception | None],
+        progress: _BatchedProgress,
         overall_task: TaskID,
         item_task: TaskID,
         desc: str,
@@ -348,8 +575,8 @@ class AsyncExecutor:
             if on_success:
                 on_success(item, result)
         except Exception as e:
-            logger.warning(f"Error processing {desc}: {e}")
-            errors.append((item, e))
+            self._log_item_error(desc, e)
+            errors[idx] = e
             progress.update(
                 item_task, description=f"[red]✗ Failed: {desc}[/red]", completed=1
             )
@@ -366,8 +593,8 @@ class AsyncExecutor:
         items: list[T],
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
-        progress: Progress,
+        errors: list[Exception | None],
+        progress: _BatchedProgress,
         overall_task: TaskID,
         item_description: Callable[[T], str] | None,
         collect_errors: bool,
@@ -375,12 +602,7 @@ class AsyncExecutor:
         on_success: Callable[[T, Any], None] | None,
     ) -> None:
         worker_count = max(self.concurrency, 1)
-        queue: asyncio.Queue[tuple[int, T] | None] = asyncio.Queue()
-
-        for idx, item in enumerate(items):
-            queue.put_nowait((idx, item))
-        for _ in range(worker_count):
-            queue.put_nowait(None)
+        work = self._work_source(items)
 
         worker_tasks = [
             progress.add_task(f"[grey50]Worker {i + 1}: idle[/grey50]", total=1)
@@ -389,65 +611,83 @@ class AsyncExecutor:
 
         async def worker(worker_idx: int) -> None:
             task_id = worker_tasks[worker_idx]
+            prefix = f"Worker {worker_idx + 1}: "
             while True:
-                payload = await queue.get()
-                if payload is None:
-                    progress.update(
-                        task_id,
-                        description=f"[grey50]Worker {worker_idx + 1}: idle[/grey50]",
-                        completed=0,
-                    )
-                    queue.task_done()
-                    break
-
-                idx, item = payload
-                raw_desc = (
-                    item_description(item) if item_description else f"Item {idx + 1}"
-                )
-                desc = self._format_description(
-                    raw_desc, prefix=f"Worker {worker_idx + 1}: "
-                )
-                progress.update(
-                    task_id,
-                    description=f"[cyan]{desc}[/cyan]",
-                    completed=1,
-                )
-
-                try:
-                    result = await process_func(item)
-                    results[idx] = result
-                    progress.update(
-                        task_id,
-                        description=f"[green]✓ {desc}[/green]",
-                        completed=1,
+                async with self._concurrency_slot():
+                    claimed = next(work, None)
+                    if claimed is None:
+                        progress.update(
+                            task_id,
+                            description=f"[grey50]{prefix}idle[/grey50]",
+                            completed=0,
+                        )
+                        break
+                    idx, item = claimed
+
+                    raw_desc = (
+                        item_description(item)
+                        if item_description
+                        else f"Item {idx + 1}"
                     )
-                    if on_success:
-                        on_success(item, result)
-                except Exception as e:
-                    logger.warning(f"Error processing {desc}: {e}")
-                    errors.append((item, e))
+                    desc = self._format_description(raw_desc, prefix=prefix)
                     progress.update(
                         task_id,
-                        description=f"[red]✗ {desc}[/red]",
+                        description=f"[cyan]{desc}[/cyan]",
                         completed=1,
                     )
-                    if on_error:
-                        on_error(item, e)
-                    if not collect_errors:
-                        queue.task_done()
-                        raise
-
-                progress.advance(overall_task, 1)
-                queue.task_done()
 
-        await asyncio.gather(*(worker(i) for i in range(worker_count)))
+                    try:
+                        result = await process_func(item)
+                        results[idx] = result
+                        progress.update(
+                            task_id,
+                            description=f"[green]✓ {desc}[/green]",
+                            completed=1,
+                        )
+                        if on_success:
+                            on_success(item, result)
+                    except Exception as e:
+                        self._log_item_error(desc, e)
+                        errors[idx] = e
+                        progress.update(
+                            task_id,
+                            description=f"[red]✗ {desc}[/red]",
+                            completed=1,
+                        )
+                        if on_error:
+                            on_error(item, e)
+                        if not collect_errors:
+                            raise
+
+                    progress.advance(overall_task, 1)
+
+        await self._run_workers(worker(i) for i in range(worker_count))
+
+    @contextlib.asynccontextmanager
+    async def _batched_progress(self) -> AsyncIterator[_BatchedProgress]:
+        """Show a progress display whose updates are applied in timed batches."""
+        # Measure the console once per batch rather than once per item
+        self._term_size = self._measure_console()
+        self._desc_width = self._get_max_description_width()
+        with self._create_progress() as rich_progress:
+            progress = _BatchedProgress(rich_progress)
+            flusher = asyncio.create_task(
+                progress.flush_every(1 / self._progress_refresh_hz)
+            )
+            try:
+                yield progress
+            finally:
+                flusher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await flusher
+                progress.flush()
+                self._desc_width = None
+                self._term_size = None
 
     def _create_progress(self) -> Progress:
         columns = [
             SpinnerColumn(),
-            TextColumn(
-                "[progress.description]{task.description}",
-                justify="left",
+            _DescriptionColumn(
                 table_column=Column(ratio=1, overflow="ellipsis", no_wrap=True),
             ),
             BarColumn(
@@ -460,15 +700,23 @@ class AsyncExecutor:
         return Progress(*columns, console=self.console, expand=True)
 
     def _format_description(self, text: str, prefix: str | None = None) -> str:
-        display = f"{prefix or ''}{text}"
-        max_len = self._get_max_description_width()
-        return self._truncate_middle(display, max_len)
+        if prefix:
+            text = prefix + text
+        max_len = self._desc_width or self._get_max_description_width()
+        # Most descriptions fit; skip the truncation call for them
+        if len(text) <= max_len:
+            return text
+        return self._truncate_middle(text, max_len)
 
-    def _get_max_description_width(self) -> int:
+    def _measure_console(self) -> ConsoleDimensions | None:
         try:
-            width = self.console.size.width
+            return self.console.size
         except Exception:
-            width = 0
+            return None
+
+    def _get_max_description_width(self) -> int:
+        size = self._term_size or self._measure_console()
+        width = size.width if size else 0
 
         if width <= 0:
             return 60
@@ -488,10 +736,8 @@ class AsyncExecutor:
         return f"{text[:head_len]}...{text[-tail_len:]}"
 
     def _should_use_compact_progress(self, item_count: int) -> bool:
-        try:
-            height = self.console.size.height
-        except Exception:
-            return False
+        size = self._term_size or self._measure_console()
+        height = size.height if size else 0
 
         if height <= 0:
             return False
@@ -505,47 +751,31 @@ class AsyncExecutor:
         item: T,
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
-        progress: Progress,
+        errors: list[Exception | None],
+        progress: _BatchedProgress,
         overall_task: TaskID,
         item_description: Callable[[T], str] | None,
         collect_errors: bool,
         on_error: Callable[[T, Exception], None] | None,
         on_success: Callable[[T, Any], None] | None,
     ):
-        """Process item with compact progress tracking."""
+        """Process item with compact progress tracking (sequential mode)."""
         raw_desc = item_description(item) if item_description else f"Item {idx + 1}"
         desc = self._format_description(raw_desc)
 
-        if self.mode == ExecutionMode.CONCURRENT and self.semaphore:
-            async with self.semaphore:
-                await self._process_with_compact_progress_update(
-                    idx,
-                    item,
-                    process_func,
-                    results,
-                    errors,
-                    progress,
-                    overall_task,
-                    desc,
-                    collect_errors,
-                    on_error,
-                    on_success,
-                )
-        else:
-            await self._process_with_compact_progress_update(
-                idx,
-                item,
-                process_func,
-                results,
-                errors,
-                progress,
-                overall_task,
-                desc,
-                collect_errors,
-                on_error,
-                on_success,
-            )
+        await self._process_with_compact_progress_update(
+            idx,
+            item,
+            process_func,
+            results,
+            errors,
+            progress,
+            overall_task,
+            desc,
+            collect_errors,
+            on_error,
+            on_success,
+        )
 
     async def _process_with_compact_progress_update(
         self,
@@ -553,8 +783,8 @@ class AsyncExecutor:
         item: T,
         process_func: Callable[[T], Coroutine[Any, Any, Any]],
         results: list[Any],
-        errors: list[tuple[T, Exception]],
-        progress: Progress,
+        errors: list[Exception | None],
+        progress: _BatchedProgress,
         overall_task: TaskID,
         desc: str,
         collect_errors: bool,
@@ -574,8 +804,8 @@ class AsyncExecutor:
             if on_success:
                 on_success(item, result)
         except Exception as e:
-            logger.warning(f"Error processing {desc}: {e}")
-            errors.append((item, e))
+            self._log_item_error(desc, e)
+            errors[idx] = e
             progress.update(
                 overall_task,
                 advance=1,
@@ -619,7 +849,65 @@ class AsyncExecutor:
         Returns:
             List of results (or exceptions if return_exceptions=True)
         """
-        return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+        if not coros:
+            return []
+
+        # Unlike asyncio.gather, a task is released as soon as it finishes
+        # and its outcome is stored, so long runs of short coroutines don't
+        # keep every finished task alive until the last one completes
+        results: list[Any] = [None] * len(coros)
+        all_done = asyncio.get_running_loop().create_future()
+        pending: dict[int, asyncio.Task[Any]] = {}
+
+        def on_done(idx: int, task: asyncio.Task[Any]) -> None:
+            del pending[idx]
+            error: BaseException | None = (
+                asyncio.CancelledError() if task.cancelled() else task.exception()
+            )
+            if error is None:
+                results[idx] = task.result()
+            elif return_exceptions:
+                results[idx] = error
+            elif not all_done.done():
+                all_done.set_exception(error)
+            if not pending and not all_done.done():
+                all_done.set_result(None)
+
+        for idx, coro in enumerate(coros):
+            task = asyncio.ensure_future(coro)
+            pending[idx] = task
+            task.add_done_callback(functools.partial(on_done, idx))
+
+        try:
+            await all_done
+        except asyncio.CancelledError:
+            if all_done.cancelled():
+                # We were cancelled ourselves; take the children down too
+                for task in list(pending.values()):
+                    task.cancel()
+            raise
+        return results
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Use uvloop's event loop for subsequent asyncio.run() calls, if available.
+
+    uvloop is an optional dependency; its libuv-based loop cuts per-syscall
+    overhead on subprocess- and pipe-heavy batches. The policy must be set
+    before a loop starts, so call this at process startup rather than from
+    inside a running batch.
+
+    Returns:
+        True if uvloop was installed, False if it isn't available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed; keeping the default event loop")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 # High-level convenience functions
@@ -682,10 +970,37 @@ async def run_sequential(
 
 
 # Example usage for subprocess operations (common pattern in mgit)
+async def _read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """
+    Drain a stream to EOF, keeping only its last `limit` bytes.
+
+    Args:
+        stream: Subprocess pipe to read
+        limit: Maximum number of trailing bytes to retain
+
+    Returns:
+        The final `limit` bytes written to the stream
+    """
+    chunks: deque[bytes] = deque()
+    kept = 0
+    while chunk := await stream.read(_STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        kept += len(chunk)
+        # Drop whole chunks that lie entirely outside the tail
+        while len(chunks) > 1 and kept - len(chunks[0]) >= limit:
+            kept -= len(chunks.popleft())
+    tail = b"".join(chunks)
+    return tail[-limit:] if limit else b""
+
+
 class SubprocessExecutor(AsyncExecutor):
     """
     Specialized executor for running subprocess commands with progress tracking.
 
+    `concurrency` bounds the number of running subprocesses, not just how
+    many are spawned at once: a command keeps its slot until it exits, so a
+    batch never has more than `concurrency` git processes talking to a host.
+
     Example:
         executor = SubprocessExecutor(concurrency=4)
         commands = [
@@ -693,6 +1008,9 @@ class SubprocessExecutor(AsyncExecutor):
             ("git", ["git", "pull"], Path("/repo2")),
         ]
         results, errors = await executor.run_commands(commands)
+
+    Chatty commands can pass `tail_bytes` to stream their output instead of
+    buffering it whole; only the last `tail_bytes` of each pipe is returned.
     """
 
     async def run_commands(
@@ -700,6 +1018,8 @@ class SubprocessExecutor(AsyncExecutor):
         commands: list[tuple[str, list[str], Path]],
         task_description: str = "Running commands...",
         show_progress: bool = True,
+        tail_bytes: int | None = None,
+        keep_results: bool = True,
     ) -> tuple[
         list[tuple[int, bytes, bytes]],
         list[tuple[tuple[str, list[str], Path], Exception]],
@@ -711,6 +1031,10 @@ class SubprocessExecutor(AsyncExecutor):
             commands: List of (name, cmd_args, working_dir) tuples
             task_description: Overall progress description
             show_progress: Whether to show progress
+            tail_bytes: If set, stream each command's output and keep only
+                        its last `tail_bytes` bytes of stdout and stderr
+            keep_results: Whether to return results; failures are reported
+                          in errors either way
 
         Returns:
             Tuple of (results, errors) where results contain (returncode, stdout, stderr)
@@ -726,7 +1050,15 @@ class SubprocessExecutor(AsyncExecutor):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await process.communicate()
+            if tail_bytes is None:
+                stdout, stderr = await process.communicate()
+            else:
+                assert process.stdout is not None and process.stderr is not None
+                stdout, stderr = await asyncio.gather(
+                    _read_tail(process.stdout, tail_bytes),
+                    _read_tail(process.stderr, tail_bytes),
+                )
+                await process.wait()
 
             if process.returncode != 0:
                 raise subprocess.CalledProcessError(
@@ -741,4 +1073,5 @@ class SubprocessExecutor(AsyncExecutor):
             task_description=task_description,
             item_description=lambda cmd: f"{cmd[0]}: {' '.join(cmd[1][:2])}...",
             show_progress=show_progress,
+            keep_results=keep_results,
         )
@@ -6,6 +6,8 @@ for use by various mgit commands and discovery modules.
 """
 
 import logging
+import os
+from collections import deque
 from pathlib import Path
 
 from mgit.git.utils import is_git_repository
@@ -22,10 +24,13 @@ def find_repositories_in_directory(
     Args:
         root_path: Root directory to start searching from
         recursive: Whether to search recursively in subdirectories
-        max_depth: Maximum depth to search (None for unlimited)
+        max_depth: Maximum depth below root_path at which a repository is
+                   reported when searching recursively (None for unlimited)
 
     Returns:
-        List of Paths to Git repository directories
+        List of Paths to Git repository directories. A recursive search does
+        not look inside repositories it finds, so nested repositories are
+        not reported.
     """
     if not root_path.exists():
         logger.warning(f"Root path does not exist: {root_path}")
@@ -35,33 +40,13 @@ def find_repositories_in_directory(
         logger.warning(f"Root path is not a directory: {root_path}")
         return []
 
-    repositories = []
-
-    # Check if the root path itself is a repository
-    if is_git_repository(root_path):
-        repositories.append(root_path)
-
     if recursive:
-        # Recursively find all .git directories
-        pattern = "**/.git" if max_depth is None else f"{'*/' * max_depth}.git"
-
-        try:
-            for git_dir in root_path.glob(pattern):
-                if git_dir.is_dir():
-                    parent_repo = git_dir.parent
-                    if parent_repo not in repositories:
-                        repositories.append(parent_repo)
-        except ValueError:
-            # Handle invalid glob patterns (e.g., max_depth too large)
-            logger.warning(
-                f"Invalid search pattern for max_depth={max_depth}, falling back to recursive search"
-            )
-            for git_dir in root_path.rglob(".git"):
-                if git_dir.is_dir():
-                    parent_repo = git_dir.parent
-                    if parent_repo not in repositories:
-                        repositories.append(parent_repo)
+        repositories = _walk_for_repositories(root_path, max_depth)
     else:
+        repositories = []
+        # Check if the root path itself is a repository
+        if is_git_repository(root_path):
+            repositories.append(root_path)
         # Only check immediate subdirectories
         for item in root_path.iterdir():
             if item.is_dir() and is_git_repository(item) and item not in repositories:
@@ -71,6 +56,36 @@ def find_repositories_in_directory(
     return repositories
 
 
+def _walk_for_repositories(root_path: Path, max_depth: int | None) -> list[Path]:
+    """
+    Walk root_path with os.scandir, stopping at each repository found.
+
+    DirEntry.is_dir() is answered from the directory listing on most
+    platforms, so unlike Path.glob this needs no stat() per entry, and it
+    never descends into .git directories or repository working trees.
+    """
+    repositories = []
+    pending = deque([(root_path, 0)])
+    while pending:
+        path, depth = pending.pop()
+        descend = max_depth is None or depth < max_depth
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if entry.name == ".git" and (is_dir or entry.is_dir()):
+                        repositories.append(Path(path))
+                        break
+                    if is_dir and descend:
+                        subdirs.append((entry.path, depth + 1))
+                else:
+                    pending.extend(subdirs)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {path}: {e}")
+    return repositories
+
+
 def find_repositories_by_pattern(
     root_path: Path,
     name_pattern: str = None,
@@ -2,13 +2,16 @@
 
 import math
 
+from mgit.ui import ascii_tree
 from mgit.ui.ascii_tree import (
+    H_STEP,
     LUMINANCE_CHARS,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     _rotate_point,
     _sample_cone_surface,
     _sample_trunk_surface,
+    _surface_samples,
     get_static_tree,
     get_tree_height,
     render_tree_frame,
@@ -64,32 +67,44 @@ class TestSampleSurfaces:
 
     def test_cone_surface_returns_6_values(self):
         """Cone surface sampling returns position and normal."""
-        result = _sample_cone_surface(0.0, 0.5)
+        result = _sample_cone_surface(1.0, 0.0, 0.5)
         assert len(result) == 6
 
     def test_trunk_surface_returns_6_values(self):
         """Trunk surface sampling returns position and normal."""
-        result = _sample_trunk_surface(0.0, 0.5)
+        result = _sample_trunk_surface(1.0, 0.0, 0.5)
         assert len(result) == 6
 
     def test_cone_normal_is_unit_vector(self):
         """Cone surface normal should be approximately unit length."""
-        x, y, z, nx, ny, nz = _sample_cone_surface(1.0, 0.3)
+        x, y, z, nx, ny, nz = _sample_cone_surface(math.cos(1.0), math.sin(1.0), 0.3)
         normal_len = math.sqrt(nx**2 + ny**2 + nz**2)
         assert abs(normal_len - 1.0) < 1e-10
 
     def test_trunk_normal_is_unit_vector(self):
         """Trunk surface normal should be unit length."""
-        x, y, z, nx, ny, nz = _sample_trunk_surface(1.0, 0.5)
+        x, y, z, nx, ny, nz = _sample_trunk_surface(math.cos(1.0), math.sin(1.0), 0.5)
         normal_len = math.sqrt(nx**2 + ny**2 + nz**2)
         assert abs(normal_len - 1.0) < 1e-10
 
     def test_cone_tip_has_small_radius(self):
         """At h=1.0 (tip), cone radius should be near zero."""
-        x, y, z, nx, ny, nz = _sample_cone_surface(0.0, 0.99)
+        x, y, z, nx, ny, nz = _sample_cone_surface(1.0, 0.0, 0.99)
         radius = math.sqrt(x**2 + z**2)
         assert radius < 0.1  # Should be very small near tip
 
+    def test_surface_samples_are_computed_once(self):
+        """Frame-independent samples are cached and match direct sampling."""
+        cone, trunk = _surface_samples()
+        assert _surface_samples()[0] is cone
+        assert cone[1] == _sample_cone_surface(1.0, 0.0, H_STEP)
+        assert trunk[0] == _sample_trunk_surface(1.0, 0.0, 0.0)
+
+    def test_small_surfaces_are_sampled_more_coarsely(self):
+        """The short trunk gets fewer samples than the foliage cone."""
+        cone, trunk = _surface_samples()
+        assert len(trunk) < len(cone)
+
 
 class TestRenderTreeFrame:
     """Tests for the frame rendering function."""
@@ -133,6 +148,14 @@ class TestRenderTreeFrame:
         frame = render_tree_frame(0.0, use_color=True)
         assert "\033[" in frame  # ANSI escape sequence
 
+    def test_trunk_culling_does_not_change_frames(self, monkeypatch):
+        """Back-face culling only drops samples that would be hidden anyway."""
+        angles = [i * 0.4 for i in range(16)]
+        culled = [render_tree_frame(angle) for angle in angles]
+
+        monkeypatch.setattr(ascii_tree, "TRUNK_CULL_MAX_TILT", float("-inf"))
+        assert [render_tree_frame(angle) for angle in angles] == culled
+
 
 class TestStaticTree:
     """Tests for static tree art."""
@@ -0,0 +1,368 @@
+"""
+Unit tests for the batch async executor.
+"""
+
+import asyncio
+import gc
+import io
+import subprocess
+import sys
+import weakref
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+import pytest
+from rich.console import Console
+
+from mgit.utils.async_executor import (
+    AsyncExecutor,
+    ExecutionMode,
+    SubprocessExecutor,
+    _BatchedProgress,
+    _DescriptionColumn,
+    _parse_description,
+    install_fast_event_loop,
+)
+
+
+class TestRunBatchConcurrent:
+    @pytest.fixture
+    def executor(self):
+        return AsyncExecutor(concurrency=3, mode=ExecutionMode.CONCURRENT)
+
+    @pytest.mark.asyncio
+    async def test_results_keep_item_order(self, executor):
+        async def double(item):
+            await asyncio.sleep(0.001 * (5 - item))
+            return item * 2
+
+        results, errors = await executor.run_batch(
+            list(range(5)), double, show_progress=False
+        )
+        assert results == [0, 2, 4, 6, 8]
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, executor):
+        in_flight = 0
+        peak = 0
+
+        async def track(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return item
+
+        await executor.run_batch(list(range(20)), track, show_progress=False)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_collected(self, executor):
+        async def fail_odd(item):
+            if item % 2:
+                raise ValueError(item)
+            return item
+
+        results, errors = await executor.run_batch(
+            list(range(4)), fail_odd, show_progress=False
+        )
+        assert results == [0, None, 2, None]
+        assert [item for item, _ in errors] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_results_can_be_discarded(self, executor):
+        seen = []
+
+        async def fail_odd(item):
+            if item % 2:
+                raise ValueError(item)
+            return item
+
+        results, errors = await executor.run_batch(
+            list(range(4)),
+            fail_odd,
+            show_progress=False,
+            on_success=lambda item, result: seen.append(result),
+            keep_results=False,
+        )
+        assert results == []
+        assert sorted(seen) == [0, 2]
+        assert [item for item, _ in errors] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_repeated_errors_are_logged_once_then_summarized(
+        self, executor, caplog
+    ):
+        async def fail(item):
+            raise ConnectionError(item)
+
+        with caplog.at_level("WARNING", logger="mgit.utils.async_executor"):
+            _, errors = await executor.run_batch(
+                list(range(50)), fail, show_progress=False
+            )
+
+        assert len(errors) == 50
+        messages = [record.getMessage() for record in caplog.records]
+        assert messages == [
+            "Error processing item 0: 0",
+            "49 more ConnectionError error(s) in this batch not logged",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_can_be_lowered_mid_batch(self, executor):
+        in_flight = 0
+        late_peak = 0
+        lowered = False
+
+        async def track(item):
+            nonlocal in_flight, late_peak, lowered
+            in_flight += 1
+            if lowered:
+                late_peak = max(late_peak, in_flight)
+            await asyncio.sleep(0.001)
+            if item == 0:
+                await executor.set_concurrency(1)
+                lowered = True
+            in_flight -= 1
+            return item
+
+        results, _ = await executor.run_batch(
+            list(range(12)), track, show_progress=False
+        )
+        assert results == list(range(12))
+        assert late_peak == 1
+        assert executor._active == 0
+
+    @pytest.mark.asyncio
+    async def test_first_error_stops_other_workers(self, executor):
+        started = []
+
+        async def fail_first(item):
+            started.append(item)
+            if item == 0:
+                raise ValueError(item)
+            await asyncio.sleep(0.01)
+            return item
+
+        with pytest.raises(ValueError):
+            await executor.run_batch(
+                list(range(10)), fail_first, show_progress=False, collect_errors=False
+            )
+        await asyncio.sleep(0.05)
+        assert started == [0, 1, 2]
+
+
+class TestBatchedProgress:
+    def test_updates_are_coalesced_per_task(self):
+        progress = MagicMock()
+        batched = _BatchedProgress(progress)
+
+        batched.update(1, description="working", completed=1)
+        batched.update(1, description="done")
+        batched.advance(0)
+        batched.advance(0)
+        progress.update.assert_not_called()
+
+        batched.flush()
+        assert progress.update.call_args_list == [
+            call(1, description="done", completed=1),
+            call(0, advance=2),
+        ]
+
+    def test_completed_supersedes_earlier_advance(self):
+        progress = MagicMock()
+        batched = _BatchedProgress(progress)
+
+        batched.advance(1)
+        batched.update(1, completed=0)
+        batched.flush()
+        progress.update.assert_called_once_with(1, completed=0)
+
+    @pytest.mark.asyncio
+    async def test_progress_batch_reaches_completion(self):
+        console = Console(file=io.StringIO(), width=100)
+        executor = AsyncExecutor(concurrency=2, rich_console=console)
+
+        async def echo(item):
+            return item
+
+        results, errors = await executor.run_batch(list(range(6)), echo)
+        assert results == list(range(6))
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_console_width_is_measured_once_per_batch(self, monkeypatch):
+        console = Console(file=io.StringIO(), width=100)
+        executor = AsyncExecutor(concurrency=2, rich_console=console)
+        measure = MagicMock(return_value=40)
+        monkeypatch.setattr(executor, "_get_max_description_width", measure)
+
+        async def echo(item):
+            return item
+
+        await executor.run_batch(list(range(6)), echo)
+        measure.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_console_size_is_read_once_per_batch(self, monkeypatch):
+        console = Console(file=io.StringIO(), width=100, height=40)
+        executor = AsyncExecutor(concurrency=2, rich_console=console)
+        measure = MagicMock(return_value=console.size)
+        monkeypatch.setattr(executor, "_measure_console", measure)
+
+        async def echo(item):
+            return item
+
+        await executor.run_batch(list(range(6)), echo)
+        measure.assert_called_once()
+        assert executor._term_size is None
+
+    @pytest.mark.asyncio
+    async def test_many_workers_on_short_terminal_use_compact_rows(self, monkeypatch):
+        console = Console(file=io.StringIO(), width=100, height=10)
+        executor = AsyncExecutor(concurrency=8, rich_console=console)
+        worker_rows = MagicMock()
+        monkeypatch.setattr(
+            executor, "_run_concurrent_with_worker_progress", worker_rows
+        )
+
+        async def echo(item):
+            return item
+
+        results, errors = await executor.run_batch(list(range(20)), echo)
+        assert results == list(range(20))
+        assert errors == []
+        worker_rows.assert_not_called()
+
+    def test_description_markup_is_parsed_once(self):
+        executor = AsyncExecutor(rich_console=Console(file=io.StringIO()))
+        _parse_description.cache_clear()
+        with executor._create_progress() as rich_progress:
+            task_id = rich_progress.add_task("[cyan]Processing: repo-a[/cyan]")
+            task = rich_progress.tasks[task_id]
+            column = _DescriptionColumn()
+
+            first = column.render(task)
+            second = column.render(task)
+
+        assert first.plain == second.plain == "Processing: repo-a"
+        assert first is not second
+        assert _parse_description.cache_info().misses == 1
+
+
+class TestGatherWithErrors:
+    @pytest.mark.asyncio
+    async def test_results_keep_argument_order(self):
+        async def after(delay, value):
+            await asyncio.sleep(delay)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        error = ValueError("boom")
+        results = await AsyncExecutor().gather_with_errors(
+            after(0.02, "slow"), after(0, error), after(0.01, "fast")
+        )
+        assert results == ["slow", error, "fast"]
+
+    @pytest.mark.asyncio
+    async def test_first_error_raises_without_return_exceptions(self):
+        async def fail():
+            raise ValueError("boom")
+
+        async def ok():
+            return 1
+
+        with pytest.raises(ValueError):
+            await AsyncExecutor().gather_with_errors(
+                ok(), fail(), return_exceptions=False
+            )
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_released_early(self):
+        finished = []
+        release = asyncio.Event()
+
+        async def quick():
+            finished.append(weakref.ref(asyncio.current_task()))
+
+        async def slow():
+            await release.wait()
+            return "slow"
+
+        gathering = asyncio.ensure_future(
+            AsyncExecutor().gather_with_errors(quick(), slow())
+        )
+        await asyncio.sleep(0.01)
+        gc.collect()
+        assert finished[0]() is None
+
+        release.set()
+        assert await gathering == [None, "slow"]
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_gather_cancels_children(self):
+        started = asyncio.Event()
+        child_cancelled = False
+
+        async def wait_forever():
+            nonlocal child_cancelled
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                child_cancelled = True
+                raise
+
+        gathering = asyncio.ensure_future(
+            AsyncExecutor().gather_with_errors(wait_forever())
+        )
+        await started.wait()
+        gathering.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await gathering
+        await asyncio.sleep(0)
+        assert child_cancelled
+
+
+class TestInstallFastEventLoop:
+    def test_missing_uvloop_keeps_default_loop(self, monkeypatch):
+        policy = asyncio.get_event_loop_policy()
+        monkeypatch.setitem(sys.modules, "uvloop", None)  # import raises
+
+        assert install_fast_event_loop() is False
+        assert asyncio.get_event_loop_policy() is policy
+
+
+class TestSubprocessTailCapture:
+    SCRIPT = (
+        "import sys; sys.stdout.write('x' * 300000 + 'END');"
+        "sys.stderr.write('warn'); sys.exit(int(sys.argv[1]))"
+    )
+
+    def _command(self, code):
+        return ("py", [sys.executable, "-c", self.SCRIPT, str(code)], Path.cwd())
+
+    @pytest.mark.asyncio
+    async def test_keeps_only_the_tail(self):
+        executor = SubprocessExecutor(concurrency=1)
+        results, errors = await executor.run_commands(
+            [self._command(0)], show_progress=False, tail_bytes=10
+        )
+
+        assert errors == []
+        assert results == [(0, b"xxxxxxxEND", b"warn")]
+
+    @pytest.mark.asyncio
+    async def test_failure_carries_the_tail(self):
+        executor = SubprocessExecutor(concurrency=1)
+        _, [(_, error)] = await executor.run_commands(
+            [self._command(3)], show_progress=False, tail_bytes=3
+        )
+
+        assert isinstance(error, subprocess.CalledProcessError)
+        assert error.returncode == 3
+        assert error.output == b"END"
+        assert error.stderr == b"arn"
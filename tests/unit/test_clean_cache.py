@@ -0,0 +1,83 @@
+"""
+Unit tests for the clean-repository fingerprint cache.
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from mgit.git.clean_cache import CleanFingerprintCache, repo_fingerprint
+from mgit.processing import DiffProcessor
+
+
+def _init_repo(path):
+    subprocess.run(["git", "init", str(path)], check=True, capture_output=True)
+    (path / "keep.txt").write_text("keep\n")
+    subprocess.run(
+        ["git", "add", "keep.txt"], cwd=str(path), check=True, capture_output=True
+    )
+    subprocess.run(
+        ["git", "commit", "-m", "init"],
+        cwd=str(path),
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestRepoFingerprint:
+    def test_changes_when_head_moves(self, tmp_path):
+        _init_repo(tmp_path)
+        before = repo_fingerprint(tmp_path)
+        assert before is not None
+
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "second"],
+            cwd=str(tmp_path),
+            check=True,
+            capture_output=True,
+        )
+        assert repo_fingerprint(tmp_path)[0] != before[0]
+
+    def test_not_a_repository(self, tmp_path):
+        assert repo_fingerprint(tmp_path) is None
+
+
+class TestFastCleanCheck:
+    @pytest.fixture
+    def processor(self, tmp_path):
+        processor = DiffProcessor(concurrency=1, fast_clean_check=True)
+        processor.clean_cache = CleanFingerprintCache(tmp_path / "fingerprints.json")
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_second_scan_skips_git(self, processor, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _init_repo(repo)
+
+        [first] = await processor.process_repositories([repo])
+        assert first.git_status == "clean"
+        assert (tmp_path / "fingerprints.json").exists()
+
+        # A fresh cache instance proves the fingerprint was persisted
+        processor.clean_cache = CleanFingerprintCache(tmp_path / "fingerprints.json")
+        with patch.object(processor.git_manager, "collect_repo_snapshot") as snapshot:
+            [second] = await processor.process_repositories([repo])
+            snapshot.assert_not_called()
+
+        assert second.git_status == "clean"
+        assert second.current_branch == first.current_branch
+        assert second.recent_commits == first.recent_commits
+
+    @pytest.mark.asyncio
+    async def test_new_file_forces_full_scan(self, processor, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _init_repo(repo)
+        await processor.process_repositories([repo])
+
+        (repo / "new.txt").write_text("new\n")
+        [change] = await processor.process_repositories([repo])
+        assert change.git_status == "dirty"
+        assert processor.clean_cache.get(repo, repo_fingerprint(repo)) is None
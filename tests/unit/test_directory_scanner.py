@@ -0,0 +1,45 @@
+"""
+Unit tests for repository discovery in directory trees.
+"""
+
+from mgit.utils.directory_scanner import find_repositories_in_directory
+
+
+def _make_repo(path):
+    (path / ".git" / "objects").mkdir(parents=True)
+    return path
+
+
+class TestFindRepositoriesInDirectory:
+    def test_finds_repositories_at_any_depth(self, tmp_path):
+        shallow = _make_repo(tmp_path / "org" / "repo-a")
+        deep = _make_repo(tmp_path / "org" / "team" / "project" / "repo-b")
+        (tmp_path / "org" / "notes").mkdir()
+
+        found = find_repositories_in_directory(tmp_path)
+        assert sorted(found) == sorted([shallow, deep])
+
+    def test_does_not_descend_into_repositories(self, tmp_path):
+        outer = _make_repo(tmp_path / "outer")
+        _make_repo(outer / "vendor" / "inner")
+
+        assert find_repositories_in_directory(tmp_path) == [outer]
+
+    def test_max_depth_limits_the_search(self, tmp_path):
+        near = _make_repo(tmp_path / "org" / "repo-a")
+        _make_repo(tmp_path / "org" / "team" / "repo-b")
+
+        assert find_repositories_in_directory(tmp_path, max_depth=2) == [near]
+
+    def test_git_file_is_not_a_repository(self, tmp_path):
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: /elsewhere\n")
+
+        assert find_repositories_in_directory(tmp_path) == []
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path):
+        repo = _make_repo(tmp_path / "real" / "repo")
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+
+        assert find_repositories_in_directory(tmp_path) == [repo]
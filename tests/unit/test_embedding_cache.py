@@ -0,0 +1,207 @@
+"""
+Unit tests for the persistent content-hash embedding cache.
+"""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from unittest.mock import patch
+
+import pytest
+
+from mgit import processing
+from mgit.content.content_strategies import (
+    ContentStrategy,
+    EmbeddedContent,
+    FullContentEmbedder,
+)
+from mgit.content.embedding_cache import CachedEmbeddingEngine, EmbeddingCache
+from mgit.processing import DiffProcessor
+
+
+class TestEmbeddedContentToDict:
+    def test_matches_asdict(self):
+        content = EmbeddedContent(
+            strategy=ContentStrategy.SAMPLE,
+            content="head\n...\ntail",
+            content_hash="abc",
+            size_bytes=42,
+            mime_type="text/plain",
+            charset="utf-8",
+            is_truncated=True,
+            line_count=3,
+            metadata={"sample_lines": 2},
+        )
+        data = content.to_dict()
+        assert data == asdict(content)
+
+        data["metadata"]["sample_lines"] = 99
+        assert content.metadata == {"sample_lines": 2}
+
+
+class TestEmbeddingCachePruning:
+    def _content(self, text):
+        return EmbeddedContent(
+            strategy=ContentStrategy.FULL,
+            content=text,
+            content_hash="",
+            size_bytes=len(text),
+            mime_type="text/plain",
+            charset="utf-8",
+        )
+
+    def test_batch_keeps_only_the_newest_entries(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_entries=3)
+        with cache.batch():
+            for i in range(5):
+                cache.put(f"k{i}", self._content(str(i)))
+
+        assert [cache.get(f"k{i}") is not None for i in range(5)] == [
+            False,
+            False,
+            True,
+            True,
+            True,
+        ]
+        cache.close()
+
+    def test_close_prunes_unbatched_writes(self, tmp_path):
+        db_path = tmp_path / "embeddings.sqlite"
+        cache = EmbeddingCache(db_path, max_entries=2)
+        for i in range(4):
+            cache.put(f"k{i}", self._content(str(i)))
+        cache.close()
+
+        reopened = EmbeddingCache(db_path)
+        assert reopened.get("k0") is None
+        assert reopened.get("k3") is not None
+        reopened.close()
+
+    def test_database_without_stored_at_is_upgraded(self, tmp_path):
+        db_path = tmp_path / "embeddings.sqlite"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE embeddings (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        cache = EmbeddingCache(db_path)
+        cache.put("k", self._content("x"))
+        assert cache.get("k").content == "x"
+        cache.close()
+
+
+class TestCachedEmbeddingEngine:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "cache" / "embeddings.sqlite")
+        yield CachedEmbeddingEngine(cache=cache)
+        cache.close()
+
+    def test_unchanged_file_served_from_cache(self, engine, tmp_path):
+        """A second embed of identical bytes does not run the embedder."""
+        file_path = tmp_path / "settings.json"
+        file_path.write_text('{"key": "value"}\n')
+
+        first = engine.embed_file_content(file_path)
+        assert first.strategy == ContentStrategy.FULL
+
+        with patch.object(FullContentEmbedder, "embed_content") as embed:
+            second = engine.embed_file_content(file_path)
+            embed.assert_not_called()
+
+        assert second == first
+
+    def test_changed_file_is_re_embedded(self, engine, tmp_path):
+        """Changing file bytes misses the cache."""
+        file_path = tmp_path / "settings.json"
+        file_path.write_text('{"key": "value"}\n')
+        engine.embed_file_content(file_path)
+
+        file_path.write_text('{"key": "other"}\n')
+        result = engine.embed_file_content(file_path)
+        assert result.content == '{"key": "other"}\n'
+
+    def test_unwritable_cache_falls_back_to_embedding(self, tmp_path):
+        """An unusable cache location degrades to uncached embedding."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        engine = CachedEmbeddingEngine(cache=EmbeddingCache(blocker / "db.sqlite"))
+
+        file_path = tmp_path / "settings.json"
+        file_path.write_text('{"key": "value"}\n')
+        result = engine.embed_file_content(file_path)
+        assert result.error is None
+        assert result.content == '{"key": "value"}\n'
+
+    def test_batch_embeds_all_files_and_populates_cache(self, engine, tmp_path):
+        """embed_files_batch returns every file and caches them for later."""
+        paths = []
+        for name in ("a.json", "b.yaml"):
+            file_path = tmp_path / name
+            file_path.write_text(f"name: {name}\n")
+            paths.append(file_path)
+
+        results = engine.embed_files_batch(paths)
+        assert set(results) == set(paths)
+
+        with patch.object(FullContentEmbedder, "embed_content") as embed:
+            again = engine.embed_files_batch(paths)
+            embed.assert_not_called()
+        assert again == results
+
+    def test_concurrent_embeds_account_every_file(self, engine, tmp_path):
+        """Threads sharing an engine don't lose memory budget updates."""
+        paths = []
+        for i in range(64):
+            file_path = tmp_path / f"f{i}.txt"
+            file_path.write_text(f"line {i}\n" * 20)
+            paths.append(file_path)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(engine.embed_file_content, paths))
+
+        expected = sum(len(r.content.encode()) + 1024 for r in results if r.content)
+        assert engine.current_memory_usage == expected
+
+    def test_failed_embed_releases_its_reservation(self, engine, tmp_path):
+        file_path = tmp_path / "settings.json"
+        file_path.write_text('{"key": "value"}\n')
+
+        with patch.object(
+            FullContentEmbedder, "embed_content", side_effect=RuntimeError("boom")
+        ):
+            result = engine.embed_file_content(file_path)
+
+        assert result.error == "boom"
+        assert engine.current_memory_usage == 0
+
+
+class TestProcessorContentEngines:
+    @pytest.fixture
+    def shared_cache(self, tmp_path, monkeypatch):
+        cache = EmbeddingCache(tmp_path / "embeddings.sqlite")
+        monkeypatch.setattr(processing, "_shared_embedding_cache", lambda: cache)
+        yield cache
+        cache.close()
+
+    def test_processors_share_only_stateless_parts(self, shared_cache):
+        first = DiffProcessor(embed_content=True, cache_embeddings=True).content_engine
+        second = DiffProcessor(embed_content=True, cache_embeddings=True).content_engine
+
+        assert first is not second
+        assert first.cache is second.cache is shared_cache
+        assert first.mime_detector is second.mime_detector
+
+    def test_embedding_cache_is_opt_in(self, shared_cache):
+        engine = DiffProcessor(embed_content=True).content_engine
+        assert not isinstance(engine, CachedEmbeddingEngine)
+
+    @pytest.mark.asyncio
+    async def test_each_scan_starts_with_a_full_budget(self, shared_cache):
+        processor = DiffProcessor(embed_content=True)
+        processor.content_engine.current_memory_usage = 12345
+
+        await processor.process_repositories([])
+        assert processor.content_engine.current_memory_usage == 0
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from mgit.git.manager import GitManager, sanitize_url
-from mgit.git.utils import find_case_collisions
+from mgit.git.utils import NulRecordSplitter, find_case_collisions
 
 
 def _init_repo(path):
@@ -441,3 +441,140 @@ class TestGitFetchResetUpstream:
             text=True,
         ).stdout
         assert status == "", "working tree should be clean after hard reset"
+
+
+class TestDiffFiles:
+    """Test diff_files and porcelain v2 status parsing against real repos."""
+
+    @pytest.fixture
+    def git_manager(self):
+        return GitManager()
+
+    @pytest.mark.asyncio
+    async def test_clean_repo_has_no_changes(self, tmp_path, git_manager):
+        _init_repo(tmp_path)
+        diff_info = await git_manager.diff_files(tmp_path)
+        assert diff_info["has_changes"] is False
+        assert diff_info["current_branch"]
+
+    @pytest.mark.asyncio
+    async def test_parses_modified_untracked_and_renamed(self, tmp_path, git_manager):
+        from mgit.processing import DiffProcessor
+
+        _init_repo(tmp_path)
+        (tmp_path / "keep.txt").write_text("changed\n")
+        (tmp_path / "new file.txt").write_text("new\n")
+        subprocess.run(
+            ["git", "add", "keep.txt"],
+            cwd=str(tmp_path),
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(
+            ["git", "commit", "-m", "second"],
+            cwd=str(tmp_path),
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(
+            ["git", "mv", "keep.txt", "renamed -> keep.txt"],
+            cwd=str(tmp_path),
+            check=True,
+            capture_output=True,
+        )
+
+        diff_info = await git_manager.diff_files(tmp_path)
+        assert diff_info["has_changes"] is True
+
+        files = DiffProcessor()._parse_git_status(diff_info["status_records"], tmp_path)
+        by_name = {f["filename"]: f for f in files}
+        assert by_name["new file.txt"]["change_type"] == "untracked"
+        renamed = by_name["renamed -> keep.txt"]
+        assert renamed["change_type"] == "renamed"
+        assert renamed["original_filename"] == "keep.txt"
+        assert renamed["worktree_status"] == " "
+
+    @pytest.mark.asyncio
+    async def test_rename_from_hash_prefixed_path(self, tmp_path, git_manager):
+        from mgit.processing import DiffProcessor
+
+        _init_repo(tmp_path)
+        (tmp_path / "#notes.md").write_text("notes\n")
+        (tmp_path / "other.txt").write_text("other\n")
+        for args in (
+            ["git", "add", "#notes.md", "other.txt"],
+            ["git", "commit", "-m", "second"],
+            ["git", "mv", "#notes.md", "a.md"],
+        ):
+            subprocess.run(args, cwd=str(tmp_path), check=True, capture_output=True)
+        (tmp_path / "other.txt").write_text("changed\n")
+
+        diff_info = await git_manager.diff_files(tmp_path)
+        files = DiffProcessor()._parse_git_status(diff_info["status_records"], tmp_path)
+        by_name = {f["filename"]: f for f in files}
+        assert by_name["a.md"]["original_filename"] == "#notes.md"
+        assert by_name["other.txt"]["change_type"] == "modified"
+
+    @pytest.mark.asyncio
+    async def test_status_timeout_raises_called_process_error(
+        self, tmp_path, git_manager
+    ):
+        _init_repo(tmp_path)
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            await git_manager.diff_files(tmp_path, timeout=0)
+        assert exc_info.value.returncode == 124
+
+    @pytest.mark.asyncio
+    async def test_snapshot_includes_recent_commits(self, tmp_path, git_manager):
+        _init_repo(tmp_path)
+        (tmp_path / "untracked.txt").write_text("x\n")
+
+        snapshot = await git_manager.collect_repo_snapshot(tmp_path, commit_limit=5)
+        assert snapshot["has_changes"] is True
+        assert snapshot["current_branch"]
+        assert len(snapshot["recent_commits"]) == 1
+        assert snapshot["recent_commits"][0]["message"] == "init"
+
+
+class TestNulRecordSplitter:
+    def test_records_split_across_chunks(self):
+        data = "1 .M N... a.txt\0? caf\u00e9.txt\0".encode()
+        splitter = NulRecordSplitter()
+        records = []
+        # One byte at a time exercises partial records and partial UTF-8
+        for i in range(len(data)):
+            records.extend(splitter.feed(data[i : i + 1]))
+        records.extend(splitter.close())
+        assert records == ["1 .M N... a.txt", "? caf\u00e9.txt"]
+
+    def test_close_returns_unterminated_tail(self):
+        splitter = NulRecordSplitter()
+        assert splitter.feed(b"first\0sec") == ["first"]
+        assert splitter.close() == ["sec"]
+        assert splitter.close() == []
+
+
+class TestDiffProcessorConcurrency:
+    def test_auto_sizes_from_cpu_count(self):
+        from mgit.processing import DiffProcessor
+
+        with patch("mgit.processing.os.cpu_count", return_value=4):
+            assert DiffProcessor().concurrency == 8
+        with patch("mgit.processing.os.cpu_count", return_value=64):
+            assert DiffProcessor().concurrency == 32
+        with patch("mgit.processing.os.cpu_count", return_value=None):
+            assert DiffProcessor().concurrency == 2
+
+    def test_explicit_concurrency_is_kept(self):
+        from mgit.processing import DiffProcessor
+
+        assert DiffProcessor(concurrency=3).concurrency == 3
+
+    def test_clamped_by_open_file_limit(self):
+        from mgit import processing
+
+        if processing.resource is None:
+            pytest.skip("resource module unavailable")
+        with patch.object(processing.resource, "getrlimit", return_value=(64, 64)):
+            # 75% of 64 fds at 6 fds per repository
+            assert processing.DiffProcessor(concurrency=20).concurrency == 8
@@ -0,0 +1,101 @@
+"""Unit tests for the help animation orchestration."""
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mgit.ui import help_animation
+from mgit.ui.ascii_tree import render_tree_frame
+
+
+class TestSpinFrame:
+    """Tests for the per-step frame cache."""
+
+    def test_matches_rendered_frame(self):
+        """Cached frames are the frames render_tree_frame produces."""
+        step = 3
+        expected = render_tree_frame(step * help_animation.ROTATION_SPEED)
+        assert help_animation._spin_frame(step) == expected
+
+    def test_each_step_is_rendered_once(self):
+        """Replaying a step doesn't render the frame again."""
+        help_animation._spin_frame.cache_clear()
+        with patch.object(
+            help_animation, "render_tree_frame", return_value="frame"
+        ) as render:
+            for _ in range(2):
+                for step in range(help_animation.FRAMES_PER_TURN):
+                    help_animation._spin_frame(step)
+        help_animation._spin_frame.cache_clear()
+
+        assert render.call_count == help_animation.FRAMES_PER_TURN
+
+
+class TestFrameUpdate:
+    """Tests for incremental frame output."""
+
+    def test_first_frame_is_drawn_in_full(self):
+        """Without a previous frame every line is written."""
+        assert help_animation._frame_update(None, ["ab", "cd"]) == "ab\ncd\n"
+
+    def test_unchanged_lines_are_skipped(self):
+        """Only changed lines are redrawn; others are stepped over."""
+        update = help_animation._frame_update(["ab", "cd", "ef"], ["ab", "cX", "ef"])
+        assert update == "\ncX\n\n"
+
+
+class TestRunTreeAnimation:
+    """Tests for animation frame scheduling."""
+
+    def test_skips_frames_when_behind(self, monkeypatch):
+        """Slow frames make the animation skip ahead instead of running long."""
+        clock = [0.0]
+        frame_time = 0.25  # Exact in binary, so slot arithmetic is exact
+        steps = []
+
+        def slow_frame(step):
+            # Each frame takes 2.5 frame slots to produce
+            steps.append(step)
+            clock[0] += 2.5 * frame_time
+            return "frame"
+
+        monkeypatch.setattr(help_animation.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(help_animation.time, "sleep", lambda s: None)
+        monkeypatch.setattr(help_animation, "_spin_frame", slow_frame)
+        monkeypatch.setattr(
+            help_animation, "_check_for_keypress", lambda stdin_is_raw: False
+        )
+        monkeypatch.setattr(help_animation, "_set_raw_mode", lambda: None)
+        monkeypatch.setattr(help_animation.sys, "stdout", io.StringIO())
+
+        help_animation.run_tree_animation(duration=10 * frame_time, fps=4)
+
+        assert steps == [0, 2, 5, 7]
+
+
+@pytest.mark.skipif(help_animation._IS_WINDOWS, reason="Unix stdin handling")
+class TestCheckForKeypress:
+    """Tests for keypress detection on a raw-mode stdin."""
+
+    @pytest.fixture
+    def stdin_pipe(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)  # Stands in for VMIN=0/VTIME=0
+        mock_stdin = MagicMock()
+        mock_stdin.fileno.return_value = read_fd
+        monkeypatch.setattr(help_animation.sys, "stdin", mock_stdin)
+        yield write_fd
+        os.close(read_fd)
+        os.close(write_fd)
+
+    def test_reads_pending_key(self, stdin_pipe):
+        """A waiting key is consumed and reported."""
+        os.write(stdin_pipe, b"q")
+        assert help_animation._check_for_keypress(stdin_is_raw=True)
+        assert not help_animation._check_for_keypress(stdin_is_raw=True)
+
+    def test_no_key_waiting(self, stdin_pipe):
+        """With nothing to read, the check returns without blocking."""
+        assert not help_animation._check_for_keypress(stdin_is_raw=True)
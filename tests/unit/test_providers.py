@@ -4,13 +4,38 @@ Unit tests for provider-related functionality.
 This module tests provider abstraction, authentication, and provider-specific operations.
 """
 
+import asyncio
+import functools
+import json
+import subprocess
+import sys
+import time
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
-from mgit.providers.exceptions import ConfigurationError
+from mgit.providers.base import (
+    GitProvider,
+    Project,
+    RateLimitInfo,
+    Repository,
+    _cached_rate_limiter_config,
+    compile_repo_filter,
+    dump_repositories,
+)
+from mgit.providers.exceptions import (
+    APIError,
+    ConfigurationError,
+    RateLimitError,
+    RateLimitExceededError,
+)
 from mgit.providers.github import GitHubProvider
 
+# datetime.UTC only exists on Python 3.11+
+UTC = timezone.utc  # noqa: UP017
+
 # Note: These imports will need to be updated once the providers module is extracted
 
 
@@ -36,6 +61,92 @@ class TestProviderAbstraction:
         #     assert provider.__class__.__name__ == class_name
         pass
 
+    def test_repository_is_frozen_and_hashable(self):
+        """Repositories dedupe in sets regardless of metadata."""
+        repo = Repository(name="repo", clone_url="https://example.com/repo.git")
+        assert repo.metadata is None
+        assert repo.meta == {}
+
+        stamped = replace(repo, metadata={"provider_config_name": "work"})
+        assert stamped.meta["provider_config_name"] == "work"
+        assert len({repo, stamped}) == 2  # metadata differs, so not equal
+        assert hash(repo) == hash(stamped)
+
+        with pytest.raises(FrozenInstanceError):
+            repo.name = "other"
+
+    def test_provider_name_is_interned(self):
+        """Repositories from a provider share one interned provider string."""
+        assert GitHubProvider.PROVIDER_NAME is sys.intern("".join(["git", "hub"]))
+
+    def test_repository_from_api_matches_init(self):
+        """The generated fast constructor builds the same frozen record."""
+        kwargs = {
+            "name": "repo",
+            "clone_url": "https://example.com/repo.git",
+            "size": 12,
+            "metadata": {"id": 1},
+        }
+        fast = Repository._from_api(**kwargs)
+        assert fast == Repository(**kwargs)
+        assert fast.default_branch == "main"
+        with pytest.raises(FrozenInstanceError):
+            fast.size = 0
+
+    def test_repository_to_dict_skips_unset_fields(self):
+        """Serialization omits None fields and copies metadata."""
+        metadata = {"full_name": "org/repo"}
+        repo = Repository(
+            name="repo", clone_url="https://example.com/repo.git", metadata=metadata
+        )
+        data = repo.to_dict()
+        assert data["name"] == "repo"
+        assert "description" not in data
+        assert data["metadata"] == metadata
+        assert data["metadata"] is not metadata
+        assert json.loads(repo.to_json_bytes()) == data
+
+    def test_compile_repo_filter(self):
+        """The compiled predicate applies each common filter."""
+        repo = Repository(
+            name="api-service",
+            clone_url="https://example.com/api-service.git",
+            is_private=False,
+            size=500,
+            updated_at="2024-06-01T12:00:00Z",
+            metadata={"language": "Python", "archived": False},
+        )
+        assert compile_repo_filter(None)(repo)
+
+        matching = {
+            "archived": False,
+            "language": "Python",
+            "visibility": "public",
+            "name_pattern": r"^api-",
+            "updated_after": datetime(2024, 1, 1, tzinfo=UTC),
+            "size_max_kb": 1000,
+        }
+        assert compile_repo_filter(matching)(repo)
+
+        for key, value in {
+            "archived": True,
+            "language": "Go",
+            "visibility": "private",
+            "name_pattern": r"^web-",
+            "updated_after": datetime(2025, 1, 1, tzinfo=UTC),
+            "size_max_kb": 100,
+        }.items():
+            assert not compile_repo_filter({**matching, key: value})(repo), key
+
+    def test_dump_repositories(self):
+        """A repository list dumps as a JSON array of to_dict() records."""
+        repos = [
+            Repository(name="a", clone_url="https://example.com/a.git"),
+            Repository(name="b", clone_url="https://example.com/b.git", size=7),
+        ]
+        dumped = json.loads(dump_repositories(iter(repos)))
+        assert dumped == [repo.to_dict() for repo in repos]
+
 
 class TestAzureDevOpsProvider:
     """Test Azure DevOps provider implementation."""
@@ -89,6 +200,31 @@ class TestAzureDevOpsProvider:
         pass
 
 
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response used as a context manager."""
+
+    def __init__(self, status, data=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+    async def json(self):
+        return self._data
+
+    async def _resolve(self):
+        return self
+
+    def __await__(self):
+        # aiohttp's request context managers can also be awaited directly
+        return self._resolve().__await__()
+
+
 class TestGitHubProvider:
     """Test GitHub provider implementation."""
 
@@ -226,6 +362,313 @@ class TestGitHubProvider:
             )
         ]
 
+    @pytest.mark.asyncio
+    async def test_github_count_uses_org_totals_and_etag(self):
+        """Counting reads org totals once, then revalidates with If-None-Match."""
+
+        class FakeSession:
+            closed = False
+
+            def __init__(self):
+                self.request_headers = []
+
+            def get(self, url, headers=None, params=None):
+                assert url == "https://api.github.com/orgs/test-org"
+                self.request_headers.append(dict(headers or {}))
+                if "If-None-Match" in (headers or {}):
+                    return _FakeResponse(304)
+                return _FakeResponse(
+                    200,
+                    {"public_repos": 7, "total_private_repos": 5},
+                    {"ETag": '"abc"'},
+                )
+
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        fake_session = FakeSession()
+        provider._authenticated = True
+        provider._session = fake_session
+
+        assert await provider.count_repositories("test-org") == 12
+        assert await provider.count_repositories("test-org") == 12
+        assert fake_session.request_headers[1]["If-None-Match"] == '"abc"'
+        assert provider._retry_count() == 0  # a 304 is not a failure
+
+    @pytest.mark.asyncio
+    async def test_github_list_fetches_remaining_pages_concurrently(self):
+        """After page 1, pages 2..last are fetched and yielded in page order."""
+        repos_url = "https://api.github.com/orgs/test-org/repos"
+        link = (
+            f'<{repos_url}?per_page=100&page=2>; rel="next", '
+            f'<{repos_url}?per_page=100&page=3>; rel="last"'
+        )
+
+        class FakeSession:
+            closed = False
+
+            def __init__(self):
+                self.pages = []
+
+            def get(self, url, headers=None, params=None):
+                page = params["page"]
+                self.pages.append(page)
+                data = [
+                    {
+                        "id": page,
+                        "name": f"repo-{page}",
+                        "full_name": f"test-org/repo-{page}",
+                        "html_url": f"https://github.com/test-org/repo-{page}",
+                        "clone_url": f"https://github.com/test-org/repo-{page}.git",
+                    }
+                ]
+                return _FakeResponse(200, data, {"Link": link} if page == 1 else {})
+
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        fake_session = FakeSession()
+        provider._authenticated = True
+        provider._session = fake_session
+
+        names = [repo.name async for repo in provider.list_repositories("test-org")]
+        assert names == ["repo-1", "repo-2", "repo-3"]
+        assert sorted(fake_session.pages) == [1, 2, 3]
+
+        # Name-only iteration reads the same rows without building Repository
+        def no_convert(repo_data):
+            raise AssertionError("Repository built for a name-only listing")
+
+        provider._convert_repo_data = no_convert
+        names = [name async for name in provider.iter_repository_names("test-org")]
+        assert names == ["repo-1", "repo-2", "repo-3"]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_cached_shares_requests(self):
+        """Concurrent and repeated lookups hit the API once until the TTL."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        calls = []
+
+        async def get_repository(organization, repository, project=None):
+            calls.append(repository)
+            await asyncio.sleep(0)
+            return Repository(name=repository, clone_url="https://example.com/r.git")
+
+        provider.get_repository = get_repository
+
+        first, second = await asyncio.gather(
+            provider.get_repository_cached("org", "repo"),
+            provider.get_repository_cached("org", "repo"),
+        )
+        assert first is second
+        assert await provider.validate_repository_access("org", "repo")
+        assert calls == ["repo"]
+
+        await provider.get_repository_cached("org", "repo", ttl=0)
+        assert calls == ["repo", "repo"]
+
+    @pytest.mark.asyncio
+    async def test_get_repository_cached_forgets_failures(self):
+        """A failed lookup is retried on the next call."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        calls = []
+
+        async def get_repository(organization, repository, project=None):
+            calls.append(repository)
+            if len(calls) == 1:
+                raise APIError("boom", "github")
+            return None
+
+        provider.get_repository = get_repository
+
+        with pytest.raises(APIError):
+            await provider.get_repository_cached("org", "repo")
+        assert await provider.get_repository_cached("org", "repo") is None
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_beyond_maximum_raises(self):
+        """A reset further away than max_wait_seconds raises a typed error."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        provider._rate_limiter_config["max_wait_seconds"] = 10
+        provider._rate_limit_info = RateLimitInfo(
+            remaining=0, reset=int(time.time()) + 3600
+        )
+
+        with pytest.raises(RateLimitExceededError) as excinfo:
+            await provider._wait_for_rate_limit()
+        assert isinstance(excinfo.value, RateLimitError)
+        assert excinfo.value.max_wait == 10
+        assert excinfo.value.wait_seconds > 3500
+
+    @pytest.mark.asyncio
+    async def test_generic_rate_limit_headers(self):
+        """The base parser accepts either header spelling, defaulting to 0."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        check = GitProvider._check_rate_limit.__get__(provider)
+
+        await check(_FakeResponse(200))
+        assert provider._rate_limit_info is None
+
+        headers = {"X-Rate-Limit-Remaining": "4", "X-RateLimit-Reset": "99"}
+        await check(_FakeResponse(200, headers=headers))
+        assert provider._rate_limit_info == RateLimitInfo(remaining=4, reset=99)
+
+    def test_rate_limiter_config_read_once(self, monkeypatch):
+        """Providers share one read of the rate_limiter global settings."""
+        reads = []
+
+        def get_global_config():
+            reads.append(1)
+            return {"rate_limiter": {"max_wait_seconds": 30}}
+
+        monkeypatch.setattr(
+            "mgit.config.yaml_manager.get_global_config", get_global_config
+        )
+        _cached_rate_limiter_config.cache_clear()
+        try:
+            config = {"url": "https://github.com", "user": "u", "token": "ghp_test"}
+            first = GitHubProvider.from_config(config)
+            second = GitHubProvider.from_config(config)
+        finally:
+            _cached_rate_limiter_config.cache_clear()
+
+        assert len(reads) == 1
+        assert first._rate_limiter_config["max_wait_seconds"] == 30
+        assert first._rate_limiter_config is not second._rate_limiter_config
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_is_capped_by_reset(self, monkeypatch, caplog):
+        """Backoff never sleeps past the reset time (plus jitter)."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        provider._retry_count_attr = 10  # exponential backoff would be huge
+        provider._rate_limit_info = RateLimitInfo(
+            remaining=0, reset=int(time.time()) + 2
+        )
+        slept = []
+
+        async def fake_sleep(seconds):
+            slept.append(seconds)
+
+        monkeypatch.setattr("mgit.providers.base.asyncio.sleep", fake_sleep)
+        await provider._wait_for_rate_limit()
+
+        assert len(slept) == 1
+        assert slept[0] <= 3 + 1.0
+        assert provider._rate_limit_info is None
+        assert "Rate limit: waiting" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_count_sums_projects_for_project_scoped_providers(self):
+        """Organization-wide counts are summed per project when required."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        provider.LISTS_REPOSITORIES_PER_PROJECT = True
+        sizes = {"alpha": 2, "beta": 3}
+
+        async def list_projects(organization):
+            return [Project(name=name, organization=organization) for name in sizes]
+
+        async def count_fast(organization, project=None, filters=None):
+            return None
+
+        async def iter_repository_names(organization, project=None, filters=None):
+            for index in range(sizes.get(project, 0)):
+                yield f"{project}-{index}"
+
+        provider.list_projects = list_projects
+        provider._count_repositories_fast = count_fast
+        provider.iter_repository_names = iter_repository_names
+
+        assert await provider.count_repositories("org") == 5
+        assert await provider.count_repositories("org", "beta") == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("token", "org_data", "expected"),
+        [
+            ("ghp_test", {"public_repos": 4, "total_private_repos": 3}, 7),
+            ("ghp_test", {"public_repos": 4}, None),
+            ("github_pat_test", {"public_repos": 4, "total_private_repos": 3}, None),
+            ("github_pat_test", {"public_repos": 4, "total_private_repos": 0}, 4),
+        ],
+    )
+    async def test_fast_count_only_when_it_matches_listing(
+        self, token, org_data, expected
+    ):
+        """The org profile totals are used only when the listing would agree."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": token}
+        )
+
+        async def authenticate():
+            return True
+
+        async def conditional_request(request_func, *args, cache_key, **kwargs):
+            return 200, org_data
+
+        provider.authenticate = authenticate
+        provider._make_conditional_request = conditional_request
+
+        assert await provider._count_repositories_fast("org") == expected
+
+    @pytest.mark.asyncio
+    async def test_gather_pages_bounds_concurrency(self):
+        """_gather_pages keeps order and never exceeds the concurrency limit."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fetch(page):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return page
+
+        fetchers = [functools.partial(fetch, page) for page in range(10)]
+        assert await provider._gather_pages(fetchers, concurrency=3) == list(range(10))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_page_windows_stay_lazy(self):
+        """_iter_page_windows only fetches the next window when asked for it."""
+        provider = GitHubProvider.from_config(
+            {"url": "https://github.com", "user": "test-user", "token": "ghp_test"}
+        )
+        fetched = []
+
+        async def fetch(page):
+            fetched.append(page)
+            return page
+
+        pages = provider._iter_page_windows(
+            (functools.partial(fetch, page) for page in range(2, 20)), window=5
+        )
+        seen = []
+        async for page in pages:
+            seen.append(page)
+            if len(seen) == 3:
+                break
+        await pages.aclose()
+
+        assert seen == [2, 3, 4]
+        assert sorted(fetched) == [2, 3, 4, 5, 6]
+
 
 class TestBitbucketProvider:
     """Test Bitbucket provider implementation."""
@@ -293,6 +736,34 @@ class TestProviderFactory:
         # assert isinstance(provider, GitHubProvider)
         pass
 
+    def test_providers_imported_lazily(self):
+        """Importing the package must not import provider implementations."""
+        code = (
+            "import sys, mgit.providers; "
+            "assert 'mgit.providers.azdevops' not in sys.modules; "
+            "from mgit.providers import AzureDevOpsProvider; "
+            "assert 'mgit.providers.azdevops' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazy_registration_resolves_class(self):
+        """Factory and registry resolve "module:Class" specs on first use."""
+        from mgit.providers import ProviderFactory, get_provider
+
+        provider = ProviderFactory.create_provider("github", {"token": "ghp_x"})
+        assert isinstance(provider, GitHubProvider)
+        assert isinstance(get_provider("github", {"token": "ghp_x"}), GitHubProvider)
+
+    def test_aliases_share_canonical_registration(self):
+        """Aliases resolve to the single canonical registry entry."""
+        from mgit.providers import ProviderFactory, ProviderRegistry
+
+        assert ProviderFactory.is_registered("azure")
+        assert ProviderFactory.is_registered("AzDevOps")
+        assert "azure" not in ProviderRegistry().list_providers()
+        with pytest.raises(ValueError, match="Unknown provider type"):
+            ProviderFactory.create_provider("gitlab-ce", {})
+
     def test_create_provider_invalid(self):
         """Test creating provider with invalid type."""
 
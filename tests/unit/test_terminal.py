@@ -4,6 +4,8 @@ import os
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 from mgit.ui.terminal import (
     TerminalCaps,
     get_terminal_capabilities,
@@ -18,6 +20,23 @@ from mgit.ui.terminal import (
 class TestTerminalCapabilities:
     """Tests for terminal capability detection."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_detection(self):
+        """Each test patches stdout/env, so bypass the process-wide cache."""
+        get_terminal_capabilities.cache_clear()
+        yield
+        get_terminal_capabilities.cache_clear()
+
+    def test_result_is_cached(self, monkeypatch):
+        """Detection runs once; later calls reuse the result."""
+        mock_stdout = MagicMock()
+        mock_stdout.isatty.return_value = False
+        monkeypatch.setattr(sys, "stdout", mock_stdout)
+
+        assert get_terminal_capabilities() == TerminalCaps.PIPE
+        assert get_terminal_capabilities() == TerminalCaps.PIPE
+        mock_stdout.isatty.assert_called_once()
+
     def test_pipe_detection(self, monkeypatch):
         """Non-TTY stdout should be detected as pipe."""
         mock_stdout = MagicMock()
@@ -201,3 +220,14 @@ class TestCursorControl:
         combined = "".join(output)
         assert "\r" in combined  # Carriage return
         assert "10A" in combined  # Move up 10 lines
+
+    def test_flush_false_defers_flush(self, monkeypatch):
+        """Helpers called with flush=False leave flushing to the caller."""
+        mock_stdout = MagicMock()
+        monkeypatch.setattr(sys, "stdout", mock_stdout)
+
+        hide_cursor(flush=False)
+        move_to_start_of_frame(10, flush=False)
+
+        assert mock_stdout.write.call_count == 2
+        mock_stdout.flush.assert_not_called()
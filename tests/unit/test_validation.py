@@ -0,0 +1,75 @@
+"""
+Unit tests for changeset validation results and issue handling.
+"""
+
+from mgit.pipeline.validation import (
+    ValidationIssue,
+    ValidationLevel,
+    ValidationResult,
+    ValidationSeverity,
+    _collapse_duplicate_issues,
+)
+
+
+def _long_filename_issue(filename, severity=ValidationSeverity.ERROR):
+    return ValidationIssue(
+        severity=severity,
+        code="FILENAME_TOO_LONG",
+        message="Filename exceeds maximum length",
+        field_path="filename",
+        data_context={"filename": filename},
+    )
+
+
+class TestCollapseDuplicateIssues:
+    def test_merged_issue_keeps_every_context(self):
+        issues = [_long_filename_issue(name) for name in ("a", "b", "c")]
+
+        [merged] = _collapse_duplicate_issues(issues)
+        assert merged.data_context["count"] == 3
+        assert [c["filename"] for c in merged.data_context["contexts"]] == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_input_issues_are_not_modified(self):
+        issues = [_long_filename_issue(name) for name in ("a", "b")]
+
+        [merged] = _collapse_duplicate_issues(issues)
+        assert merged is not issues[0]
+        assert issues[0].data_context == {"filename": "a"}
+
+    def test_different_severities_are_not_merged(self):
+        issues = [
+            _long_filename_issue("a"),
+            _long_filename_issue("b", severity=ValidationSeverity.WARNING),
+        ]
+
+        assert _collapse_duplicate_issues(issues) == issues
+
+
+class TestValidationResultCounts:
+    def _result(self, issues):
+        return ValidationResult(
+            is_valid=True,
+            validation_level=ValidationLevel.STANDARD,
+            issues=issues,
+            statistics={},
+        )
+
+    def test_counts_follow_appended_issues(self):
+        result = self._result([])
+        assert not result.has_errors
+
+        result.issues.append(_long_filename_issue("a"))
+        assert result.has_errors
+
+    def test_counts_follow_a_replaced_list_of_the_same_length(self):
+        result = self._result(
+            [_long_filename_issue("a", severity=ValidationSeverity.WARNING)]
+        )
+        assert not result.has_errors
+
+        result.issues = [_long_filename_issue("a")]
+        assert result.has_errors